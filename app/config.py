@@ -463,6 +463,8 @@ class SpotifyConfig:
     free_accept_user_urls: bool
     backfill_max_items: int
     backfill_cache_ttl_seconds: int
+    rate_limit_per_second: float
+    rate_limit_burst: int
 
 
 @dataclass(slots=True)
@@ -494,10 +496,15 @@ class SoulseekConfig:
     retry_jitter_pct: float
     preferred_formats: tuple[str, ...]
     max_results: int
+    search_cache_ttl_seconds: float
+    search_cache_stale_seconds: float
+    search_cache_max_items: int
 
 
 _SUPPORTED_IDEMPOTENCY_BACKENDS = {"memory", "sqlite"}
 DEFAULT_IDEMPOTENCY_BACKEND = "sqlite"
+_SUPPORTED_DEDUPE_LOCK_MODES = {"local", "file"}
+DEFAULT_DEDUPE_LOCK_MODE = "local"
 
 
 @dataclass(slots=True)
@@ -512,6 +519,16 @@ class HdmConfig:
     move_template: str
     idempotency_backend: str = DEFAULT_IDEMPOTENCY_BACKEND
     idempotency_sqlite_path: str = ""
+    io_lock_workers: int = 4
+    io_metadata_workers: int = 4
+    io_copy_workers: int = 2
+    dedupe_lock_mode: str = DEFAULT_DEDUPE_LOCK_MODE
+    dedupe_lock_stripes: int = 64
+    worker_concurrency_min: int = 0
+    worker_concurrency_max: int = 0
+    tag_process_workers: int = 2
+    library_index_enabled: bool = True
+    fast_lane_burst: int = 4
 
     def __post_init__(self) -> None:
         if not self.idempotency_backend:
@@ -561,6 +578,51 @@ class HdmConfig:
             move_template=str(env.get("MOVE_TEMPLATE") or DEFAULT_MOVE_TEMPLATE),
             idempotency_backend=backend,
             idempotency_sqlite_path=sqlite_path,
+            io_lock_workers=_bounded_int(
+                env.get("HDM_IO_LOCK_WORKERS"),
+                default=DEFAULT_HDM_IO_LOCK_WORKERS,
+                minimum=1,
+            ),
+            io_metadata_workers=_bounded_int(
+                env.get("HDM_IO_METADATA_WORKERS"),
+                default=DEFAULT_HDM_IO_METADATA_WORKERS,
+                minimum=1,
+            ),
+            io_copy_workers=_bounded_int(
+                env.get("HDM_IO_COPY_WORKERS"),
+                default=DEFAULT_HDM_IO_COPY_WORKERS,
+                minimum=1,
+            ),
+            dedupe_lock_mode=_parse_dedupe_lock_mode(env.get("HDM_DEDUPE_LOCK_MODE")),
+            dedupe_lock_stripes=_bounded_int(
+                env.get("HDM_DEDUPE_LOCK_STRIPES"),
+                default=DEFAULT_HDM_DEDUPE_LOCK_STRIPES,
+                minimum=1,
+            ),
+            worker_concurrency_min=_bounded_int(
+                env.get("HDM_WORKER_CONCURRENCY_MIN"),
+                default=0,
+                minimum=0,
+            ),
+            worker_concurrency_max=_bounded_int(
+                env.get("HDM_WORKER_CONCURRENCY_MAX"),
+                default=0,
+                minimum=0,
+            ),
+            tag_process_workers=_bounded_int(
+                env.get("HDM_TAG_PROCESS_WORKERS"),
+                default=DEFAULT_HDM_TAG_PROCESS_WORKERS,
+                minimum=0,
+            ),
+            library_index_enabled=_as_bool(
+                env.get("HDM_LIBRARY_INDEX"),
+                default=DEFAULT_HDM_LIBRARY_INDEX,
+            ),
+            fast_lane_burst=_bounded_int(
+                env.get("HDM_FAST_LANE_BURST"),
+                default=DEFAULT_HDM_FAST_LANE_BURST,
+                minimum=1,
+            ),
         )
 
 
@@ -605,6 +667,18 @@ def _parse_idempotency_backend(raw_value: Any) -> str:
     return backend
 
 
+def _parse_dedupe_lock_mode(raw_value: Any) -> str:
+    if raw_value is None:
+        return DEFAULT_DEDUPE_LOCK_MODE
+    mode = str(raw_value).strip().lower()
+    if not mode:
+        return DEFAULT_DEDUPE_LOCK_MODE
+    if mode not in _SUPPORTED_DEDUPE_LOCK_MODES:
+        options = ", ".join(sorted(_SUPPORTED_DEDUPE_LOCK_MODES))
+        raise ValueError(f"HDM_DEDUPE_LOCK_MODE must be one of: {options}")
+    return mode
+
+
 def _resolve_idempotency_sqlite_path(env: Mapping[str, Any], downloads_dir: str) -> str:
     raw_path = env.get("IDEMPOTENCY_SQLITE_PATH")
     if raw_path is None or not str(raw_path).strip():
@@ -656,6 +730,7 @@ class FreeIngestConfig:
     max_playlists: int
     max_tracks: int
     batch_size: int
+    search_concurrency: int
 
 
 @dataclass(slots=True)
@@ -733,11 +808,34 @@ class ArtistSyncConfig:
     hard_delete: bool
 
 
+@dataclass(slots=True, frozen=True)
+class ProviderCacheConfig:
+    enabled: bool
+    path: str | None
+    max_items: int
+    ttl_seconds: dict[str, int]
+    negative_ttl_seconds: int
+    stale_seconds: int
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderResilienceConfig:
+    adaptive_concurrency: bool
+    min_concurrency: int
+    breaker_failure_threshold: int
+    breaker_reset_ms: int
+    breaker_half_open_probes: int
+    hedge_searches: bool
+    hedge_budget_pct: float
+
+
 @dataclass(slots=True)
 class IntegrationsConfig:
     enabled: tuple[str, ...]
     timeouts_ms: dict[str, int]
     max_concurrency: int
+    cache: ProviderCacheConfig
+    resilience: ProviderResilienceConfig
 
 
 @dataclass(slots=True)
@@ -1233,10 +1331,13 @@ DEFAULT_FREE_IMPORT_HARD_CAP_MULTIPLIER = 10
 DEFAULT_FREE_INGEST_MAX_PLAYLISTS = 100
 DEFAULT_FREE_INGEST_MAX_TRACKS = 5_000
 DEFAULT_FREE_INGEST_BATCH_SIZE = 500
+DEFAULT_FREE_INGEST_SEARCH_CONCURRENCY = 4
 DEFAULT_INGEST_BATCH_SIZE = 500
 DEFAULT_INGEST_MAX_PENDING_JOBS = 100
 DEFAULT_BACKFILL_MAX_ITEMS = 2_000
 DEFAULT_BACKFILL_CACHE_TTL = 604_800
+DEFAULT_SPOTIFY_RATE_LIMIT_RPS = 10.0
+DEFAULT_SPOTIFY_RATE_LIMIT_BURST = 10
 DEFAULT_PLAYLIST_SYNC_STALE_AFTER_HOURS = 2.0
 DEFAULT_PLAYLIST_SYNC_STALE_AFTER = timedelta(hours=DEFAULT_PLAYLIST_SYNC_STALE_AFTER_HOURS)
 DEFAULT_API_BASE_PATH = "/api/v1"
@@ -1256,12 +1357,34 @@ DEFAULT_CACHEABLE_PATH_PATTERNS = (
     "^/spotify(?:/(?!status$).*)?$|45|180",
 )
 DEFAULT_PROVIDER_MAX_CONCURRENCY = 4
+DEFAULT_PROVIDER_CACHE_ENABLED = True
+DEFAULT_PROVIDER_CACHE_PATH = str(CONFIG_DIR / "provider_cache.db")
+DEFAULT_PROVIDER_CACHE_MAX_ITEMS = 2_048
+DEFAULT_PROVIDER_CACHE_TTLS: Mapping[str, int] = {
+    "artist": 86_400,
+    "album": 604_800,
+    "artist_albums": 21_600,
+    "album_tracks": 604_800,
+    "playlist_items": 604_800,
+}
+DEFAULT_PROVIDER_CACHE_NEGATIVE_TTL = 3_600
+DEFAULT_PROVIDER_CACHE_STALE = 86_400
+DEFAULT_PROVIDER_ADAPTIVE_CONCURRENCY = True
+DEFAULT_PROVIDER_MIN_CONCURRENCY = 1
+DEFAULT_PROVIDER_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_PROVIDER_BREAKER_RESET_MS = 30_000
+DEFAULT_PROVIDER_BREAKER_HALF_OPEN_PROBES = 1
+DEFAULT_PROVIDER_HEDGE_SEARCHES = False
+DEFAULT_PROVIDER_HEDGE_BUDGET_PCT = 10.0
 DEFAULT_SLSKD_TIMEOUT_MS = 8_000
 DEFAULT_SLSKD_RETRY_MAX = 3
 DEFAULT_SLSKD_RETRY_BACKOFF_BASE_MS = 250
 DEFAULT_SLSKD_RETRY_JITTER_PCT = 20.0
 DEFAULT_SLSKD_PREFERRED_FORMATS = ("FLAC", "ALAC", "APE", "MP3")
 DEFAULT_SLSKD_MAX_RESULTS = 50
+DEFAULT_SLSKD_SEARCH_CACHE_TTL_SEC = 300.0
+DEFAULT_SLSKD_SEARCH_CACHE_STALE_SEC = 900.0
+DEFAULT_SLSKD_SEARCH_CACHE_MAX_ITEMS = 512
 DEFAULT_HEALTH_DB_TIMEOUT_MS = 500
 DEFAULT_HEALTH_DEP_TIMEOUT_MS = 800
 DEFAULT_WATCHLIST_MAX_CONCURRENCY = 3
@@ -1306,6 +1429,13 @@ DEFAULT_DOWNLOAD_BATCH_MAX_ITEMS = 2_000
 DEFAULT_SIZE_STABLE_SECONDS = 30
 DEFAULT_DOWNLOAD_MAX_RETRIES = 5
 DEFAULT_SLSKD_TIMEOUT_SEC = 300
+DEFAULT_HDM_IO_LOCK_WORKERS = 4
+DEFAULT_HDM_IO_METADATA_WORKERS = 4
+DEFAULT_HDM_IO_COPY_WORKERS = 2
+DEFAULT_HDM_DEDUPE_LOCK_STRIPES = 64
+DEFAULT_HDM_TAG_PROCESS_WORKERS = 2
+DEFAULT_HDM_LIBRARY_INDEX = True
+DEFAULT_HDM_FAST_LANE_BURST = 4
 DEFAULT_MOVE_TEMPLATE = (
     f"{DEFAULT_MUSIC_DIR}/{{Artist}}/{{Year}} - {{Album}}/{{Track:02d}} {{Title}}.{{ext}}"
 )
@@ -1538,6 +1668,16 @@ _CONFIG_TEMPLATE_SECTIONS: tuple[ConfigTemplateSection, ...] = (
                 15_000,
                 "Spotify API timeout in milliseconds.",
             ),
+            ConfigTemplateEntry(
+                "SPOTIFY_RATE_LIMIT_RPS",
+                DEFAULT_SPOTIFY_RATE_LIMIT_RPS,
+                "Sustained Spotify Web API requests per second (async client).",
+            ),
+            ConfigTemplateEntry(
+                "SPOTIFY_RATE_LIMIT_BURST",
+                DEFAULT_SPOTIFY_RATE_LIMIT_BURST,
+                "Spotify requests allowed in a burst above the sustained rate.",
+            ),
             ConfigTemplateEntry(
                 "FREE_IMPORT_MAX_LINES",
                 DEFAULT_FREE_IMPORT_MAX_LINES,
@@ -1578,6 +1718,11 @@ _CONFIG_TEMPLATE_SECTIONS: tuple[ConfigTemplateSection, ...] = (
                 DEFAULT_FREE_INGEST_MAX_TRACKS,
                 "Hard limit for tracks per request.",
             ),
+            ConfigTemplateEntry(
+                "FREE_SEARCH_CONCURRENCY",
+                DEFAULT_FREE_INGEST_SEARCH_CONCURRENCY,
+                "Parallel Soulseek searches while queueing free ingest tracks.",
+            ),
             ConfigTemplateEntry(
                 "BACKFILL_MAX_ITEMS",
                 DEFAULT_BACKFILL_MAX_ITEMS,
@@ -1686,6 +1831,21 @@ _CONFIG_TEMPLATE_SECTIONS: tuple[ConfigTemplateSection, ...] = (
                 DEFAULT_SLSKD_MAX_RESULTS,
                 "Maximum Soulseek search results returned.",
             ),
+            ConfigTemplateEntry(
+                "SLSKD_SEARCH_CACHE_TTL_SEC",
+                DEFAULT_SLSKD_SEARCH_CACHE_TTL_SEC,
+                "Cache TTL for identical Soulseek searches (0 disables).",
+            ),
+            ConfigTemplateEntry(
+                "SLSKD_SEARCH_CACHE_STALE_SEC",
+                DEFAULT_SLSKD_SEARCH_CACHE_STALE_SEC,
+                "Grace window for callers that accept stale search results.",
+            ),
+            ConfigTemplateEntry(
+                "SLSKD_SEARCH_CACHE_MAX_ITEMS",
+                DEFAULT_SLSKD_SEARCH_CACHE_MAX_ITEMS,
+                "Maximum cached Soulseek searches (LRU eviction).",
+            ),
             ConfigTemplateEntry("MUSIXMATCH_API_KEY", "", "Optional Musixmatch API key."),
         ),
     ),
@@ -1718,6 +1878,71 @@ _CONFIG_TEMPLATE_SECTIONS: tuple[ConfigTemplateSection, ...] = (
                 DEFAULT_PROVIDER_MAX_CONCURRENCY,
                 "Maximum concurrency for provider calls.",
             ),
+            ConfigTemplateEntry(
+                "PROVIDER_ADAPTIVE_CONCURRENCY",
+                DEFAULT_PROVIDER_ADAPTIVE_CONCURRENCY,
+                "Shrink a provider's concurrency when its latency or error rate rises.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_MIN_CONCURRENCY",
+                DEFAULT_PROVIDER_MIN_CONCURRENCY,
+                "Lower bound for adaptive per-provider concurrency.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_BREAKER_FAILURE_THRESHOLD",
+                DEFAULT_PROVIDER_BREAKER_FAILURE_THRESHOLD,
+                "Consecutive provider failures that open its circuit breaker.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_BREAKER_RESET_MS",
+                DEFAULT_PROVIDER_BREAKER_RESET_MS,
+                "Time an open breaker fails fast before probing again (ms).",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_BREAKER_HALF_OPEN_PROBES",
+                DEFAULT_PROVIDER_BREAKER_HALF_OPEN_PROBES,
+                "Concurrent probe calls allowed while a breaker is half-open.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_HEDGE_SEARCHES",
+                DEFAULT_PROVIDER_HEDGE_SEARCHES,
+                "Send a second search when a provider is slower than its p95.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_HEDGE_BUDGET_PCT",
+                DEFAULT_PROVIDER_HEDGE_BUDGET_PCT,
+                "Maximum share of search calls that may be hedged (percent).",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_CACHE_ENABLED",
+                DEFAULT_PROVIDER_CACHE_ENABLED,
+                "Cache provider artist/album lookups in memory and SQLite.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_CACHE_PATH",
+                DEFAULT_PROVIDER_CACHE_PATH,
+                "SQLite file for the provider cache (empty keeps it in memory).",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_CACHE_MAX_ITEMS",
+                DEFAULT_PROVIDER_CACHE_MAX_ITEMS,
+                "Entries kept in the in-memory provider cache tier.",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_CACHE_TTLS",
+                ",".join(f"{key}={value}" for key, value in DEFAULT_PROVIDER_CACHE_TTLS.items()),
+                "Per-operation provider cache TTLs (operation=seconds).",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_CACHE_NEGATIVE_TTL_SEC",
+                DEFAULT_PROVIDER_CACHE_NEGATIVE_TTL,
+                "TTL for cached not-found provider lookups (seconds).",
+            ),
+            ConfigTemplateEntry(
+                "PROVIDER_CACHE_STALE_SEC",
+                DEFAULT_PROVIDER_CACHE_STALE,
+                "Window after expiry in which stale entries are served while refreshing.",
+            ),
         ),
     ),
     ConfigTemplateSection(
@@ -1876,6 +2101,56 @@ _CONFIG_TEMPLATE_SECTIONS: tuple[ConfigTemplateSection, ...] = (
                 DEFAULT_SLSKD_TIMEOUT_SEC,
                 "Timeout for Soulseek transfers (seconds).",
             ),
+            ConfigTemplateEntry(
+                "HDM_IO_LOCK_WORKERS",
+                DEFAULT_HDM_IO_LOCK_WORKERS,
+                "Threads reserved for HDM dedupe locking.",
+            ),
+            ConfigTemplateEntry(
+                "HDM_IO_METADATA_WORKERS",
+                DEFAULT_HDM_IO_METADATA_WORKERS,
+                "Threads reserved for HDM metadata, sidecar and tagging I/O.",
+            ),
+            ConfigTemplateEntry(
+                "HDM_IO_COPY_WORKERS",
+                DEFAULT_HDM_IO_COPY_WORKERS,
+                "Threads reserved for HDM file moves and copies.",
+            ),
+            ConfigTemplateEntry(
+                "HDM_DEDUPE_LOCK_MODE",
+                DEFAULT_DEDUPE_LOCK_MODE,
+                "Dedupe locking: 'local' (in-process) or 'file' (cross-process stripes).",
+            ),
+            ConfigTemplateEntry(
+                "HDM_DEDUPE_LOCK_STRIPES",
+                DEFAULT_HDM_DEDUPE_LOCK_STRIPES,
+                "Number of lock-file stripes used in 'file' dedupe lock mode.",
+            ),
+            ConfigTemplateEntry(
+                "HDM_WORKER_CONCURRENCY_MIN",
+                0,
+                "Lower bound for adaptive HDM concurrency (0 = WORKER_CONCURRENCY).",
+            ),
+            ConfigTemplateEntry(
+                "HDM_WORKER_CONCURRENCY_MAX",
+                0,
+                "Upper bound for adaptive HDM concurrency (0 = fixed WORKER_CONCURRENCY).",
+            ),
+            ConfigTemplateEntry(
+                "HDM_TAG_PROCESS_WORKERS",
+                DEFAULT_HDM_TAG_PROCESS_WORKERS,
+                "Processes used to tag FLAC/MP4 files (0 = tag on threads).",
+            ),
+            ConfigTemplateEntry(
+                "HDM_LIBRARY_INDEX",
+                DEFAULT_HDM_LIBRARY_INDEX,
+                "Skip downloads whose artist/title/length already exist in the library.",
+            ),
+            ConfigTemplateEntry(
+                "HDM_FAST_LANE_BURST",
+                DEFAULT_HDM_FAST_LANE_BURST,
+                "Fast-lane (single-item) downloads served before one bulk item gets a turn.",
+            ),
         ),
     ),
     ConfigTemplateSection(
@@ -2318,6 +2593,108 @@ def _parse_provider_timeouts(env: Mapping[str, str | None]) -> dict[str, int]:
     return defaults
 
 
+def _parse_provider_cache_ttls(value: str | None) -> dict[str, int]:
+    ttls = dict(DEFAULT_PROVIDER_CACHE_TTLS)
+    for entry in _parse_list(value):
+        operation, _, raw_ttl = entry.partition("=")
+        operation = operation.strip().lower()
+        if not operation:
+            continue
+        try:
+            ttls[operation] = max(0, int(raw_ttl))
+        except (TypeError, ValueError):
+            continue
+    return ttls
+
+
+def _load_provider_cache_config(env: Mapping[str, Any]) -> ProviderCacheConfig:
+    raw_path = _env_value(env, "PROVIDER_CACHE_PATH")
+    if raw_path is None:
+        path: str | None = DEFAULT_PROVIDER_CACHE_PATH
+    else:
+        path = str(Path(raw_path.strip()).expanduser()) if raw_path.strip() else None
+    return ProviderCacheConfig(
+        enabled=_as_bool(
+            _env_value(env, "PROVIDER_CACHE_ENABLED"),
+            default=DEFAULT_PROVIDER_CACHE_ENABLED,
+        ),
+        path=path,
+        max_items=max(
+            1,
+            _as_int(
+                _env_value(env, "PROVIDER_CACHE_MAX_ITEMS"),
+                default=DEFAULT_PROVIDER_CACHE_MAX_ITEMS,
+            ),
+        ),
+        ttl_seconds=_parse_provider_cache_ttls(_env_value(env, "PROVIDER_CACHE_TTLS")),
+        negative_ttl_seconds=max(
+            0,
+            _as_int(
+                _env_value(env, "PROVIDER_CACHE_NEGATIVE_TTL_SEC"),
+                default=DEFAULT_PROVIDER_CACHE_NEGATIVE_TTL,
+            ),
+        ),
+        stale_seconds=max(
+            0,
+            _as_int(
+                _env_value(env, "PROVIDER_CACHE_STALE_SEC"),
+                default=DEFAULT_PROVIDER_CACHE_STALE,
+            ),
+        ),
+    )
+
+
+def _load_provider_resilience_config(env: Mapping[str, Any]) -> ProviderResilienceConfig:
+    return ProviderResilienceConfig(
+        adaptive_concurrency=_as_bool(
+            _env_value(env, "PROVIDER_ADAPTIVE_CONCURRENCY"),
+            default=DEFAULT_PROVIDER_ADAPTIVE_CONCURRENCY,
+        ),
+        min_concurrency=max(
+            1,
+            _as_int(
+                _env_value(env, "PROVIDER_MIN_CONCURRENCY"),
+                default=DEFAULT_PROVIDER_MIN_CONCURRENCY,
+            ),
+        ),
+        breaker_failure_threshold=max(
+            1,
+            _as_int(
+                _env_value(env, "PROVIDER_BREAKER_FAILURE_THRESHOLD"),
+                default=DEFAULT_PROVIDER_BREAKER_FAILURE_THRESHOLD,
+            ),
+        ),
+        breaker_reset_ms=max(
+            100,
+            _as_int(
+                _env_value(env, "PROVIDER_BREAKER_RESET_MS"),
+                default=DEFAULT_PROVIDER_BREAKER_RESET_MS,
+            ),
+        ),
+        breaker_half_open_probes=max(
+            1,
+            _as_int(
+                _env_value(env, "PROVIDER_BREAKER_HALF_OPEN_PROBES"),
+                default=DEFAULT_PROVIDER_BREAKER_HALF_OPEN_PROBES,
+            ),
+        ),
+        hedge_searches=_as_bool(
+            _env_value(env, "PROVIDER_HEDGE_SEARCHES"),
+            default=DEFAULT_PROVIDER_HEDGE_SEARCHES,
+        ),
+        hedge_budget_pct=min(
+            100.0,
+            max(
+                0.0,
+                _as_float(
+                    _env_value(env, "PROVIDER_HEDGE_BUDGET_PCT"),
+                    default=DEFAULT_PROVIDER_HEDGE_BUDGET_PCT,
+                ),
+            ),
+        ),
+    )
+
+
 def _parse_jitter_value(value: Any, *, default_pct: float) -> float:
     resolved = default_pct
     if value is not None:
@@ -2869,6 +3246,20 @@ def load_config(runtime_env: Mapping[str, Any] | None = None) -> AppConfig:
                 default=DEFAULT_BACKFILL_CACHE_TTL,
             ),
         ),
+        rate_limit_per_second=max(
+            0.1,
+            _as_float(
+                _env_value(env, "SPOTIFY_RATE_LIMIT_RPS"),
+                default=DEFAULT_SPOTIFY_RATE_LIMIT_RPS,
+            ),
+        ),
+        rate_limit_burst=max(
+            1,
+            _as_int(
+                _env_value(env, "SPOTIFY_RATE_LIMIT_BURST"),
+                default=DEFAULT_SPOTIFY_RATE_LIMIT_BURST,
+            ),
+        ),
     )
     if not (spotify.redirect_uri or "").strip():
         spotify.redirect_uri = oauth_redirect_uri
@@ -2915,6 +3306,27 @@ def load_config(runtime_env: Mapping[str, Any] | None = None) -> AppConfig:
             default=DEFAULT_SLSKD_MAX_RESULTS,
         ),
     )
+    search_cache_ttl_seconds = max(
+        0.0,
+        _as_float(
+            _env_value(env, "SLSKD_SEARCH_CACHE_TTL_SEC"),
+            default=DEFAULT_SLSKD_SEARCH_CACHE_TTL_SEC,
+        ),
+    )
+    search_cache_stale_seconds = max(
+        0.0,
+        _as_float(
+            _env_value(env, "SLSKD_SEARCH_CACHE_STALE_SEC"),
+            default=DEFAULT_SLSKD_SEARCH_CACHE_STALE_SEC,
+        ),
+    )
+    search_cache_max_items = max(
+        1,
+        _as_int(
+            _env_value(env, "SLSKD_SEARCH_CACHE_MAX_ITEMS"),
+            default=DEFAULT_SLSKD_SEARCH_CACHE_MAX_ITEMS,
+        ),
+    )
     soulseek = SoulseekConfig(
         base_url=_resolve_setting(
             "SLSKD_URL",
@@ -2933,6 +3345,9 @@ def load_config(runtime_env: Mapping[str, Any] | None = None) -> AppConfig:
         retry_jitter_pct=retry_jitter_pct,
         preferred_formats=preferred_formats,
         max_results=max_results,
+        search_cache_ttl_seconds=search_cache_ttl_seconds,
+        search_cache_stale_seconds=search_cache_stale_seconds,
+        search_cache_max_items=search_cache_max_items,
     )
 
     logging = LoggingConfig(level=_env_value(env, "HARMONY_LOG_LEVEL") or "INFO")
@@ -3028,6 +3443,13 @@ def load_config(runtime_env: Mapping[str, Any] | None = None) -> AppConfig:
                 default=DEFAULT_FREE_INGEST_BATCH_SIZE,
             ),
         ),
+        search_concurrency=max(
+            1,
+            _as_int(
+                _env_value(env, "FREE_SEARCH_CONCURRENCY"),
+                default=DEFAULT_FREE_INGEST_SEARCH_CONCURRENCY,
+            ),
+        ),
     )
 
     stale_after_hours = _bounded_float(
@@ -3089,6 +3511,8 @@ def load_config(runtime_env: Mapping[str, Any] | None = None) -> AppConfig:
                 default=DEFAULT_PROVIDER_MAX_CONCURRENCY,
             ),
         ),
+        cache=_load_provider_cache_config(env),
+        resilience=_load_provider_resilience_config(env),
     )
 
     health = HealthConfig(
@@ -35,7 +35,9 @@ _CONFIG_EXPORT_NAMES: tuple[str, ...] = (
     "HealthConfig",
     "MatchingConfig",
     "OrchestratorConfig",
+    "ProviderCacheConfig",
     "ProviderProfile",
+    "ProviderResilienceConfig",
     "RateLimitMiddlewareConfig",
     "SecurityConfig",
     "Settings",
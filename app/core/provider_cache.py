@@ -0,0 +1,460 @@
+"""Tiered cache for provider metadata lookups (memory LRU + SQLite)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from app.logging import get_logger
+from app.utils.metrics import counter
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from app.config import ProviderCacheConfig
+
+logger = get_logger(__name__)
+
+SQLITE_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS provider_cache (
+    key TEXT PRIMARY KEY,
+    payload TEXT,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL
+)
+"""
+
+SQLITE_SELECT = "SELECT payload, expires_at, stale_until FROM provider_cache WHERE key = ?"
+
+SQLITE_UPSERT = """
+INSERT OR REPLACE INTO provider_cache (key, payload, expires_at, stale_until)
+VALUES (?, ?, ?, ?)
+"""
+
+SQLITE_DELETE = "DELETE FROM provider_cache WHERE key = ?"
+
+SQLITE_PURGE = "DELETE FROM provider_cache WHERE stale_until < ?"
+
+_PURGE_EVERY_WRITES = 256
+
+_LOOKUPS: Any
+
+
+def register_metrics() -> None:
+    global _LOOKUPS
+
+    _LOOKUPS = counter(
+        "provider_cache_lookups_total",
+        "Provider cache lookups grouped by operation and result",
+        label_names=("operation", "result"),
+    )
+
+
+register_metrics()
+
+
+NotFoundPredicate = Callable[[BaseException], bool]
+
+
+@dataclass(slots=True, frozen=True)
+class _Entry:
+    # ``payload`` is the JSON text of the cached value; ``None`` marks a
+    # cached not-found answer.
+    payload: str | None
+    expires_at: float
+    stale_until: float
+
+
+def _entry_size(entry: _Entry) -> int:
+    return len(entry.payload) if entry.payload is not None else 0
+
+
+class ProviderCache:
+    """Cache provider responses in an in-memory LRU backed by SQLite.
+
+    Values are stored as JSON, so every caller receives its own copy. Each
+    operation has its own TTL; lookups the provider answered with "not
+    found" are remembered for ``negative_ttl`` seconds. Within
+    ``stale_seconds`` after expiry an entry is still served while a
+    background thread refreshes it. The SQLite tier is optional and fails
+    open: if the file cannot be used the cache keeps working in memory.
+    ``max_bytes`` additionally bounds the memory tier by the size of the
+    cached JSON; a value larger than ``max_entry_bytes`` is not cached.
+
+    :meth:`get_or_load` is synchronous and thread-safe for clients running
+    in worker threads; :meth:`aget_or_load` takes a coroutine loader and
+    refreshes stale entries as event-loop tasks. Both share the same entries.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | Path | None = None,
+        max_items: int = 2_048,
+        max_bytes: int | None = None,
+        max_entry_bytes: int | None = None,
+        ttl_seconds: Mapping[str, float] | None = None,
+        default_ttl: float = 3_600.0,
+        negative_ttl: float = 3_600.0,
+        stale_seconds: float = 86_400.0,
+        refresh_workers: int = 2,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+        self._path = Path(path).expanduser() if path else None
+        self._max_items = int(max_items)
+        self._max_bytes = int(max_bytes) if max_bytes else None
+        self._max_entry_bytes = int(max_entry_bytes) if max_entry_bytes else None
+        if self._max_bytes is not None and (
+            self._max_entry_bytes is None or self._max_entry_bytes > self._max_bytes
+        ):
+            self._max_entry_bytes = self._max_bytes
+        self._ttls = {
+            operation.lower(): max(0.0, float(ttl))
+            for operation, ttl in (ttl_seconds or {}).items()
+        }
+        self._default_ttl = max(0.0, float(default_ttl))
+        self._negative_ttl = max(0.0, float(negative_ttl))
+        self._stale_seconds = max(0.0, float(stale_seconds))
+        self._clock = clock
+        self._memory: OrderedDict[str, _Entry] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._db_failed = self._path is None
+        self._writes = 0
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=max(1, int(refresh_workers)),
+            thread_name_prefix="provider-cache",
+        )
+
+    def get_or_load(
+        self,
+        operation: str,
+        key: str,
+        loader: Callable[[], Any],
+        *,
+        is_not_found: NotFoundPredicate | None = None,
+        allow_stale: bool = True,
+    ) -> Any:
+        """Return the cached value for ``operation``/``key`` or call *loader*.
+
+        A cached not-found answer is returned as ``None``. Exceptions raised
+        by *loader* propagate unless *is_not_found* classifies them as a
+        missing resource, in which case ``None`` is cached and returned.
+        With ``allow_stale=False`` an expired entry counts as a miss.
+        """
+
+        cache_key = f"{operation}:{key}"
+        entry, state = self._lookup_state(cache_key)
+        if entry is not None and state == "hit":
+            return self._serve(operation, entry, "hit")
+        if entry is not None and state == "stale" and allow_stale:
+            self._schedule_refresh(operation, cache_key, loader, is_not_found)
+            return self._serve(operation, entry, "stale")
+        _LOOKUPS.labels(operation=operation, result="miss").inc()
+        return self._load(operation, cache_key, loader, is_not_found)
+
+    async def aget_or_load(
+        self,
+        operation: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        is_not_found: NotFoundPredicate | None = None,
+        allow_stale: bool = True,
+    ) -> Any:
+        """Async variant of :meth:`get_or_load` for coroutine loaders."""
+
+        cache_key = f"{operation}:{key}"
+        entry, state = self._lookup_state(cache_key)
+        if entry is not None and state == "hit":
+            return self._serve(operation, entry, "hit")
+        if entry is not None and state == "stale" and allow_stale:
+            self._schedule_async_refresh(operation, cache_key, loader, is_not_found)
+            return self._serve(operation, entry, "stale")
+        _LOOKUPS.labels(operation=operation, result="miss").inc()
+        return await self._aload(operation, cache_key, loader, is_not_found)
+
+    def put(self, operation: str, key: str, value: Any) -> None:
+        """Store *value* fetched by other means (e.g. a batch endpoint)."""
+
+        self._store(operation, f"{operation}:{key}", value)
+
+    def invalidate(self, operation: str, key: str) -> None:
+        cache_key = f"{operation}:{key}"
+        with self._lock:
+            self._forget(cache_key)
+        self._db_execute(SQLITE_DELETE, (cache_key,))
+
+    def close(self) -> None:
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _serve(self, operation: str, entry: _Entry, result: str) -> Any:
+        if entry.payload is None:
+            _LOOKUPS.labels(operation=operation, result="negative").inc()
+            return None
+        _LOOKUPS.labels(operation=operation, result=result).inc()
+        return json.loads(entry.payload)
+
+    def _load(
+        self,
+        operation: str,
+        cache_key: str,
+        loader: Callable[[], Any],
+        is_not_found: NotFoundPredicate | None,
+    ) -> Any:
+        try:
+            value = loader()
+        except Exception as exc:
+            if is_not_found is None or not is_not_found(exc):
+                raise
+            value = None
+        self._store(operation, cache_key, value)
+        return value
+
+    async def _aload(
+        self,
+        operation: str,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Any]],
+        is_not_found: NotFoundPredicate | None,
+    ) -> Any:
+        try:
+            value = await loader()
+        except Exception as exc:
+            if is_not_found is None or not is_not_found(exc):
+                raise
+            value = None
+        self._store(operation, cache_key, value)
+        return value
+
+    def _store(self, operation: str, cache_key: str, value: Any) -> None:
+        if value is None:
+            payload = None
+            ttl = self._negative_ttl
+        else:
+            try:
+                payload = json.dumps(value, separators=(",", ":"))
+            except (TypeError, ValueError):
+                logger.debug("Provider cache skipped a non-JSON value for %s", cache_key)
+                return
+            if self._max_entry_bytes is not None and len(payload) > self._max_entry_bytes:
+                logger.debug("Provider cache skipped an oversized value for %s", cache_key)
+                with self._lock:
+                    self._forget(cache_key)
+                self._db_execute(SQLITE_DELETE, (cache_key,))
+                return
+            ttl = self._ttls.get(operation.lower(), self._default_ttl)
+        if ttl <= 0:
+            return
+        now = self._clock()
+        # Negative answers are not served stale: a resource that appears
+        # should be picked up as soon as the negative TTL runs out.
+        stale = self._stale_seconds if payload is not None else 0.0
+        entry = _Entry(payload=payload, expires_at=now + ttl, stale_until=now + ttl + stale)
+        self._remember(cache_key, entry)
+        self._db_execute(
+            SQLITE_UPSERT, (cache_key, entry.payload, entry.expires_at, entry.stale_until)
+        )
+
+    def _lookup_state(self, cache_key: str) -> tuple[_Entry | None, str | None]:
+        entry = self._lookup(cache_key)
+        if entry is None:
+            return None, None
+        now = self._clock()
+        if now < entry.expires_at:
+            return entry, "hit"
+        if now < entry.stale_until:
+            return entry, "stale"
+        return entry, None
+
+    def _lookup(self, cache_key: str) -> _Entry | None:
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                self._memory.move_to_end(cache_key)
+                return entry
+        row = self._db_fetch(cache_key)
+        if row is None:
+            return None
+        entry = _Entry(payload=row[0], expires_at=float(row[1]), stale_until=float(row[2]))
+        if self._clock() >= entry.stale_until:
+            return None
+        self._remember(cache_key, entry)
+        return entry
+
+    def _remember(self, cache_key: str, entry: _Entry) -> None:
+        with self._lock:
+            self._forget(cache_key)
+            self._memory[cache_key] = entry
+            self._memory_bytes += _entry_size(entry)
+            while len(self._memory) > self._max_items or (
+                self._max_bytes is not None and self._memory_bytes > self._max_bytes
+            ):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= _entry_size(evicted)
+
+    def _forget(self, cache_key: str) -> None:
+        # Callers hold ``self._lock``.
+        entry = self._memory.pop(cache_key, None)
+        if entry is not None:
+            self._memory_bytes -= _entry_size(entry)
+
+    def _schedule_refresh(
+        self,
+        operation: str,
+        cache_key: str,
+        loader: Callable[[], Any],
+        is_not_found: NotFoundPredicate | None,
+    ) -> None:
+        with self._lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def _refresh() -> None:
+            try:
+                self._load(operation, cache_key, loader, is_not_found)
+            except Exception:
+                logger.debug("Provider cache refresh failed for %s", cache_key, exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(cache_key)
+
+        try:
+            self._refresh_executor.submit(_refresh)
+        except RuntimeError:  # pragma: no cover - cache closed
+            with self._lock:
+                self._refreshing.discard(cache_key)
+
+    def _schedule_async_refresh(
+        self,
+        operation: str,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Any]],
+        is_not_found: NotFoundPredicate | None,
+    ) -> None:
+        with self._lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        async def _refresh() -> None:
+            try:
+                await self._aload(operation, cache_key, loader, is_not_found)
+            except Exception:
+                logger.debug("Provider cache refresh failed for %s", cache_key, exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(cache_key)
+
+        task = asyncio.get_running_loop().create_task(_refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def _db_fetch(self, cache_key: str) -> tuple[Any, ...] | None:
+        if self._db_failed:
+            return None
+        with self._db_lock:
+            connection = self._db_connection()
+            if connection is None:
+                return None
+            try:
+                return connection.execute(SQLITE_SELECT, (cache_key,)).fetchone()
+            except sqlite3.Error:
+                self._disable_db()
+                return None
+
+    def _db_execute(self, statement: str, params: tuple[Any, ...]) -> None:
+        if self._db_failed:
+            return
+        with self._db_lock:
+            connection = self._db_connection()
+            if connection is None:
+                return
+            try:
+                connection.execute(statement, params)
+                self._writes += 1
+                if self._writes % _PURGE_EVERY_WRITES == 0:
+                    connection.execute(SQLITE_PURGE, (self._clock(),))
+                connection.commit()
+            except sqlite3.Error:
+                self._disable_db()
+
+    def _db_connection(self) -> sqlite3.Connection | None:
+        if self._connection is not None:
+            return self._connection
+        assert self._path is not None
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=1.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SQLITE_CREATE_TABLE)
+            connection.commit()
+        except (OSError, sqlite3.Error):
+            self._disable_db()
+            return None
+        self._connection = connection
+        return connection
+
+    def _disable_db(self) -> None:
+        # Called with ``_db_lock`` held.
+        logger.warning(
+            "Provider cache SQLite tier disabled; continuing in memory",
+            extra={"event": "provider_cache.sqlite_disabled", "path": str(self._path)},
+            exc_info=True,
+        )
+        self._db_failed = True
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:  # pragma: no cover - defensive guard
+                pass
+            self._connection = None
+
+
+_SHARED: dict[str | None, ProviderCache] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_provider_cache(config: ProviderCacheConfig) -> ProviderCache | None:
+    """Return the process-wide cache for *config*, or ``None`` when disabled.
+
+    Clients built from the same configuration share one instance so the
+    memory tier is not duplicated per client.
+    """
+
+    if not config.enabled:
+        return None
+    with _SHARED_LOCK:
+        cache = _SHARED.get(config.path)
+        if cache is None:
+            cache = ProviderCache(
+                path=config.path,
+                max_items=config.max_items,
+                ttl_seconds=config.ttl_seconds,
+                negative_ttl=config.negative_ttl_seconds,
+                stale_seconds=config.stale_seconds,
+            )
+            _SHARED[config.path] = cache
+        return cache
+
+
+__all__ = ["ProviderCache", "shared_provider_cache"]
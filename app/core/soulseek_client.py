@@ -13,6 +13,12 @@ from typing import Any
 import aiohttp
 
 from app.config import SoulseekConfig
+from app.core.provider_cache import ProviderCache
+from app.core.soulseek_search_cache import (
+    SEARCH_OPERATION,
+    build_search_key,
+    shared_search_cache,
+)
 from app.logging import get_logger
 from app.utils.retry import RetryDirective, with_retry
 
@@ -42,8 +48,11 @@ class SoulseekClient:
         self,
         config: SoulseekConfig,
         session: aiohttp.ClientSession | None = None,
+        *,
+        search_cache: ProviderCache | None = None,
     ) -> None:
         self._config = config
+        self._search_cache = search_cache or shared_search_cache(config)
         self._session = session
         self._session_owner = session is None
         self._timestamps: deque[float] = deque(maxlen=self.RATE_LIMIT_COUNT)
@@ -178,7 +187,14 @@ class SoulseekClient:
         min_bitrate: int | None = None,
         format_priority: Sequence[str] | None = None,
         max_results: int | None = None,
+        allow_stale: bool = False,
     ) -> dict[str, Any]:
+        """Run a search, reusing a cached response for an equivalent query.
+
+        With ``allow_stale`` an expired entry inside the cache's stale window
+        is returned immediately and refreshed in the background.
+        """
+
         payload: dict[str, Any] = {"searchText": query, "filterResponses": True}
         if min_bitrate is not None:
             payload["minBitrate"] = int(min_bitrate)
@@ -188,10 +204,9 @@ class SoulseekClient:
             if format_priority is not None
             else tuple(self._config.preferred_formats)
         )
-        if preferred_formats:
-            resolved_formats = [str(item) for item in preferred_formats if item]
-            if resolved_formats:
-                payload["preferredFormats"] = resolved_formats
+        resolved_formats = [str(item) for item in preferred_formats if item]
+        if resolved_formats:
+            payload["preferredFormats"] = resolved_formats
 
         if max_results is not None:
             try:
@@ -209,7 +224,22 @@ class SoulseekClient:
         if limit_value is not None and limit_value > 0:
             payload["maxResults"] = limit_value
 
-        return await self._request("POST", "searches", json=payload)
+        cache = self._search_cache
+        if cache is None:
+            return await self._request("POST", "searches", json=payload)
+
+        cache_key = build_search_key(
+            query,
+            min_bitrate=payload.get("minBitrate"),
+            format_priority=resolved_formats,
+            max_results=payload.get("maxResults"),
+        )
+        return await cache.aget_or_load(
+            SEARCH_OPERATION,
+            cache_key,
+            lambda: self._request("POST", "searches", json=payload),
+            allow_stale=allow_stale,
+        )
 
     async def download(self, payload: dict[str, Any]) -> dict[str, Any]:
         username = payload.get("username")
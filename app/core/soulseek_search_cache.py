@@ -0,0 +1,98 @@
+"""Search-result cache for slskd built on :class:`ProviderCache`."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import threading
+import time
+import unicodedata
+from typing import TYPE_CHECKING
+
+from app.core.provider_cache import ProviderCache
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from app.config import SoulseekConfig
+
+SEARCH_OPERATION = "soulseek_search"
+# Popular queries can return responses of many megabytes; those are not
+# worth holding, and the cache as a whole stays within a fixed budget.
+DEFAULT_SEARCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SEARCH_CACHE_MAX_ENTRY_BYTES = 2 * 1024 * 1024
+
+
+def build_search_key(
+    query: str,
+    *,
+    min_bitrate: int | None,
+    format_priority: Sequence[str],
+    max_results: int | None,
+) -> str:
+    """Return the cache key for a search request.
+
+    The query is case-folded and whitespace-collapsed so trivially
+    different spellings of the same search share one entry. Format
+    order is kept because it changes the ranking slskd applies.
+    """
+
+    normalised = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+    formats = ",".join(str(item).lower() for item in format_priority)
+    return f"{normalised}|{min_bitrate or 0}|{formats}|{max_results or 0}"
+
+
+def build_search_cache(
+    *,
+    ttl_seconds: float,
+    stale_seconds: float = 0.0,
+    max_items: int = 512,
+    max_bytes: int = DEFAULT_SEARCH_CACHE_MAX_BYTES,
+    max_entry_bytes: int = DEFAULT_SEARCH_CACHE_MAX_ENTRY_BYTES,
+    clock: Callable[[], float] = time.time,
+) -> ProviderCache:
+    """Return a memory-only :class:`ProviderCache` sized for search results.
+
+    The cache holds at most ``max_bytes`` of serialised responses and skips
+    responses larger than ``max_entry_bytes``. Lookups are reported by
+    ``provider_cache_lookups_total`` under the ``soulseek_search`` operation.
+    """
+
+    return ProviderCache(
+        path=None,
+        max_items=max_items,
+        max_bytes=max_bytes,
+        max_entry_bytes=max_entry_bytes,
+        default_ttl=ttl_seconds,
+        stale_seconds=stale_seconds,
+        clock=clock,
+    )
+
+
+_SHARED: dict[tuple[float, float, int], ProviderCache] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_search_cache(config: SoulseekConfig) -> ProviderCache | None:
+    """Return the process-wide search cache for *config*, or ``None`` if disabled.
+
+    Soulseek clients are created per service in several places; sharing the
+    cache lets them reuse each other's searches.
+    """
+
+    ttl = float(getattr(config, "search_cache_ttl_seconds", 0.0) or 0.0)
+    if ttl <= 0:
+        return None
+    stale = float(getattr(config, "search_cache_stale_seconds", 0.0) or 0.0)
+    max_items = int(getattr(config, "search_cache_max_items", 512) or 512)
+    shared_key = (ttl, stale, max_items)
+    with _SHARED_LOCK:
+        cache = _SHARED.get(shared_key)
+        if cache is None:
+            cache = build_search_cache(
+                ttl_seconds=ttl,
+                stale_seconds=stale,
+                max_items=max_items,
+            )
+            _SHARED[shared_key] = cache
+        return cache
+
+
+__all__ = ["SEARCH_OPERATION", "build_search_cache", "build_search_key", "shared_search_cache"]
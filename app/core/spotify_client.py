@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import re
 import threading
 import time
 from typing import Any
 
 from app.config import SpotifyConfig
+from app.core.provider_cache import ProviderCache
 from app.core.spotify_cache import SettingsCacheHandler
 from app.logging import get_logger
 
@@ -27,9 +29,29 @@ except Exception:  # pragma: no cover - during tests we mock the client
 
 logger = get_logger(__name__)
 
+_ALBUMS_BATCH_SIZE = 20
+_TRACKS_BATCH_SIZE = 50
+_ALBUM_TRACKS_PAGE_SIZE = 50
+_PLAYLIST_SNAPSHOT_MEMO_SIZE = 256
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    return isinstance(exc, SpotifyException) and getattr(exc, "http_status", None) == 404
+
+
+def _cached_not_found(operation: str, key: str) -> Exception:
+    exc = SpotifyException(404, -1, f"{operation} {key} not found (cached)")
+    exc.http_status = 404
+    return exc
+
 
 class SpotifyClient:
-    """High level client around Spotipy with rate limiting and retries."""
+    """High level client around Spotipy with rate limiting and retries.
+
+    When a :class:`ProviderCache` is supplied, artist and album metadata
+    lookups are served from it. A 404 from Spotify is cached as a miss and
+    re-raised as the same 404 :class:`SpotifyException` while it is cached.
+    """
 
     def __init__(
         self,
@@ -37,12 +59,19 @@ class SpotifyClient:
         client: Spotify | None = None,
         rate_limit_seconds: float = 0.2,
         max_retries: int = 3,
+        *,
+        cache: ProviderCache | None = None,
+        discography_workers: int = 4,
     ) -> None:
         self._config = config
+        self._cache = cache
+        self._discography_workers = max(1, int(discography_workers))
         self._rate_limit_seconds = rate_limit_seconds
         self._max_retries = max_retries
         self._lock = threading.Lock()
         self._last_request_time = 0.0
+        self._snapshot_lock = threading.Lock()
+        self._snapshots: dict[str, tuple[float, str | None]] = {}
 
         if client is not None:
             self._client = client
@@ -90,6 +119,41 @@ class SpotifyClient:
                 time.sleep(backoff)
                 backoff *= 2
 
+    @property
+    def cache(self) -> ProviderCache | None:
+        return self._cache
+
+    def _cached(self, operation: str, key: str, loader: Any) -> Any:
+        if self._cache is None:
+            return loader()
+        value = self._cache.get_or_load(operation, key, loader, is_not_found=_is_not_found)
+        if value is None:
+            # The cache answers a remembered 404 with ``None``; callers get
+            # the error an uncached lookup would have raised.
+            raise _cached_not_found(operation, key)
+        return value
+
+    def access_token(self) -> str | None:
+        """Return a valid OAuth access token, refreshing it through Spotipy.
+
+        Only the cached token is used: this never starts the interactive
+        authorisation flow, so ``None`` means the user has not connected yet.
+        """
+
+        auth_manager = getattr(self._client, "auth_manager", None)
+        if auth_manager is None:
+            return None
+        cache_handler = getattr(auth_manager, "cache_handler", None)
+        validate = getattr(auth_manager, "validate_token", None)
+        if cache_handler is not None and callable(validate):
+            token_info = validate(cache_handler.get_cached_token())
+            if not isinstance(token_info, dict):
+                return None
+            token = token_info.get("access_token")
+            return str(token) if token else None
+        token = auth_manager.get_access_token(as_dict=False)
+        return str(token) if token else None
+
     def is_authenticated(self) -> bool:
         try:
             profile = self._execute(self._client.current_user)
@@ -252,7 +316,9 @@ class SpotifyClient:
     def get_artist(self, artist_id: str) -> dict[str, Any] | None:
         if not artist_id:
             return None
-        return self._execute(self._client.artist, artist_id)
+        return self._cached(
+            "artist", artist_id, lambda: self._execute(self._client.artist, artist_id)
+        )
 
     def search_albums(
         self,
@@ -269,12 +335,24 @@ class SpotifyClient:
         )
         return self._execute(self._client.search, q=search_query, type="album", limit=limit)
 
-    def get_user_playlists(self, limit: int = 50) -> dict[str, Any]:
-        return self._execute(self._client.current_user_playlists, limit=limit)
+    def get_user_playlists(self, limit: int = 50, *, offset: int = 0) -> dict[str, Any]:
+        return self._execute(self._client.current_user_playlists, limit=limit, offset=offset)
 
     def get_track_details(self, track_id: str) -> dict[str, Any]:
         return self._execute(self._client.track, track_id)
 
+    def get_tracks_details(self, track_ids: list[str]) -> list[dict[str, Any]]:
+        """Return full track objects, fetched in batches of 50 ids per request."""
+
+        tracks: list[dict[str, Any]] = []
+        for start in range(0, len(track_ids), _TRACKS_BATCH_SIZE):
+            batch = track_ids[start : start + _TRACKS_BATCH_SIZE]
+            response = self._execute(self._client.tracks, batch)
+            entries = response.get("tracks") if isinstance(response, dict) else None
+            if isinstance(entries, list):
+                tracks.extend(entry for entry in entries if isinstance(entry, dict))
+        return tracks
+
     def get_audio_features(self, track_id: str) -> dict[str, Any]:
         features = self._execute(self._client.audio_features, [track_id]) or []
         return features[0] if features else {}
@@ -283,10 +361,55 @@ class SpotifyClient:
         features = self._execute(self._client.audio_features, track_ids)
         return {"audio_features": features or []}
 
+    def get_playlist_snapshot_id(
+        self, playlist_id: str, *, max_age: float = 0.0
+    ) -> str | None:
+        """Return the playlist's current ``snapshot_id`` (a small request).
+
+        With ``max_age`` a snapshot fetched at most that many seconds ago is
+        reused, so paging through a playlist costs a single lookup.
+        """
+
+        now = time.monotonic()
+        if max_age > 0:
+            with self._snapshot_lock:
+                remembered = self._snapshots.get(playlist_id)
+            if remembered is not None and now - remembered[0] <= max_age:
+                return remembered[1]
+        response = self._execute(self._client.playlist, playlist_id, fields="snapshot_id")
+        snapshot_id = response.get("snapshot_id") if isinstance(response, dict) else None
+        value = str(snapshot_id) if snapshot_id else None
+        with self._snapshot_lock:
+            if len(self._snapshots) >= _PLAYLIST_SNAPSHOT_MEMO_SIZE:
+                self._snapshots.clear()
+            self._snapshots[playlist_id] = (now, value)
+        return value
+
     def get_playlist_items(
-        self, playlist_id: str, limit: int = 100, *, offset: int = 0
+        self,
+        playlist_id: str,
+        limit: int = 100,
+        *,
+        offset: int = 0,
+        snapshot_id: str | None = None,
     ) -> dict[str, Any]:
-        return self._execute(self._client.playlist_items, playlist_id, limit=limit, offset=offset)
+        """Return one page of playlist items.
+
+        With a ``snapshot_id`` the page is cached under that snapshot: a
+        playlist keeps its snapshot until it is modified, so a cached page
+        for the current snapshot is always up to date.
+        """
+
+        def _load() -> dict[str, Any]:
+            return self._execute(
+                self._client.playlist_items, playlist_id, limit=limit, offset=offset
+            )
+
+        if not snapshot_id:
+            return _load()
+        return self._cached(
+            "playlist_items", f"{playlist_id}:{snapshot_id}:{offset}:{limit}", _load
+        )
 
     def find_track_match(
         self,
@@ -350,7 +473,9 @@ class SpotifyClient:
     def get_album_details(self, album_id: str) -> dict[str, Any]:
         """Return metadata for a single Spotify album."""
 
-        return self._execute(self._client.album, album_id)
+        return self._cached(
+            "album", album_id, lambda: self._execute(self._client.album, album_id)
+        )
 
     def get_artist_albums(
         self,
@@ -364,6 +489,18 @@ class SpotifyClient:
         if not artist_id:
             return []
 
+        albums = self._cached(
+            "artist_albums",
+            f"{artist_id}:{include_groups or ''}",
+            lambda: self._fetch_artist_albums(
+                artist_id, include_groups=include_groups, limit=limit
+            ),
+        )
+        return albums or []
+
+    def _fetch_artist_albums(
+        self, artist_id: str, *, include_groups: str | None, limit: int
+    ) -> list[dict[str, Any]]:
         albums: list[dict[str, Any]] = []
         offset = 0
         while True:
@@ -400,6 +537,16 @@ class SpotifyClient:
         if not album_id:
             return []
 
+        tracks = self._cached(
+            "album_tracks",
+            f"{album_id}:{market or ''}",
+            lambda: self._fetch_album_tracks(album_id, limit=limit, market=market),
+        )
+        return tracks or []
+
+    def _fetch_album_tracks(
+        self, album_id: str, *, limit: int, market: str | None
+    ) -> list[dict[str, Any]]:
         tracks: list[dict[str, Any]] = []
         offset = 0
         while True:
@@ -530,14 +677,88 @@ class SpotifyClient:
         return self._execute(self._client.artist_top_tracks, artist_id, **params)
 
     def get_artist_discography(self, artist_id: str) -> dict[str, Any]:
-        """Fetch the complete discography for an artist including tracks."""
+        """Fetch the complete discography for an artist including tracks.
+
+        Album tracks come embedded in the batch ``albums`` endpoint (up to 20
+        albums per request, first 50 tracks each), so only albums with more
+        tracks need their own track requests. Pages are fetched concurrently
+        on a small thread pool; every request still goes through the client's
+        rate limiter.
+        """
 
         limit = 50
-        offset = 0
-        albums: list[dict[str, Any]] = []
-        seen_album_ids: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=self._discography_workers, thread_name_prefix="spotify-discography"
+        ) as pool:
+            release_pages = self._fetch_artist_release_pages(pool, artist_id, limit=limit)
+
+            albums: list[dict[str, Any]] = []
+            seen_album_ids: set[str] = set()
+            for page in release_pages:
+                for album in page:
+                    album_id = album.get("id")
+                    if not album_id or album_id in seen_album_ids:
+                        continue
+                    seen_album_ids.add(str(album_id))
+                    albums.append(album)
+
+            album_ids = [str(album["id"]) for album in albums]
+            batches = [
+                album_ids[start : start + _ALBUMS_BATCH_SIZE]
+                for start in range(0, len(album_ids), _ALBUMS_BATCH_SIZE)
+            ]
+            full_albums: dict[str, dict[str, Any]] = {}
+            for batch in pool.map(self._fetch_albums_batch, batches):
+                full_albums.update(batch)
+
+            # Albums the batch endpoint did not return fall back to the
+            # per-album track listing.
+            tracks_by_album = {
+                album_id: (
+                    self._embedded_tracks(full_albums[album_id])
+                    if album_id in full_albums
+                    else self.get_album_tracks(album_id)
+                )
+                for album_id in album_ids
+            }
+            remaining = [
+                (album_id, offset)
+                for album_id in album_ids
+                for offset in self._missing_track_offsets(full_albums.get(album_id))
+            ]
+            pages = pool.map(
+                lambda job: self._execute(
+                    self._client.album_tracks,
+                    job[0],
+                    limit=_ALBUM_TRACKS_PAGE_SIZE,
+                    offset=job[1],
+                ),
+                remaining,
+            )
+            for (album_id, _offset), response in zip(remaining, pages, strict=True):
+                items = response.get("items") if isinstance(response, dict) else None
+                if isinstance(items, list):
+                    tracks_by_album[album_id].extend(
+                        item for item in items if isinstance(item, dict)
+                    )
 
-        while True:
+        if self._cache is not None:
+            for album_id, tracks in tracks_by_album.items():
+                if album_id in full_albums:
+                    self._cache.put("album_tracks", f"{album_id}:", tracks)
+
+        return {
+            "artist_id": artist_id,
+            "albums": [
+                {"album": album, "tracks": tracks_by_album[str(album["id"])]}
+                for album in albums
+            ],
+        }
+
+    def _fetch_artist_release_pages(
+        self, pool: ThreadPoolExecutor, artist_id: str, *, limit: int
+    ) -> list[list[dict[str, Any]]]:
+        def _page(offset: int) -> tuple[list[dict[str, Any]], int | None]:
             response = self._execute(
                 self._client.artist_albums,
                 artist_id,
@@ -548,23 +769,46 @@ class SpotifyClient:
             items = response.get("items") if isinstance(response, dict) else []
             if not isinstance(items, list):
                 items = []
-            for album in items:
-                if not isinstance(album, dict):
-                    continue
-                album_id = album.get("id")
-                if not album_id or album_id in seen_album_ids:
-                    continue
-                seen_album_ids.add(album_id)
-                track_items = self.get_album_tracks(str(album_id))
-                albums.append({"album": album, "tracks": track_items})
-            if len(items) < limit:
-                break
             total = response.get("total") if isinstance(response, dict) else None
-            offset += limit
-            if total is not None and offset >= int(total):
-                break
+            albums = [item for item in items if isinstance(item, dict)]
+            return albums, int(total) if isinstance(total, int | float) else None
+
+        first, total = _page(0)
+        if total is None or len(first) < limit:
+            return [first]
+        offsets = range(limit, total, limit)
+        return [first, *(items for items, _total in pool.map(_page, offsets))]
+
+    def _fetch_albums_batch(self, album_ids: list[str]) -> dict[str, dict[str, Any]]:
+        response = self._execute(self._client.albums, album_ids)
+        entries = response.get("albums") if isinstance(response, dict) else None
+        if not isinstance(entries, list):
+            return {}
+        return {
+            str(entry["id"]): entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("id")
+        }
 
-        return {"artist_id": artist_id, "albums": albums}
+    @staticmethod
+    def _embedded_tracks(album: dict[str, Any]) -> list[dict[str, Any]]:
+        tracks = album.get("tracks")
+        items = tracks.get("items") if isinstance(tracks, dict) else None
+        if not isinstance(items, list):
+            return []
+        return [item for item in items if isinstance(item, dict)]
+
+    @staticmethod
+    def _missing_track_offsets(album: dict[str, Any] | None) -> range:
+        tracks = album.get("tracks") if isinstance(album, dict) else None
+        if not isinstance(tracks, dict) or not tracks.get("next"):
+            return range(0)
+        items = tracks.get("items")
+        fetched = len(items) if isinstance(items, list) else 0
+        total = tracks.get("total")
+        if not fetched or not isinstance(total, int | float):
+            return range(0)
+        return range(fetched, int(total), _ALBUM_TRACKS_PAGE_SIZE)
 
     def get_track_metadata(self, track_id: str) -> dict[str, Any]:
         metadata: dict[str, Any] = {}
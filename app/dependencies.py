@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.config import AppConfig, load_config
 from app.core.matching_engine import MusicMatchingEngine
+from app.core.provider_cache import shared_provider_cache
 from app.core.soulseek_client import SoulseekClient
 from app.core.spotify_client import SpotifyClient
 from app.core.transfers_api import TransfersApi
@@ -106,7 +107,9 @@ def get_spotify_client() -> SpotifyClient | None:
             )
             return None
     try:
-        return SpotifyClient(config)
+        return SpotifyClient(
+            config, cache=shared_provider_cache(get_app_config().integrations.cache)
+        )
     except ValueError:
         logger.warning(
             "Spotify client initialisation failed due to incomplete credentials",
@@ -143,7 +146,7 @@ def get_provider_gateway() -> ProviderGateway:
 def get_integration_service() -> IntegrationService:
     if _integration_service_override is not None:
         return _integration_service_override
-    return IntegrationService(registry=get_provider_registry())
+    return IntegrationService(registry=get_provider_registry(), gateway=get_provider_gateway())
 
 
 def set_integration_service_override(service: IntegrationService | None) -> None:
@@ -1,5 +1,6 @@
 """Harmony Download Manager (HDM) package."""
 
+from .executors import HdmExecutors
 from .idempotency import (
     IdempotencyReservation,
     IdempotencyStore,
@@ -39,6 +40,7 @@ __all__ = [
     "DownloadRequestItem",
     "DownloadWorkItem",
     "DurationStats",
+    "HdmExecutors",
     "HdmOrchestrator",
     "IdempotencyReservation",
     "IdempotencyStore",
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 import math
+from pathlib import Path
+import time
 from typing import Any
 
 from app.logging import get_logger
@@ -128,6 +131,85 @@ def _observe_phase_durations(events: Iterable[ItemEvent]) -> None:
         _PHASE_DURATION_SECONDS.labels(phase="moving").observe(duration)
 
 
+class _QuantileSketch:
+    """Streaming quantile estimator with bounded memory.
+
+    Up to ``exact_limit`` observations are kept verbatim so small batches get
+    exact, interpolated percentiles. Beyond that the values are folded into
+    logarithmic buckets with ``relative_accuracy`` error (DDSketch style),
+    capped at ``max_buckets`` by merging the smallest buckets.
+    """
+
+    __slots__ = (
+        "_exact",
+        "_exact_limit",
+        "_buckets",
+        "_count",
+        "_zeros",
+        "_gamma",
+        "_log_gamma",
+        "_max_buckets",
+    )
+
+    def __init__(
+        self,
+        *,
+        exact_limit: int = 256,
+        relative_accuracy: float = 0.01,
+        max_buckets: int = 2048,
+    ) -> None:
+        self._exact: list[float] | None = []
+        self._exact_limit = exact_limit
+        self._buckets: dict[int, int] = {}
+        self._count = 0
+        self._zeros = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        if value < 0:
+            return
+        self._count += 1
+        if self._exact is not None:
+            self._exact.append(value)
+            if len(self._exact) > self._exact_limit:
+                exact, self._exact = self._exact, None
+                for existing in exact:
+                    self._add_bucket(existing)
+            return
+        self._add_bucket(value)
+
+    def quantile(self, percentile: float) -> float:
+        if self._exact is not None:
+            return _percentile(self._exact, percentile)
+        if not self._count:
+            return 0.0
+        rank = percentile * (self._count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                return 2 * self._gamma**index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+    def _add_bucket(self, value: float) -> None:
+        if value <= 1e-9:
+            self._zeros += 1
+            return
+        index = int(math.ceil(math.log(value) / self._log_gamma))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        if len(self._buckets) > self._max_buckets:
+            lowest, second = sorted(self._buckets)[:2]
+            self._buckets[second] += self._buckets.pop(lowest)
+
+
 def _percentile(values: Iterable[float], percentile: float) -> float:
     ordered = sorted(float(value) for value in values if value >= 0)
     if not ordered:
@@ -159,26 +241,65 @@ class _BatchState:
     skipped: int = 0
     succeeded: int = 0
     failed: int = 0
-    durations: list[float] = field(default_factory=list)
+    durations: _QuantileSketch = field(default_factory=_QuantileSketch)
     results: dict[str, DownloadItemResult] = field(default_factory=dict)
     completed_event: asyncio.Event = field(default_factory=asyncio.Event)
     summary: BatchSummary | None = None
+    waiters: int = 0
 
     def __post_init__(self) -> None:
         self.pending_items = self.items_total
 
 
 class DownloadBatchAggregator:
-    """Track per-batch state and emit structured telemetry."""
+    """Track per-batch state and emit structured telemetry.
 
-    def __init__(self) -> None:
+    Finished batches are kept for ``finished_ttl_seconds`` so late callers can
+    still fetch their summary, then evicted once no ``wait_for_summary`` call
+    is pending for them.
+    """
+
+    def __init__(
+        self,
+        *,
+        finished_ttl_seconds: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._batches: dict[str, _BatchState] = {}
+        self._finished: deque[tuple[float, str]] = deque()
+        self._finished_ttl = max(0.0, float(finished_ttl_seconds))
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._batches)
 
     def create_batch(self, batch_id: str, *, requested_by: str, total: int) -> _BatchState:
+        self.evict_expired()
         state = _BatchState(batch_id=batch_id, requested_by=requested_by, items_total=total)
         self._batches[batch_id] = state
         return state
 
+    def evict_expired(self) -> int:
+        """Drop finished batches whose retention period has elapsed."""
+
+        now = self._clock()
+        evicted = 0
+        for _ in range(len(self._finished)):
+            finished_at, batch_id = self._finished[0]
+            if now - finished_at < self._finished_ttl:
+                break
+            self._finished.popleft()
+            state = self._batches.get(batch_id)
+            if state is None:
+                continue
+            if state.waiters:
+                # Still being awaited; check again after another TTL period.
+                self._finished.append((now, batch_id))
+                continue
+            del self._batches[batch_id]
+            evicted += 1
+        return evicted
+
     def get_batch(self, batch_id: str) -> _BatchState:
         return self._batches[batch_id]
 
@@ -217,6 +338,7 @@ class DownloadBatchAggregator:
         *,
         reason: str,
         already_processed: bool,
+        final_path: Path | None = None,
     ) -> None:
         async with state.lock:
             state.duplicates += 1
@@ -228,7 +350,7 @@ class DownloadBatchAggregator:
                 batch_id=item.batch_id,
                 state=ItemState.DUPLICATE,
                 attempts=0,
-                final_path=None,
+                final_path=final_path,
                 tags_written=False,
                 bytes_written=None,
                 duration_seconds=None,
@@ -335,7 +457,7 @@ class DownloadBatchAggregator:
         async with state.lock:
             state.succeeded += 1
             state.pending_items -= 1
-            state.durations.append(max(processing_seconds, 0.0))
+            state.durations.add(max(processing_seconds, 0.0))
             result = DownloadItemResult(
                 item_id=item.item_id,
                 batch_id=item.batch_id,
@@ -388,7 +510,7 @@ class DownloadBatchAggregator:
         async with state.lock:
             state.failed += 1
             state.pending_items -= 1
-            state.durations.append(max(processing_seconds, 0.0))
+            state.durations.add(max(processing_seconds, 0.0))
             result = DownloadItemResult(
                 item_id=item.item_id,
                 batch_id=item.batch_id,
@@ -439,9 +561,8 @@ class DownloadBatchAggregator:
         if state.summary is not None:
             return
         completed_at = datetime.now(UTC)
-        durations = list(state.durations)
-        p95 = _percentile(durations, 0.95)
-        p99 = _percentile(durations, 0.99)
+        p95 = state.durations.quantile(0.95)
+        p99 = state.durations.quantile(0.99)
         totals = BatchTotals(
             total_items=state.items_total,
             succeeded=state.succeeded,
@@ -471,10 +592,19 @@ class DownloadBatchAggregator:
             ),
             items=tuple(state.results.values()),
         )
+        # The summary owns the results now; drop the working copy.
+        state.results = {}
         state.completed_event.set()
+        self._finished.append((self._clock(), state.batch_id))
 
     async def wait_for_summary(self, batch_id: str) -> BatchSummary:
+        """Wait for *batch_id* to finish; raises ``KeyError`` once evicted."""
+
         state = self._batches[batch_id]
-        await state.completed_event.wait()
+        state.waiters += 1
+        try:
+            await state.completed_event.wait()
+        finally:
+            state.waiters -= 1
         assert state.summary is not None  # defensive: summary must be set when event fires
         return state.summary
@@ -0,0 +1,572 @@
+"""End-to-end throughput benchmark for the HDM pipeline.
+
+Drives ``HdmOrchestrator`` → ``DefaultDownloadPipeline`` → completion →
+tagging → ``AtomicFileMover`` against an in-process slskd stand-in that writes
+synthetic audio files into a temporary downloads directory::
+
+    python -m app.hdm.benchmark --items 10,100,1000 --format raw,mp3,flac
+
+Placing ``--downloads-root`` on tmpfs and ``--music-root`` on disk measures
+the cross-device move path. ``HDM_*`` environment variables are honoured, so
+executor and concurrency settings can be compared run against run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+import resource
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+from urllib.parse import unquote
+
+import httpx
+
+from app.config import HdmConfig, SoulseekConfig
+from app.logging import get_logger
+
+from .models import DownloadBatchRequest, DownloadRequestItem, ItemState
+from .runtime import build_hdm_runtime
+
+logger = get_logger("hdm.benchmark")
+
+DEFAULT_ITEM_COUNTS: tuple[int, ...] = (10, 100, 1000)
+DEFAULT_FILE_BYTES = 1 * 1024 * 1024
+SUPPORTED_FORMATS: tuple[str, ...] = ("raw", "mp3", "flac")
+
+_DOWNLOADS_PREFIX = "/api/v0/transfers/downloads/"
+_WRITE_CHUNK_BYTES = 256 * 1024
+_RSS_SAMPLE_INTERVAL = 0.05
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, no padding: 417-byte frames.
+_MP3_FRAME_HEADER = bytes((0xFF, 0xFB, 0x90, 0x64))
+_MP3_FRAME_BYTES = 417
+
+
+def synthesize_audio(audio_format: str, size_bytes: int) -> bytes:
+    """Return roughly *size_bytes* of a file mutagen recognises as *audio_format*.
+
+    The payload is silence/zero padding; only the container headers are
+    valid, which is all the tagging step needs.
+    """
+
+    size_bytes = max(1024, int(size_bytes))
+    if audio_format == "raw":
+        return b"\0" * size_bytes
+    if audio_format == "mp3":
+        frame = _MP3_FRAME_HEADER + b"\0" * (_MP3_FRAME_BYTES - len(_MP3_FRAME_HEADER))
+        return frame * max(1, size_bytes // _MP3_FRAME_BYTES)
+    if audio_format == "flac":
+        sample_rate, channels, bits, total_samples = 44_100, 2, 16, 44_100 * 180
+        packed = (
+            (sample_rate << 44) | ((channels - 1) << 41) | ((bits - 1) << 36) | total_samples
+        )
+        streaminfo = (
+            struct.pack(">HH", 4096, 4096)
+            + b"\0" * 6
+            + packed.to_bytes(8, "big")
+            + b"\0" * 16
+        )
+        header = b"fLaC" + bytes((0x80,)) + len(streaminfo).to_bytes(3, "big") + streaminfo
+        return header + b"\0" * max(0, size_bytes - len(header))
+    raise ValueError(f"Unsupported benchmark audio format: {audio_format}")
+
+
+@dataclass(slots=True)
+class _FakeTransfer:
+    path: Path
+    total_bytes: int
+    bytes_written: int = 0
+    started: bool = False
+    completed: bool = False
+    task: asyncio.Task[None] | None = None
+
+
+class FakeSlskdTransport(httpx.AsyncBaseTransport):
+    """In-process stand-in for the slskd transfer API.
+
+    The first status poll for an idempotency key starts a simulated transfer
+    that writes ``payload`` into *downloads_dir* at ``bytes_per_second``
+    (``0`` writes the file in one go) after ``accept_delay`` seconds.
+    Subsequent polls, per key or through the bulk transfers list, report
+    ``queued``/``in_progress``/``completed`` the way slskd does.
+    """
+
+    def __init__(
+        self,
+        downloads_dir: Path,
+        *,
+        payload: bytes,
+        extension: str,
+        bytes_per_second: float = 0.0,
+        accept_delay: float = 0.0,
+    ) -> None:
+        self._downloads_dir = downloads_dir
+        self._payload = payload
+        self._extension = extension
+        self._bytes_per_second = max(0.0, float(bytes_per_second))
+        self._accept_delay = max(0.0, float(accept_delay))
+        self._transfers: dict[str, _FakeTransfer] = {}
+        self.requests = 0
+
+    def respond(self, method: str, path: str) -> tuple[int, dict[str, Any]]:
+        """Return the status code and JSON body slskd would send for *path*."""
+
+        self.requests += 1
+        if method == "GET" and path.rstrip("/") == _DOWNLOADS_PREFIX.rstrip("/"):
+            return 200, {
+                "downloads": [
+                    self._status(key, transfer) for key, transfer in self._transfers.items()
+                ]
+            }
+        if method != "GET" or not path.startswith(_DOWNLOADS_PREFIX):
+            return 404, {"error": "not found"}
+        key = unquote(path[len(_DOWNLOADS_PREFIX) :])
+        transfer = self._transfers.get(key)
+        if transfer is None:
+            transfer = self._start(key)
+        return 200, self._status(key, transfer)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        status, body = self.respond(request.method, request.url.path)
+        return httpx.Response(status, json=body, request=request)
+
+    async def asgi_app(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """Serve the stand-in as a minimal ASGI application."""
+
+        if scope["type"] != "http":
+            return
+        status, body = self.respond(scope["method"], scope["path"])
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+
+    async def close_transfers(self) -> None:
+        """Cancel simulated transfers that are still writing."""
+
+        tasks = [t.task for t in self._transfers.values() if t.task and not t.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._transfers.clear()
+
+    def _start(self, key: str) -> _FakeTransfer:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        transfer = _FakeTransfer(
+            path=self._downloads_dir / f"{digest}.{self._extension}",
+            total_bytes=len(self._payload),
+        )
+        transfer.task = asyncio.create_task(self._write(transfer))
+        self._transfers[key] = transfer
+        return transfer
+
+    async def _write(self, transfer: _FakeTransfer) -> None:
+        if self._accept_delay:
+            await asyncio.sleep(self._accept_delay)
+        transfer.started = True
+        payload = self._payload
+        if not self._bytes_per_second:
+            await asyncio.to_thread(transfer.path.write_bytes, payload)
+            transfer.bytes_written = len(payload)
+            transfer.completed = True
+            return
+        delay = _WRITE_CHUNK_BYTES / self._bytes_per_second
+        with transfer.path.open("wb") as handle:
+            for offset in range(0, len(payload), _WRITE_CHUNK_BYTES):
+                chunk = payload[offset : offset + _WRITE_CHUNK_BYTES]
+                await asyncio.to_thread(handle.write, chunk)
+                transfer.bytes_written += len(chunk)
+                await asyncio.sleep(delay)
+        transfer.completed = True
+
+    @staticmethod
+    def _status(key: str, transfer: _FakeTransfer) -> dict[str, Any]:
+        if transfer.completed:
+            return {
+                "id": key,
+                "state": "completed",
+                "path": str(transfer.path),
+                "bytes": transfer.bytes_written,
+                "size": transfer.total_bytes,
+            }
+        if transfer.started:
+            return {
+                "id": key,
+                "state": "in_progress",
+                "bytes": transfer.bytes_written,
+                "size": transfer.total_bytes,
+            }
+        return {"id": key, "state": "queued"}
+
+
+@asynccontextmanager
+async def _serve_over_tcp(transport: FakeSlskdTransport) -> AsyncIterator[str]:
+    """Expose *transport* on a loopback port and yield its base URL."""
+
+    import uvicorn
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            transport.asgi_app,
+            host="127.0.0.1",
+            port=0,
+            interface="asgi3",
+            lifespan="off",
+            access_log=False,
+            log_level="warning",
+        )
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        await task
+
+
+@dataclass(slots=True, frozen=True)
+class BenchmarkScenario:
+    """Parameters of one benchmark run."""
+
+    items: int
+    audio_format: str = "raw"
+    file_bytes: int = DEFAULT_FILE_BYTES
+    bytes_per_second: float = 0.0
+    accept_delay: float = 0.0
+    size_stable_seconds: int = 1
+    worker_concurrency: int | None = None
+    downloads_root: Path | None = None
+    music_root: Path | None = None
+    slskd_over_tcp: bool = False
+    timeout_seconds: float = 900.0
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Measurements collected for a :class:`BenchmarkScenario`."""
+
+    items: int
+    audio_format: str
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+    items_per_second: float
+    megabytes_per_second: float
+    latency_p50_seconds: float
+    latency_p95_seconds: float
+    latency_p99_seconds: float
+    fsync_calls: int
+    peak_rss_bytes: int
+    slskd_requests: int
+    executor_wait_seconds: dict[str, float] = field(default_factory=dict)
+    executor_max_wait_seconds: dict[str, float] = field(default_factory=dict)
+
+
+@contextmanager
+def _count_fsyncs() -> Iterator[Callable[[], int]]:
+    original = os.fsync
+    lock = threading.Lock()
+    calls = 0
+
+    def _counting_fsync(fd: Any) -> None:
+        nonlocal calls
+        with lock:
+            calls += 1
+        original(fd)
+
+    os.fsync = _counting_fsync  # type: ignore[assignment]
+    try:
+        yield lambda: calls
+    finally:
+        os.fsync = original  # type: ignore[assignment]
+
+
+def _current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ``ru_maxrss`` is reported in bytes on macOS and in KiB elsewhere.
+        return usage if sys.platform == "darwin" else usage * 1024
+
+
+async def _sample_peak_rss(peak: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], _current_rss_bytes())
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=_RSS_SAMPLE_INTERVAL)
+        except TimeoutError:
+            continue
+
+
+def _percentiles(values: Sequence[float]) -> tuple[float, float, float]:
+    if not values:
+        return 0.0, 0.0, 0.0
+    if len(values) == 1:
+        return values[0], values[0], values[0]
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+def _build_config(
+    scenario: BenchmarkScenario,
+    downloads_dir: Path,
+    music_dir: Path,
+    env: Mapping[str, str],
+) -> HdmConfig:
+    overrides = {
+        "DOWNLOADS_DIR": str(downloads_dir),
+        "MUSIC_DIR": str(music_dir),
+        "IDEMPOTENCY_SQLITE_PATH": str(downloads_dir / ".harmony" / "idempotency.db"),
+        "BATCH_MAX_ITEMS": str(max(scenario.items, 1)),
+        "SIZE_STABLE_SEC": str(scenario.size_stable_seconds),
+        "MOVE_TEMPLATE": "{artist}/{album}/{title}.{extension}",
+    }
+    if scenario.worker_concurrency is not None:
+        overrides["WORKER_CONCURRENCY"] = str(scenario.worker_concurrency)
+    return HdmConfig.from_env({**env, **overrides})
+
+
+def _soulseek_config(base_url: str = "http://slskd.benchmark") -> SoulseekConfig:
+    return SoulseekConfig(
+        base_url=base_url,
+        api_key=None,
+        timeout_ms=8_000,
+        retry_max=3,
+        retry_backoff_base_ms=10,
+        retry_jitter_pct=0.0,
+        preferred_formats=(),
+        max_results=50,
+        search_cache_ttl_seconds=0.0,
+        search_cache_stale_seconds=0.0,
+        search_cache_max_items=1,
+    )
+
+
+async def run_scenario(
+    scenario: BenchmarkScenario,
+    *,
+    env: Mapping[str, str] | None = None,
+) -> BenchmarkResult:
+    """Run *scenario* against a fresh HDM runtime and return its measurements."""
+
+    extension = "bin" if scenario.audio_format == "raw" else scenario.audio_format
+    payload = synthesize_audio(scenario.audio_format, scenario.file_bytes)
+    downloads_base = Path(tempfile.mkdtemp(prefix="hdm-bench-dl-", dir=scenario.downloads_root))
+    music_base = Path(tempfile.mkdtemp(prefix="hdm-bench-music-", dir=scenario.music_root))
+    try:
+        config = _build_config(
+            scenario, downloads_base, music_base, os.environ if env is None else env
+        )
+        transport = FakeSlskdTransport(
+            Path(config.downloads_dir),
+            payload=payload,
+            extension=extension,
+            bytes_per_second=scenario.bytes_per_second,
+            accept_delay=scenario.accept_delay,
+        )
+        request = DownloadBatchRequest(
+            items=[
+                DownloadRequestItem(
+                    artist=f"Benchmark Artist {index % 50:02d}",
+                    title=f"Benchmark Track {index:05d}",
+                    album=f"Benchmark Album {index % 200:03d}",
+                )
+                for index in range(scenario.items)
+            ],
+            requested_by="hdm-benchmark",
+        )
+
+        async with AsyncExitStack() as stack:
+            if scenario.slskd_over_tcp:
+                base_url = await stack.enter_async_context(_serve_over_tcp(transport))
+                runtime = build_hdm_runtime(config, _soulseek_config(base_url))
+            else:
+                runtime = build_hdm_runtime(
+                    config, _soulseek_config(), slskd_transport=transport
+                )
+            peak_rss = [_current_rss_bytes()]
+            stop_sampling = asyncio.Event()
+            sampler = asyncio.create_task(_sample_peak_rss(peak_rss, stop_sampling))
+            with _count_fsyncs() as fsync_calls:
+                await runtime.start()
+                try:
+                    submitted_at = datetime.now(UTC)
+                    started = time.perf_counter()
+                    handle = await runtime.orchestrator.submit_batch(request)
+                    summary = await asyncio.wait_for(handle.wait(), scenario.timeout_seconds)
+                    elapsed = time.perf_counter() - started
+                    executor_stats = runtime.executors.stats()
+                finally:
+                    stop_sampling.set()
+                    await sampler
+                    await runtime.shutdown()
+                    await transport.close_transfers()
+                fsyncs = fsync_calls()
+    finally:
+        shutil.rmtree(downloads_base, ignore_errors=True)
+        shutil.rmtree(music_base, ignore_errors=True)
+
+    latencies = sorted(
+        (max(event.timestamp for event in result.events) - submitted_at).total_seconds()
+        for result in summary.items
+        if result.events
+    )
+    p50, p95, p99 = _percentiles(latencies)
+    succeeded = sum(1 for result in summary.items if result.state is ItemState.DONE)
+    moved_bytes = sum(result.bytes_written or 0 for result in summary.items)
+    elapsed = max(elapsed, 1e-9)
+    return BenchmarkResult(
+        items=scenario.items,
+        audio_format=scenario.audio_format,
+        succeeded=succeeded,
+        failed=len(summary.items) - succeeded,
+        elapsed_seconds=elapsed,
+        items_per_second=succeeded / elapsed,
+        megabytes_per_second=moved_bytes / elapsed / (1024 * 1024),
+        latency_p50_seconds=p50,
+        latency_p95_seconds=p95,
+        latency_p99_seconds=p99,
+        fsync_calls=fsyncs,
+        peak_rss_bytes=peak_rss[0],
+        slskd_requests=transport.requests,
+        executor_wait_seconds={
+            name: stats.total_wait_seconds for name, stats in executor_stats.items()
+        },
+        executor_max_wait_seconds={
+            name: stats.max_wait_seconds for name, stats in executor_stats.items()
+        },
+    )
+
+
+def format_result(result: BenchmarkResult) -> str:
+    waits = ", ".join(
+        f"{name}={result.executor_wait_seconds[name]:.3f}s"
+        f"/max {result.executor_max_wait_seconds[name] * 1000:.1f}ms"
+        for name in sorted(result.executor_wait_seconds)
+    )
+    return (
+        f"{result.items:>5} x {result.audio_format:<4} "
+        f"ok={result.succeeded} failed={result.failed} "
+        f"{result.items_per_second:8.2f} items/s {result.megabytes_per_second:8.2f} MiB/s "
+        f"p50={result.latency_p50_seconds:.3f}s p95={result.latency_p95_seconds:.3f}s "
+        f"p99={result.latency_p99_seconds:.3f}s fsync={result.fsync_calls} "
+        f"rss={result.peak_rss_bytes / (1024 * 1024):.1f}MiB pool wait [{waits}]"
+    )
+
+
+def _parse_csv(raw: str, convert: Callable[[str], Any]) -> list[Any]:
+    return [convert(part.strip()) for part in raw.split(",") if part.strip()]
+
+
+async def _run_all(scenarios: Sequence[BenchmarkScenario], *, as_json: bool) -> None:
+    for scenario in scenarios:
+        result = await run_scenario(scenario)
+        if as_json:
+            print(json.dumps(asdict(result), sort_keys=True), flush=True)
+        else:
+            print(format_result(result), flush=True)
+
+
+def _cli(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Harmony HDM pipeline benchmark")
+    parser.add_argument(
+        "--items",
+        default=",".join(str(count) for count in DEFAULT_ITEM_COUNTS),
+        help="Comma separated batch sizes (default: 10,100,1000)",
+    )
+    parser.add_argument(
+        "--format",
+        default="raw",
+        help=f"Comma separated synthetic formats: {', '.join(SUPPORTED_FORMATS)}",
+    )
+    parser.add_argument(
+        "--file-bytes", type=int, default=DEFAULT_FILE_BYTES, help="Size of each file"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="Simulated per-transfer speed in bytes/s (0 writes each file at once)",
+    )
+    parser.add_argument(
+        "--accept-delay",
+        type=float,
+        default=0.0,
+        help="Seconds the stand-in keeps a transfer queued before writing",
+    )
+    parser.add_argument(
+        "--size-stable-seconds",
+        type=int,
+        default=1,
+        help="Stability window used by the completion monitor",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Override WORKER_CONCURRENCY"
+    )
+    parser.add_argument("--downloads-root", type=Path, default=None)
+    parser.add_argument("--music-root", type=Path, default=None)
+    parser.add_argument(
+        "--slskd-over-tcp",
+        action="store_true",
+        help="Serve the slskd stand-in on a loopback port instead of in-process",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit one JSON object per run")
+    args = parser.parse_args(argv)
+
+    formats = _parse_csv(args.format, str.lower)
+    unknown = sorted(set(formats) - set(SUPPORTED_FORMATS))
+    if unknown:
+        parser.error(f"unsupported format(s): {', '.join(unknown)}")
+    scenarios = [
+        BenchmarkScenario(
+            items=count,
+            audio_format=audio_format,
+            file_bytes=args.file_bytes,
+            bytes_per_second=args.rate,
+            accept_delay=args.accept_delay,
+            size_stable_seconds=args.size_stable_seconds,
+            worker_concurrency=args.workers,
+            downloads_root=args.downloads_root,
+            music_root=args.music_root,
+            slskd_over_tcp=args.slskd_over_tcp,
+        )
+        for audio_format in formats
+        for count in _parse_csv(args.items, int)
+    ]
+    asyncio.run(_run_all(scenarios, as_json=args.json))
+    return 0
+
+
+def main() -> None:
+    raise SystemExit(_cli())
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
+    main()
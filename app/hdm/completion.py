@@ -6,15 +6,66 @@ import asyncio
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import UTC, datetime
+import hashlib
 from pathlib import Path
 import time
 
 from app.logging import get_logger
 
+from .executors import METADATA_POOL, HdmExecutors, run_blocking
 from .models import DownloadItem, DownloadWorkItem, ItemEvent
 
 logger = get_logger("hdm.completion")
 
+CHECKSUM_ALGORITHM = "blake2b-256"
+_CHECKSUM_CHUNK_BYTES = 1024 * 1024
+
+
+class StreamingChecksum:
+    """Incrementally hash a file that is still being appended to.
+
+    Each :meth:`update` only reads the bytes added since the previous call, so
+    hashing overlaps with the stability wait instead of re-reading the whole
+    file afterwards. A file that shrinks is re-hashed from the start.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._hasher = hashlib.blake2b(digest_size=32)
+        self._offset = 0
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def update(self, size: int) -> None:
+        if size < self._offset:
+            self._hasher = hashlib.blake2b(digest_size=32)
+            self._offset = 0
+        if size == self._offset:
+            return
+        with self._path.open("rb") as handle:
+            handle.seek(self._offset)
+            remaining = size - self._offset
+            while remaining > 0:
+                chunk = handle.read(min(_CHECKSUM_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                self._hasher.update(chunk)
+                self._offset += len(chunk)
+                remaining -= len(chunk)
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+def file_checksum(path: Path) -> str:
+    """Return the :data:`CHECKSUM_ALGORITHM` digest of *path*."""
+
+    checksum = StreamingChecksum(path)
+    checksum.update(path.stat().st_size)
+    return checksum.hexdigest()
+
 
 @dataclass(slots=True)
 class DownloadCompletionEvent:
@@ -63,6 +114,15 @@ class CompletionResult:
     bytes_written: int
     codec: str | None
     duration_seconds: float | None
+    checksum: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class StableFile:
+    """Size and checksum of a file whose size has stopped changing."""
+
+    size: int
+    checksum: str
 
 
 class DownloadCompletionMonitor:
@@ -75,21 +135,32 @@ class DownloadCompletionMonitor:
         size_stable_seconds: int,
         event_bus: CompletionEventBus,
         poll_interval: float = 1.0,
+        executors: HdmExecutors | None = None,
+        inspect_metadata: bool = True,
     ) -> None:
         self._downloads_dir = downloads_dir
         self._size_stable_seconds = max(1, int(size_stable_seconds))
         self._bus = event_bus
         self._poll_interval = max(0.25, float(poll_interval))
+        self._executors = executors
+        self._inspect_metadata = inspect_metadata
 
     async def wait_for_completion(
         self,
         work_item: DownloadWorkItem,
         *,
         expected_path: Path | None,
+        expected_bytes: int | None = None,
     ) -> CompletionResult:
-        """Wait for the download represented by *work_item* to finish."""
+        """Wait for the download represented by *work_item* to finish.
 
-        candidate = await self._check_existing(expected_path)
+        Pass *expected_bytes* only once the transfer is known to have
+        finished: the file then counts as complete as soon as it reaches that
+        size, without waiting out the stability window. Without it the size
+        must stay unchanged for ``size_stable_seconds``.
+        """
+
+        candidate = await self._check_existing(expected_path, expected_bytes)
         if candidate is not None:
             return candidate
 
@@ -100,18 +171,18 @@ class DownloadCompletionMonitor:
                 try:
                     event = await asyncio.wait_for(queue.get(), timeout=self._poll_interval)
                 except TimeoutError:
-                    candidate = await self._check_existing(expected_path)
+                    candidate = await self._check_existing(expected_path, expected_bytes)
                     if candidate is not None:
                         return candidate
-                    fallback = await self._scan_candidates(work_item.item)
+                    fallback = await self._scan_candidates(work_item.item, expected_bytes)
                     if fallback is not None:
                         return fallback
                     continue
                 if self._is_valid(event.path):
-                    bytes_written = event.bytes_written
-                    if bytes_written <= 0:
-                        bytes_written = await self._ensure_stable(event.path)
-                    return await self._build_result(event.path, bytes_written)
+                    if event.bytes_written > 0:
+                        return await self._build_result(event.path, event.bytes_written)
+                    stable = await self._ensure_stable(event.path, expected_bytes)
+                    return await self._build_result(event.path, stable.size, stable.checksum)
                 work_item.record_event(
                     "download.event_ignored",
                     meta={
@@ -138,48 +209,66 @@ class DownloadCompletionMonitor:
         )
         await self._bus.publish(dedupe_key, event)
 
-    async def _check_existing(self, expected_path: Path | None) -> CompletionResult | None:
+    async def _check_existing(
+        self, expected_path: Path | None, expected_bytes: int | None
+    ) -> CompletionResult | None:
         if expected_path is not None and self._is_valid(expected_path):
-            bytes_written = await self._ensure_stable(expected_path)
-            return await self._build_result(expected_path, bytes_written)
+            stable = await self._ensure_stable(expected_path, expected_bytes)
+            return await self._build_result(expected_path, stable.size, stable.checksum)
         return None
 
     def _is_valid(self, path: Path) -> bool:
         return path is not None and path.exists() and path.is_file()
 
-    async def _scan_candidates(self, item: DownloadItem) -> CompletionResult | None:
+    async def _scan_candidates(
+        self, item: DownloadItem, expected_bytes: int | None
+    ) -> CompletionResult | None:
         dedupe_key = item.dedupe_key.lower()
         tokens = {
             item.artist.lower(),
             item.title.lower(),
         }
-        for path in self._downloads_dir.iterdir():
-            if not path.is_file():
-                continue
-            name = path.name.lower()
-            if dedupe_key in name or all(token in name for token in tokens):
-                bytes_written = await self._ensure_stable(path)
-                return await self._build_result(path, bytes_written)
-        return None
 
-    async def _ensure_stable(self, path: Path) -> int:
+        def _find() -> Path | None:
+            for path in self._downloads_dir.iterdir():
+                if not path.is_file():
+                    continue
+                name = path.name.lower()
+                if dedupe_key in name or all(token in name for token in tokens):
+                    return path
+            return None
+
+        match = await run_blocking(self._executors, METADATA_POOL, _find)
+        if match is None:
+            return None
+        stable = await self._ensure_stable(match, expected_bytes)
+        return await self._build_result(match, stable.size, stable.checksum)
+
+    async def _ensure_stable(self, path: Path, expected_bytes: int | None = None) -> StableFile:
         stable_since: float | None = None
         last_size: int | None = None
+        checksum = StreamingChecksum(path)
         while True:
             try:
-                stat = await asyncio.to_thread(path.stat)
+                stat = await run_blocking(self._executors, METADATA_POOL, path.stat)
+                size = int(stat.st_size)
+                await run_blocking(self._executors, METADATA_POOL, checksum.update, size)
             except FileNotFoundError:
                 stable_since = None
                 last_size = None
                 await asyncio.sleep(self._poll_interval)
                 continue
-            size = int(stat.st_size)
+            if expected_bytes and size == expected_bytes and checksum.offset == size:
+                return StableFile(size=size, checksum=checksum.hexdigest())
             now = time.monotonic()
             if last_size == size and size > 0:
                 if stable_since is None:
                     stable_since = now
-                elif now - stable_since >= self._size_stable_seconds:
-                    return size
+                elif (
+                    now - stable_since >= self._size_stable_seconds
+                    and checksum.offset == size
+                ):
+                    return StableFile(size=size, checksum=checksum.hexdigest())
             else:
                 stable_since = now if size > 0 else None
                 last_size = size
@@ -188,9 +277,48 @@ class DownloadCompletionMonitor:
     async def ensure_stable(self, path: Path) -> int:
         """Public wrapper that waits for the file size to stabilise."""
 
-        return await self._ensure_stable(path)
+        stable = await self._ensure_stable(path)
+        return stable.size
+
+    async def verify_stable(self, path: Path, *, expected_bytes: int | None = None) -> StableFile:
+        """Wait for *path* to stabilise and checksum it.
+
+        *expected_bytes* short-cuts the wait and must only be passed for a
+        transfer known to have finished (see :meth:`wait_for_completion`).
+        """
+
+        return await self._ensure_stable(path, expected_bytes)
 
-    async def _build_result(self, path: Path, bytes_written: int) -> CompletionResult:
+    async def checksum(self, path: Path) -> str:
+        """Hash *path* in full on the metadata pool."""
+
+        return await run_blocking(self._executors, METADATA_POOL, file_checksum, path)
+
+    async def _build_result(
+        self, path: Path, bytes_written: int, checksum: str | None = None
+    ) -> CompletionResult:
+        if not self._inspect_metadata:
+            # The tagging step parses the file and reports codec/duration.
+            return CompletionResult(
+                path=path,
+                bytes_written=bytes_written,
+                codec=None,
+                duration_seconds=None,
+                checksum=checksum,
+            )
+        return await run_blocking(
+            self._executors,
+            METADATA_POOL,
+            self._build_result_sync,
+            path,
+            bytes_written,
+            checksum,
+        )
+
+    @staticmethod
+    def _build_result_sync(
+        path: Path, bytes_written: int, checksum: str | None = None
+    ) -> CompletionResult:
         codec: str | None = None
         duration: float | None = None
         try:
@@ -212,6 +340,7 @@ class DownloadCompletionMonitor:
             bytes_written=bytes_written,
             codec=codec,
             duration_seconds=duration,
+            checksum=checksum,
         )
 
 
@@ -234,10 +363,14 @@ def build_item_event(name: str, **meta: object) -> ItemEvent:
 
 
 __all__ = [
+    "CHECKSUM_ALGORITHM",
     "CompletionEventBus",
     "CompletionResult",
     "DownloadCompletionEvent",
     "DownloadCompletionMonitor",
+    "StableFile",
+    "StreamingChecksum",
     "build_item_event",
+    "file_checksum",
     "record_detection_event",
 ]
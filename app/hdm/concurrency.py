@@ -0,0 +1,209 @@
+"""Adaptive worker concurrency for the HDM orchestrator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import math
+import time
+from typing import Any
+
+from app.logging import get_logger
+from app.utils.metrics import counter, gauge
+
+logger = get_logger("hdm.concurrency")
+
+_TARGET_GAUGE: Any
+_ACTIVE_GAUGE: Any
+_ADJUSTMENT_COUNTER: Any
+
+
+def register_metrics() -> None:
+    global _TARGET_GAUGE
+    global _ACTIVE_GAUGE
+    global _ADJUSTMENT_COUNTER
+
+    _TARGET_GAUGE = gauge(
+        "hdm_worker_concurrency_target",
+        "Number of HDM workers currently allowed to process items",
+    )
+    _ACTIVE_GAUGE = gauge(
+        "hdm_worker_concurrency_active",
+        "Number of HDM workers currently processing an item",
+    )
+    _ADJUSTMENT_COUNTER = counter(
+        "hdm_worker_concurrency_adjustments_total",
+        "Adaptive HDM concurrency adjustments grouped by direction and reason",
+        label_names=("direction", "reason"),
+    )
+
+
+register_metrics()
+
+
+class AdaptiveConcurrencyController:
+    """AIMD controller deciding how many HDM workers may run at once.
+
+    Observations are evaluated in windows of ``window_size`` completed
+    attempts. A window with a retryable error rate above
+    ``error_rate_threshold`` or a mean latency above ``latency_tolerance``
+    times the best observed window shrinks the target multiplicatively; a
+    healthy window grows it by one. ``retry_after`` hints shrink the target
+    immediately and block growth until the hint has elapsed. With
+    ``min_workers == max_workers`` the controller is a fixed-size gate.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_workers: int,
+        max_workers: int,
+        initial_workers: int | None = None,
+        window_size: int = 20,
+        error_rate_threshold: float = 0.1,
+        latency_tolerance: float = 1.5,
+        decrease_factor: float = 0.7,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if min_workers <= 0:
+            raise ValueError("min_workers must be positive")
+        if max_workers < min_workers:
+            raise ValueError("max_workers must be >= min_workers")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self._min = int(min_workers)
+        self._max = int(max_workers)
+        initial = initial_workers if initial_workers is not None else self._min
+        self._target = min(self._max, max(self._min, int(initial)))
+        self._window_size = max(1, int(window_size))
+        self._error_rate_threshold = max(0.0, float(error_rate_threshold))
+        self._latency_tolerance = max(1.0, float(latency_tolerance))
+        self._decrease_factor = float(decrease_factor)
+        self._clock = clock
+        self._condition = asyncio.Condition()
+        self._active = 0
+        self._window_successes = 0
+        self._window_retries = 0
+        self._window_latency = 0.0
+        self._baseline_latency: float | None = None
+        self._hold_until = 0.0
+        _TARGET_GAUGE.set(self._target)
+        _ACTIVE_GAUGE.set(0)
+
+    @property
+    def target(self) -> int:
+        return self._target
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def min_workers(self) -> int:
+        return self._min
+
+    @property
+    def max_workers(self) -> int:
+        return self._max
+
+    @property
+    def adaptive(self) -> bool:
+        return self._max > self._min
+
+    async def acquire(self) -> None:
+        """Wait until a worker slot is available under the current target."""
+
+        async with self._condition:
+            while self._active >= self._target:
+                await self._condition.wait()
+            self._active += 1
+        _ACTIVE_GAUGE.set(self._active)
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._active = max(0, self._active - 1)
+            self._condition.notify()
+        _ACTIVE_GAUGE.set(self._active)
+
+    async def record_success(self, latency_seconds: float) -> None:
+        self._window_successes += 1
+        self._window_latency += max(0.0, float(latency_seconds))
+        await self._apply(self._maybe_evaluate())
+
+    async def record_retry(self, retry_after_seconds: float | None) -> None:
+        self._window_retries += 1
+        if retry_after_seconds is not None and retry_after_seconds > 0:
+            self._hold_until = max(self._hold_until, self._clock() + retry_after_seconds)
+            self._reset_window()
+            await self._apply(self._decrease("retry_after"))
+            return
+        await self._apply(self._maybe_evaluate())
+
+    async def _apply(self, grew: bool) -> None:
+        if not grew:
+            return
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _maybe_evaluate(self) -> bool:
+        observed = self._window_successes + self._window_retries
+        if observed < self._window_size:
+            return False
+        error_rate = self._window_retries / observed
+        mean_latency: float | None = None
+        if self._window_successes:
+            mean_latency = self._window_latency / self._window_successes
+        self._reset_window()
+
+        if error_rate > self._error_rate_threshold:
+            return self._decrease("errors")
+        if mean_latency is not None:
+            baseline = self._baseline_latency
+            if baseline is None or mean_latency < baseline:
+                self._baseline_latency = mean_latency
+            elif mean_latency > baseline * self._latency_tolerance:
+                # Let the baseline drift upwards slowly so a permanently slower
+                # host does not pin the controller at its minimum.
+                self._baseline_latency = baseline * 0.9 + mean_latency * 0.1
+                return self._decrease("latency")
+        if self._clock() < self._hold_until:
+            return False
+        return self._increase()
+
+    def _reset_window(self) -> None:
+        self._window_successes = 0
+        self._window_retries = 0
+        self._window_latency = 0.0
+
+    def _increase(self) -> bool:
+        if self._target >= self._max:
+            return False
+        self._set_target(self._target + 1, direction="up", reason="healthy")
+        return True
+
+    def _decrease(self, reason: str) -> bool:
+        if self._target <= self._min:
+            return False
+        reduced = max(self._min, int(math.floor(self._target * self._decrease_factor)))
+        if reduced == self._target:
+            reduced = max(self._min, self._target - 1)
+        self._set_target(reduced, direction="down", reason=reason)
+        return False
+
+    def _set_target(self, value: int, *, direction: str, reason: str) -> None:
+        previous = self._target
+        self._target = value
+        _TARGET_GAUGE.set(value)
+        _ADJUSTMENT_COUNTER.labels(direction=direction, reason=reason).inc()
+        logger.debug(
+            "HDM worker concurrency adjusted",
+            extra={
+                "event": "hdm.concurrency.adjusted",
+                "previous": previous,
+                "target": value,
+                "reason": reason,
+            },
+        )
+
+
+__all__ = ["AdaptiveConcurrencyController"]
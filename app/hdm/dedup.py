@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import errno
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -11,6 +13,7 @@ from typing import Any
 
 from app.logging import get_logger
 
+from .executors import LOCK_POOL, METADATA_POOL, HdmExecutors, run_blocking
 from .models import DownloadItem
 
 try:  # pragma: no cover - windows fallback
@@ -27,40 +30,189 @@ def _ensure_dir(path: Path) -> Path:
     return path
 
 
+LOCK_MODE_LOCAL = "local"
+LOCK_MODE_FILE = "file"
+_SUPPORTED_LOCK_MODES = frozenset({LOCK_MODE_LOCAL, LOCK_MODE_FILE})
+_STRIPE_PREFIX = "stripe-"
+
+
 @dataclass(slots=True)
-class _DedupLockHandle:
-    """Represents an acquired filesystem lock."""
+class _KeyLockEntry:
+    lock: asyncio.Lock
+    users: int = 0
 
-    path: Path
-    handle: Any
 
-    def release(self) -> None:
-        if fcntl is not None:
-            try:
-                fcntl.flock(self.handle, fcntl.LOCK_UN)
-            except OSError:  # pragma: no cover - defensive unlock failure
-                logger.warning("Failed to release dedupe lock", exc_info=True)
-        try:
-            self.handle.close()
-        except OSError:  # pragma: no cover - defensive close failure
-            logger.warning("Failed to close dedupe lock handle", exc_info=True)
+class _KeyedLockTable:
+    """In-process asyncio locks keyed by dedupe key.
 
+    Entries are reference counted and dropped once the last holder or waiter
+    leaves, so the table only ever contains keys that are currently in use and
+    acquiring a lock costs no syscalls.
+    """
 
-class _AsyncLockContext:
-    """Async context manager wrapping a synchronous lock handle."""
+    def __init__(self) -> None:
+        self._entries: dict[str, _KeyLockEntry] = {}
 
-    def __init__(self, acquire: asyncio.Future[_DedupLockHandle]) -> None:
-        self._acquire_future = acquire
-        self._handle: _DedupLockHandle | None = None
+    def __len__(self) -> int:
+        return len(self._entries)
 
-    async def __aenter__(self) -> _DedupLockHandle:
-        self._handle = await self._acquire_future
-        return self._handle
+    async def acquire(self, key: str) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _KeyLockEntry(lock=asyncio.Lock())
+            self._entries[key] = entry
+        entry.users += 1
+        try:
+            await entry.lock.acquire()
+        except BaseException:
+            self._drop(key, entry)
+            raise
+
+    def release(self, key: str) -> None:
+        entry = self._entries[key]
+        entry.lock.release()
+        self._drop(key, entry)
+
+    def _drop(self, key: str, entry: _KeyLockEntry) -> None:
+        entry.users -= 1
+        if entry.users <= 0:
+            self._entries.pop(key, None)
+
+
+class _FileLockStripes:
+    """Fixed set of lock files shared between processes.
+
+    Keys hash onto ``stripes`` lock files that stay open for the lifetime of
+    the manager. Each stripe is guarded by an asyncio lock as well, because
+    ``flock`` is owned per open file description and would otherwise let two
+    coroutines of the same process share a stripe. The file lock itself is
+    taken with ``LOCK_NB`` and retried with backoff so no thread ever parks
+    inside ``flock``. Stripe files are opened on the lock pool the first
+    time they are used.
+    """
+
+    def __init__(
+        self,
+        locks_dir: Path,
+        *,
+        stripes: int,
+        executors: HdmExecutors | None = None,
+        retry_initial_seconds: float = 0.01,
+        retry_max_seconds: float = 0.5,
+    ) -> None:
+        if stripes <= 0:
+            raise ValueError("lock stripes must be positive")
+        self._locks_dir = locks_dir
+        self._stripes = stripes
+        self._executors = executors
+        self._retry_initial = retry_initial_seconds
+        self._retry_max = retry_max_seconds
+        self._local = [asyncio.Lock() for _ in range(stripes)]
+        self._handles: list[Any | None] = [None] * stripes
+
+    def stripe_for(self, key: str) -> int:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self._stripes
+
+    def path_for(self, stripe: int) -> Path:
+        return self._locks_dir / f"{_STRIPE_PREFIX}{stripe:04d}.lock"
+
+    async def acquire(self, key: str) -> int:
+        stripe = self.stripe_for(key)
+        await self._local[stripe].acquire()
+        try:
+            handle = self._handles[stripe]
+            if handle is None:
+                handle = await run_blocking(
+                    self._executors, LOCK_POOL, self._open_stripe, stripe
+                )
+                self._handles[stripe] = handle
+            delay = self._retry_initial
+            while not self._try_lock(handle):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._retry_max)
+        except BaseException:
+            self._local[stripe].release()
+            raise
+        return stripe
+
+    def release(self, stripe: int) -> None:
+        handle = self._handles[stripe]
+        try:
+            if handle is not None and fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+        except OSError:  # pragma: no cover - defensive unlock failure
+            logger.warning("Failed to release dedupe lock stripe", exc_info=True)
+        finally:
+            self._local[stripe].release()
+
+    def close(self) -> None:
+        for index, handle in enumerate(self._handles):
+            if handle is None:
+                continue
+            try:
+                handle.close()
+            except OSError:  # pragma: no cover - defensive close failure
+                logger.warning("Failed to close dedupe lock stripe", exc_info=True)
+            self._handles[index] = None
+
+    def _open_stripe(self, stripe: int) -> Any:
+        return self.path_for(stripe).open("a+b")
+
+    @staticmethod
+    def _try_lock(handle: Any) -> bool:
+        if fcntl is None:  # pragma: no cover - Windows fallback best effort
+            return True
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        except OSError as exc:
+            if exc.errno in (errno.EAGAIN, errno.EACCES):
+                return False
+            raise
+        return True
+
+    def is_stripe_file(self, path: Path) -> bool:
+        name = path.name
+        if not name.startswith(_STRIPE_PREFIX) or not name.endswith(".lock"):
+            return False
+        index = name[len(_STRIPE_PREFIX) : -len(".lock")]
+        return index.isdigit() and int(index) < self._stripes
+
+
+class _DedupLockContext:
+    """Async context manager holding the dedupe lock for a single key."""
+
+    def __init__(self, manager: DeduplicationManager, dedupe_key: str) -> None:
+        self._manager = manager
+        self._key = dedupe_key
+        self._stripe: int | None = None
+        self._held = False
+
+    async def __aenter__(self) -> _DedupLockContext:
+        await self._manager._keys.acquire(self._key)
+        self._held = True
+        stripes = self._manager._stripes
+        if stripes is not None:
+            try:
+                self._stripe = await stripes.acquire(self._key)
+            except BaseException:
+                self._release()
+                raise
+        return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        if self._handle is not None:
-            await asyncio.to_thread(self._handle.release)
-            self._handle = None
+        self._release()
+
+    def _release(self) -> None:
+        stripes = self._manager._stripes
+        if self._stripe is not None and stripes is not None:
+            stripes.release(self._stripe)
+            self._stripe = None
+        if self._held:
+            self._manager._keys.release(self._key)
+            self._held = False
 
 
 class DeduplicationManager:
@@ -72,37 +224,78 @@ class DeduplicationManager:
         music_dir: Path,
         state_dir: Path,
         move_template: str,
+        executors: HdmExecutors | None = None,
+        lock_mode: str = LOCK_MODE_LOCAL,
+        lock_stripes: int = 64,
     ) -> None:
+        if lock_mode not in _SUPPORTED_LOCK_MODES:
+            raise ValueError(f"Unsupported dedupe lock mode: {lock_mode}")
         self._music_dir = music_dir
         self._state_dir = _ensure_dir(state_dir)
         self._locks_dir = _ensure_dir(self._state_dir / "locks")
         self._index_path = self._state_dir / "dedupe_index.json"
         self._index_lock = asyncio.Lock()
         self._move_template = move_template
+        self._executors = executors
+        self._keys = _KeyedLockTable()
+        self._stripes: _FileLockStripes | None = None
+        if lock_mode == LOCK_MODE_FILE:
+            self._stripes = _FileLockStripes(
+                self._locks_dir, stripes=lock_stripes, executors=executors
+            )
 
     # ------------------------------------------------------------------
     # Locking helpers
     # ------------------------------------------------------------------
-    async def acquire_lock(self, item: DownloadItem) -> _AsyncLockContext:
-        """Acquire a process-wide lock for the given *item* dedupe key."""
-
-        key = item.dedupe_key
-        future: asyncio.Future[_DedupLockHandle] = asyncio.ensure_future(
-            asyncio.to_thread(self._acquire_lock_sync, key)
-        )
-        return _AsyncLockContext(future)
-
-    def _acquire_lock_sync(self, dedupe_key: str) -> _DedupLockHandle:
-        lock_path = self._locks_dir / f"{dedupe_key}.lock"
-        handle = lock_path.open("a+b")
-        if fcntl is not None:
-            fcntl.flock(handle, fcntl.LOCK_EX)
-        else:  # pragma: no cover - Windows fallback best effort
+    async def acquire_lock(self, item: DownloadItem) -> _DedupLockContext:
+        """Return a lock context serialising work on the *item* dedupe key.
+
+        In ``local`` mode this only coordinates coroutines of the current
+        process; ``file`` mode additionally takes a striped lock file so that
+        several processes sharing the same library stay serialised.
+        """
+
+        return _DedupLockContext(self, item.dedupe_key)
+
+    async def cleanup_stale_locks(self) -> int:
+        """Remove lock files that are no longer part of the active layout.
+
+        Older releases created one ``<dedupe_key>.lock`` file per item. Those
+        files (and stripe files beyond the configured stripe count) are removed
+        unless another process still holds them.
+        """
+
+        removed = await run_blocking(self._executors, LOCK_POOL, self._cleanup_stale_locks_sync)
+        if removed:
+            logger.info(
+                "Removed stale dedupe lock files",
+                extra={"event": "hdm.dedup.locks_cleaned", "removed": removed},
+            )
+        return removed
+
+    def _cleanup_stale_locks_sync(self) -> int:
+        removed = 0
+        for path in self._locks_dir.glob("*.lock"):
+            if self._stripes is not None and self._stripes.is_stripe_file(path):
+                continue
             try:
-                os.lockf(handle.fileno(), os.F_LOCK, 0)
-            except OSError:
-                logger.warning("Failed to lock %s", lock_path, exc_info=True)
-        return _DedupLockHandle(path=lock_path, handle=handle)
+                with path.open("a+b") as handle:
+                    if fcntl is not None:
+                        try:
+                            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        except OSError:
+                            continue
+                    path.unlink(missing_ok=True)
+                    removed += 1
+            except OSError:  # pragma: no cover - defensive cleanup failure
+                logger.debug("Failed to remove stale lock %s", path, exc_info=True)
+        return removed
+
+    def close(self) -> None:
+        """Close any lock files held open by the manager."""
+
+        if self._stripes is not None:
+            self._stripes.close()
 
     # ------------------------------------------------------------------
     # Index helpers
@@ -125,7 +318,7 @@ class DeduplicationManager:
     async def _load_index(self) -> dict[str, str]:
         if not self._index_path.exists():
             return {}
-        return await asyncio.to_thread(self._read_index_sync)
+        return await run_blocking(self._executors, METADATA_POOL, self._read_index_sync)
 
     def _read_index_sync(self) -> dict[str, str]:
         try:
@@ -137,7 +330,7 @@ class DeduplicationManager:
         return {str(key): str(value) for key, value in data.items()}
 
     async def _write_index(self, data: dict[str, str]) -> None:
-        await asyncio.to_thread(self._write_index_sync, data)
+        await run_blocking(self._executors, METADATA_POOL, self._write_index_sync, data)
 
     def _write_index_sync(self, data: dict[str, str]) -> None:
         tmp = self._index_path.with_suffix(".tmp")
@@ -151,13 +344,14 @@ class DeduplicationManager:
     # Destination resolution
     # ------------------------------------------------------------------
     def plan_destination(self, item: DownloadItem, source_path: Path) -> Path:
-        """Resolve the final library path for *item* based on the template."""
+        """Resolve the final library path for *item* based on the template.
+
+        Only the path is computed; the mover creates missing directories.
+        """
 
         metadata = self._build_metadata(item, source_path)
         relative = self._render_template(metadata)
-        destination = self._music_dir / relative
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        return destination
+        return self._music_dir / relative
 
     def _render_template(self, metadata: dict[str, str]) -> Path:
         try:
@@ -183,4 +377,4 @@ class DeduplicationManager:
         }
 
 
-__all__ = ["DeduplicationManager"]
+__all__ = ["DeduplicationManager", "LOCK_MODE_FILE", "LOCK_MODE_LOCAL"]
@@ -0,0 +1,315 @@
+"""Dedicated thread pools for blocking HDM file operations."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import functools
+import multiprocessing
+import threading
+import time
+from typing import Any, TypeVar
+
+from app.logging import get_logger
+from app.utils.metrics import gauge, histogram
+
+logger = get_logger("hdm.executors")
+
+_T = TypeVar("_T")
+
+LOCK_POOL = "locks"
+METADATA_POOL = "metadata"
+COPY_POOL = "copy"
+PROCESS_POOL = "process"
+
+_WAIT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+_QUEUE_DEPTH: Any
+_ACTIVE_TASKS: Any
+_WAIT_SECONDS: Any
+_RUN_SECONDS: Any
+
+
+def register_metrics() -> None:
+    global _QUEUE_DEPTH
+    global _ACTIVE_TASKS
+    global _WAIT_SECONDS
+    global _RUN_SECONDS
+
+    _QUEUE_DEPTH = gauge(
+        "hdm_executor_queue_depth",
+        "Blocking HDM tasks waiting for a free executor thread",
+        label_names=("pool",),
+    )
+    _ACTIVE_TASKS = gauge(
+        "hdm_executor_active_tasks",
+        "Blocking HDM tasks currently running on an executor thread",
+        label_names=("pool",),
+    )
+    _WAIT_SECONDS = histogram(
+        "hdm_executor_wait_seconds",
+        "Time blocking HDM tasks spent queued before a thread picked them up",
+        label_names=("pool",),
+        buckets=_WAIT_BUCKETS,
+    )
+    _RUN_SECONDS = histogram(
+        "hdm_executor_run_seconds",
+        "Time blocking HDM tasks spent running on an executor thread",
+        label_names=("pool",),
+    )
+
+
+register_metrics()
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutorPoolStats:
+    """Point-in-time view of a single executor pool."""
+
+    name: str
+    max_workers: int
+    queued: int
+    active: int
+    completed: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class _InstrumentedPool:
+    """Thread pool that tracks queue depth and queue wait time."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        if max_workers <= 0:
+            raise ValueError(f"{name} executor requires at least one worker")
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"hdm-{name}",
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+        _QUEUE_DEPTH.labels(pool=self.name).inc()
+        call = functools.partial(self._invoke, submitted, func, *args, **kwargs)
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self._abandon()
+            raise
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Work cancelled before a thread picked it up never reaches
+            # ``_invoke``; keep the queue depth honest.
+            future.cancel()
+            if future.cancelled():
+                self._abandon()
+            raise
+
+    def _abandon(self) -> None:
+        with self._lock:
+            self._queued -= 1
+        _QUEUE_DEPTH.labels(pool=self.name).dec()
+
+    def _invoke(
+        self,
+        submitted: float,
+        func: Callable[..., _T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> _T:
+        started = time.perf_counter()
+        waited = started - submitted
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait += waited
+            if waited > self._max_wait:
+                self._max_wait = waited
+        _QUEUE_DEPTH.labels(pool=self.name).dec()
+        _ACTIVE_TASKS.labels(pool=self.name).inc()
+        _WAIT_SECONDS.labels(pool=self.name).observe(waited)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+            _ACTIVE_TASKS.labels(pool=self.name).dec()
+            _RUN_SECONDS.labels(pool=self.name).observe(elapsed)
+
+    def stats(self) -> ExecutorPoolStats:
+        with self._lock:
+            return ExecutorPoolStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                queued=self._queued,
+                active=self._active,
+                completed=self._completed,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+    def shutdown(self, *, wait: bool) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class HdmExecutors:
+    """Own the thread pools HDM uses for blocking filesystem work.
+
+    Splitting locking, metadata parsing and bulk copies into separately sized
+    pools keeps blocked ``flock`` calls or long cross-device copies from
+    starving the default executor that the rest of the application relies on.
+    An optional process pool (``process_workers > 0``) takes CPU-heavy work
+    such as tagging large containers; it is only started on first use.
+    """
+
+    def __init__(
+        self,
+        *,
+        lock_workers: int = 4,
+        metadata_workers: int = 4,
+        copy_workers: int = 2,
+        process_workers: int = 0,
+    ) -> None:
+        self._pools: dict[str, _InstrumentedPool] = {
+            LOCK_POOL: _InstrumentedPool(LOCK_POOL, lock_workers),
+            METADATA_POOL: _InstrumentedPool(METADATA_POOL, metadata_workers),
+            COPY_POOL: _InstrumentedPool(COPY_POOL, copy_workers),
+        }
+        self._process_workers = max(0, int(process_workers))
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_in_flight = 0
+        self._closed = False
+
+    @property
+    def has_process_pool(self) -> bool:
+        return self._process_workers > 0 and not self._closed
+
+    async def run_process(self, func: Callable[..., _T], /, *args: Any) -> _T:
+        """Run the picklable *func* in the process pool.
+
+        Falls back to the metadata thread pool when no process pool is
+        configured.
+        """
+
+        if not self.has_process_pool:
+            return await self.run(METADATA_POOL, func, *args)
+        if self._process_pool is None:
+            # ``forkserver`` avoids forking a process that already runs
+            # threads and an event loop.
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._process_workers,
+                mp_context=multiprocessing.get_context(method),
+            )
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        self._track_process_submit()
+        try:
+            return await loop.run_in_executor(self._process_pool, func, *args)
+        except BrokenProcessPool:
+            logger.warning(
+                "HDM process pool broke; running on the metadata pool instead",
+                extra={"event": "hdm.executors.process_pool_broken"},
+                exc_info=True,
+            )
+            broken, self._process_pool = self._process_pool, None
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+        finally:
+            self._track_process_done()
+            _RUN_SECONDS.labels(pool=PROCESS_POOL).observe(time.perf_counter() - started)
+        return await self.run(METADATA_POOL, func, *args)
+
+    # The pool starts tasks in submission order on its worker processes, so
+    # of the tasks in flight the first ``process_workers`` are running and
+    # only the rest are queued.
+
+    def _track_process_submit(self) -> None:
+        self._process_in_flight += 1
+        if self._process_in_flight <= self._process_workers:
+            _ACTIVE_TASKS.labels(pool=PROCESS_POOL).inc()
+        else:
+            _QUEUE_DEPTH.labels(pool=PROCESS_POOL).inc()
+
+    def _track_process_done(self) -> None:
+        self._process_in_flight -= 1
+        if self._process_in_flight >= self._process_workers:
+            # A queued task took the freed worker.
+            _QUEUE_DEPTH.labels(pool=PROCESS_POOL).dec()
+        else:
+            _ACTIVE_TASKS.labels(pool=PROCESS_POOL).dec()
+
+    async def run(
+        self,
+        pool: str,
+        func: Callable[..., _T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> _T:
+        """Run *func* on the named *pool* and return its result."""
+
+        if self._closed:
+            raise RuntimeError("HDM executors have been shut down")
+        try:
+            executor = self._pools[pool]
+        except KeyError as exc:
+            raise ValueError(f"Unknown HDM executor pool: {pool}") from exc
+        return await executor.run(func, *args, **kwargs)
+
+    def stats(self) -> dict[str, ExecutorPoolStats]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait, cancel_futures=True)
+            self._process_pool = None
+        logger.info("HDM executors stopped", extra={"event": "hdm.executors.stopped"})
+
+
+async def run_blocking(
+    executors: HdmExecutors | None,
+    pool: str,
+    func: Callable[..., _T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> _T:
+    """Run *func* on *pool* when executors are configured, else via ``to_thread``."""
+
+    if executors is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return await executors.run(pool, func, *args, **kwargs)
+
+
+__all__ = [
+    "COPY_POOL",
+    "ExecutorPoolStats",
+    "HdmExecutors",
+    "LOCK_POOL",
+    "METADATA_POOL",
+    "PROCESS_POOL",
+    "run_blocking",
+]
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 from dataclasses import dataclass
 from pathlib import Path
 import sqlite3
 import time
-from typing import TypeVar
+from typing import Any, TypeVar
+import uuid
 
 from app.logging import get_logger
+from app.utils.metrics import counter, histogram
 
 from .models import DownloadItem
 
@@ -22,13 +26,30 @@ CREATE TABLE IF NOT EXISTS idempotency_keys (
     key TEXT PRIMARY KEY,
     status TEXT NOT NULL,
     created_at REAL NOT NULL,
-    updated_at REAL NOT NULL
+    updated_at REAL NOT NULL,
+    owner TEXT
 )
 """
 
+SQLITE_CREATE_OWNERS_TABLE = """
+CREATE TABLE IF NOT EXISTS idempotency_owners (
+    owner TEXT PRIMARY KEY,
+    heartbeat_at REAL NOT NULL
+)
+"""
+
+SQLITE_ADD_OWNER_COLUMN = "ALTER TABLE idempotency_keys ADD COLUMN owner TEXT"
+
+SQLITE_HEARTBEAT = """
+INSERT OR REPLACE INTO idempotency_owners (owner, heartbeat_at)
+VALUES (?, ?)
+"""
+
+SQLITE_UNREGISTER = "DELETE FROM idempotency_owners WHERE owner = ?"
+
 SQLITE_INSERT = """
-INSERT OR IGNORE INTO idempotency_keys (key, status, created_at, updated_at)
-VALUES (?, 'in_progress', ?, ?)
+INSERT OR IGNORE INTO idempotency_keys (key, status, created_at, updated_at, owner)
+VALUES (?, 'in_progress', ?, ?, ?)
 """
 
 SQLITE_SELECT = "SELECT status FROM idempotency_keys WHERE key = ?"
@@ -41,10 +62,67 @@ WHERE key = ?
 
 SQLITE_DELETE = "DELETE FROM idempotency_keys WHERE key = ?"
 
+# Reservations written before owners were recorded have no owner and are
+# treated as orphaned.
+_SQLITE_ORPHANED = """
+status = 'in_progress' AND (
+    owner IS NULL
+    OR owner NOT IN (SELECT owner FROM idempotency_owners WHERE heartbeat_at >= ?)
+)
+"""
+
+SQLITE_TAKEOVER = f"""
+UPDATE idempotency_keys
+SET created_at = ?, updated_at = ?, owner = ?
+WHERE key = ? AND {_SQLITE_ORPHANED}
+"""
+
+SQLITE_RECOVER = f"DELETE FROM idempotency_keys WHERE {_SQLITE_ORPHANED}"
+
+SQLITE_PURGE_OWNERS = "DELETE FROM idempotency_owners WHERE heartbeat_at < ?"
+
+DEFAULT_OWNER_TIMEOUT_SECONDS = 300.0
+
 _RETRYABLE_ERROR_FRAGMENTS: tuple[str, ...] = ("locked", "busy")
 
 _T = TypeVar("_T")
 
+_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+_OPERATION_SECONDS: Any
+_OPERATION_KEYS: Any
+
+
+def register_metrics() -> None:
+    global _OPERATION_SECONDS
+    global _OPERATION_KEYS
+
+    _OPERATION_SECONDS = histogram(
+        "hdm_idempotency_operation_seconds",
+        "Latency of HDM idempotency reservations and releases",
+        label_names=("operation",),
+        buckets=_LATENCY_BUCKETS,
+    )
+    _OPERATION_KEYS = counter(
+        "hdm_idempotency_keys_total",
+        "Idempotency keys handled by HDM reservation and release operations",
+        label_names=("operation",),
+    )
+
+
+register_metrics()
+
 
 @dataclass(slots=True)
 class IdempotencyReservation:
@@ -68,6 +146,20 @@ class IdempotencyStore:
     ) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
+    async def reserve_many(self, items: Sequence[DownloadItem]) -> list[IdempotencyReservation]:
+        """Reserve *items* in order; stores may override to batch the work."""
+
+        return [await self.reserve(item) for item in items]
+
+    async def release_many(self, items: Sequence[DownloadItem], *, success: bool) -> None:
+        """Release *items*; stores may override to batch the work."""
+
+        for item in items:
+            await self.release(item, success=success)
+
+    async def close(self) -> None:
+        """Release resources held by the store."""
+
 
 class InMemoryIdempotencyStore(IdempotencyStore):
     """Simple in-memory idempotency store suitable for tests and local runs."""
@@ -78,33 +170,61 @@ class InMemoryIdempotencyStore(IdempotencyStore):
         self._completed: set[str] = set()
 
     async def reserve(self, item: DownloadItem) -> IdempotencyReservation:
-        key = item.dedupe_key
+        return (await self.reserve_many([item]))[0]
+
+    async def reserve_many(self, items: Sequence[DownloadItem]) -> list[IdempotencyReservation]:
+        results: list[IdempotencyReservation] = []
         async with self._lock:
-            if key in self._completed:
-                return IdempotencyReservation(
-                    acquired=False,
-                    already_processed=True,
-                    reason="already_completed",
-                )
-            if key in self._in_progress:
-                return IdempotencyReservation(
-                    acquired=False,
-                    already_processed=False,
-                    reason="in_progress",
-                )
-            self._in_progress.add(key)
-        return IdempotencyReservation(acquired=True, already_processed=False)
+            for item in items:
+                key = item.dedupe_key
+                if key in self._completed:
+                    results.append(
+                        IdempotencyReservation(
+                            acquired=False,
+                            already_processed=True,
+                            reason="already_completed",
+                        )
+                    )
+                elif key in self._in_progress:
+                    results.append(
+                        IdempotencyReservation(
+                            acquired=False,
+                            already_processed=False,
+                            reason="in_progress",
+                        )
+                    )
+                else:
+                    self._in_progress.add(key)
+                    results.append(IdempotencyReservation(acquired=True, already_processed=False))
+        return results
 
     async def release(self, item: DownloadItem, *, success: bool) -> None:
-        key = item.dedupe_key
+        await self.release_many([item], success=success)
+
+    async def release_many(self, items: Sequence[DownloadItem], *, success: bool) -> None:
         async with self._lock:
-            self._in_progress.discard(key)
-            if success:
-                self._completed.add(key)
+            for item in items:
+                key = item.dedupe_key
+                self._in_progress.discard(key)
+                if success:
+                    self._completed.add(key)
 
 
 class SQLiteIdempotencyStore(IdempotencyStore):
-    """SQLite backed idempotency store with retry-aware operations."""
+    """SQLite backed idempotency store with retry-aware operations.
+
+    A single long-lived connection is owned by a dedicated thread, so every
+    operation skips connection setup and all writes are naturally serialised.
+
+    Whole batches are reserved up front, so a crash leaves every queued key
+    ``in_progress``. Each reservation records the store that made it, and
+    every store refreshes a heartbeat row while it is open. A reservation
+    whose owner has not sent a heartbeat for ``owner_timeout_seconds`` is
+    orphaned: it can be re-acquired, and with ``recover_on_start`` the first
+    operation deletes all orphaned reservations. Reservations of a running
+    store are never touched, however long its queue is, even when several
+    processes share the database file.
+    """
 
     def __init__(
         self,
@@ -114,6 +234,8 @@ class SQLiteIdempotencyStore(IdempotencyStore):
         retry_base_seconds: float = 0.05,
         retry_multiplier: float = 2.0,
         connect_timeout: float = 1.0,
+        owner_timeout_seconds: float = DEFAULT_OWNER_TIMEOUT_SECONDS,
+        recover_on_start: bool = True,
     ) -> None:
         if max_attempts <= 0:
             raise ValueError("max_attempts must be positive")
@@ -123,80 +245,138 @@ class SQLiteIdempotencyStore(IdempotencyStore):
             raise ValueError("retry_multiplier must be at least 1")
         if connect_timeout <= 0:
             raise ValueError("connect_timeout must be positive")
+        if owner_timeout_seconds <= 0:
+            raise ValueError("owner_timeout_seconds must be positive")
         self._path = Path(path).expanduser()
         self._max_attempts = int(max_attempts)
         self._retry_base_seconds = float(retry_base_seconds)
         self._retry_multiplier = float(retry_multiplier)
         self._connect_timeout = float(connect_timeout)
+        self._owner_timeout = float(owner_timeout_seconds)
+        self._heartbeat_interval = self._owner_timeout / 5
+        self._recover_on_start = recover_on_start
+        self._owner = uuid.uuid4().hex
+        self._heartbeat: asyncio.Task[None] | None = None
         self._initialised = False
         self._init_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hdm-idempotency")
+        self._connection: sqlite3.Connection | None = None
 
     async def reserve(self, item: DownloadItem) -> IdempotencyReservation:
+        return (await self._reserve_keys([item.dedupe_key], operation="reserve"))[0]
+
+    async def reserve_many(self, items: Sequence[DownloadItem]) -> list[IdempotencyReservation]:
+        if not items:
+            return []
+        keys = [item.dedupe_key for item in items]
+        return await self._reserve_keys(keys, operation="reserve_many")
+
+    async def release(self, item: DownloadItem, *, success: bool) -> None:
+        await self._release_keys([item.dedupe_key], success=success, operation="release")
+
+    async def release_many(self, items: Sequence[DownloadItem], *, success: bool) -> None:
+        if not items:
+            return
+        keys = [item.dedupe_key for item in items]
+        await self._release_keys(keys, success=success, operation="release_many")
+
+    async def close(self) -> None:
+        heartbeat, self._heartbeat = self._heartbeat, None
+        if heartbeat is not None:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+        loop = asyncio.get_running_loop()
+        try:
+            if self._initialised:
+                # Anything still reserved was interrupted; let others take it.
+                await loop.run_in_executor(
+                    self._executor, self._run_with_connection, self._unregister
+                )
+            await loop.run_in_executor(self._executor, self._close_connection)
+        except RuntimeError:  # pragma: no cover - executor already shut down
+            pass
+        except sqlite3.Error:
+            logger.warning("Failed to unregister idempotency owner", exc_info=True)
+            await loop.run_in_executor(self._executor, self._close_connection)
+        self._executor.shutdown(wait=True)
+        self._initialised = False
+
+    async def _reserve_keys(
+        self, keys: Sequence[str], *, operation: str
+    ) -> list[IdempotencyReservation]:
         await self._ensure_initialised()
-        key = item.dedupe_key
 
-        def _operation(connection: sqlite3.Connection) -> IdempotencyReservation:
+        def _operation(connection: sqlite3.Connection) -> list[IdempotencyReservation]:
             connection.execute("BEGIN IMMEDIATE")
             try:
                 now = time.time()
-                cursor = connection.execute(SQLITE_INSERT, (key, now, now))
-                if cursor.rowcount == 1:
-                    connection.commit()
-                    return IdempotencyReservation(acquired=True, already_processed=False)
-                cursor = connection.execute(SQLITE_SELECT, (key,))
-                row = cursor.fetchone()
+                alive_since = now - self._owner_timeout
+                owner = self._owner
+                results: list[IdempotencyReservation] = []
+                for key in keys:
+                    cursor = connection.execute(SQLITE_INSERT, (key, now, now, owner))
+                    if cursor.rowcount == 0:
+                        cursor = connection.execute(
+                            SQLITE_TAKEOVER, (now, now, owner, key, alive_since)
+                        )
+                    if cursor.rowcount == 1:
+                        results.append(
+                            IdempotencyReservation(acquired=True, already_processed=False)
+                        )
+                        continue
+                    row = connection.execute(SQLITE_SELECT, (key,)).fetchone()
+                    results.append(_reservation_from_row(row))
                 connection.commit()
             except Exception:
                 connection.rollback()
                 raise
-            if row is None:
-                return IdempotencyReservation(
-                    acquired=False,
-                    already_processed=False,
-                    reason="in_progress",
-                )
-            if hasattr(row, "keys"):
-                raw_status = row["status"]
-            else:
-                raw_status = row[0]
-            status = str(raw_status)
-            already_processed = status == "completed"
-            reason = "already_completed" if already_processed else "in_progress"
-            return IdempotencyReservation(
-                acquired=False,
-                already_processed=already_processed,
-                reason=reason,
-            )
-
-        return await self._execute_with_retry(_operation)
+            return results
 
-    async def release(self, item: DownloadItem, *, success: bool) -> None:
+        return await self._timed(operation, len(keys), _operation)
+
+    async def _release_keys(self, keys: Sequence[str], *, success: bool, operation: str) -> None:
         await self._ensure_initialised()
-        key = item.dedupe_key
 
         def _operation(connection: sqlite3.Connection) -> None:
             connection.execute("BEGIN IMMEDIATE")
             try:
                 now = time.time()
                 if success:
-                    connection.execute(SQLITE_COMPLETE, (now, key))
+                    connection.executemany(SQLITE_COMPLETE, [(now, key) for key in keys])
                 else:
-                    connection.execute(SQLITE_DELETE, (key,))
+                    connection.executemany(SQLITE_DELETE, [(key,) for key in keys])
                 connection.commit()
             except Exception:
                 connection.rollback()
                 raise
 
-        await self._execute_with_retry(_operation)
+        await self._timed(operation, len(keys), _operation)
+
+    async def _timed(
+        self,
+        operation: str,
+        size: int,
+        func: Callable[[sqlite3.Connection], _T],
+    ) -> _T:
+        started = time.perf_counter()
+        try:
+            return await self._execute_with_retry(func)
+        finally:
+            _OPERATION_SECONDS.labels(operation=operation).observe(time.perf_counter() - started)
+            _OPERATION_KEYS.labels(operation=operation).inc(size)
 
     async def _execute_with_retry(self, operation: Callable[[sqlite3.Connection], _T]) -> _T:
+        loop = asyncio.get_running_loop()
         attempt = 0
         delay = self._retry_base_seconds
         last_error: Exception | None = None
         while attempt < self._max_attempts:
             attempt += 1
             try:
-                return await asyncio.to_thread(self._run_with_connection, operation)
+                return await loop.run_in_executor(
+                    self._executor, self._run_with_connection, operation
+                )
             except sqlite3.OperationalError as exc:
                 last_error = exc
                 message = str(exc).lower()
@@ -224,16 +404,39 @@ class SQLiteIdempotencyStore(IdempotencyStore):
         raise last_error
 
     def _run_with_connection(self, operation: Callable[[sqlite3.Connection], _T]) -> _T:
+        connection = self._connection
+        if connection is None:
+            connection = self._open_connection()
+            self._connection = connection
+        try:
+            return operation(connection)
+        except sqlite3.OperationalError as exc:
+            message = str(exc).lower()
+            if not any(fragment in message for fragment in _RETRYABLE_ERROR_FRAGMENTS):
+                # Reconnect on the next call in case the handle is unusable.
+                self._close_connection()
+            raise
+        except sqlite3.DatabaseError:
+            self._close_connection()
+            raise
+
+    def _open_connection(self) -> sqlite3.Connection:
         connection = sqlite3.connect(
             str(self._path),
             timeout=self._connect_timeout,
             isolation_level=None,
         )
         connection.row_factory = sqlite3.Row
-        try:
-            return operation(connection)
-        finally:
-            connection.close()
+        return connection
+
+    def _close_connection(self) -> None:
+        connection = self._connection
+        self._connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except sqlite3.Error:  # pragma: no cover - defensive close failure
+                logger.debug("Failed to close idempotency connection", exc_info=True)
 
     async def _ensure_initialised(self) -> None:
         if self._initialised:
@@ -242,23 +445,78 @@ class SQLiteIdempotencyStore(IdempotencyStore):
             if self._initialised:
                 return
             self._path.parent.mkdir(parents=True, exist_ok=True)
+            loop = asyncio.get_running_loop()
             try:
-                await asyncio.to_thread(self._initialise_sync)
+                await loop.run_in_executor(self._executor, self._initialise_sync)
             except Exception:
                 # Ensure `_initialised` remains ``False`` so subsequent attempts retry.
                 raise
             else:
                 self._initialised = True
+                self._heartbeat = loop.create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            try:
+                await self._execute_with_retry(self._beat)
+            except sqlite3.Error:
+                logger.warning(
+                    "Failed to refresh idempotency owner heartbeat",
+                    extra={"event": "hdm.idempotency.heartbeat_failed", "path": str(self._path)},
+                    exc_info=True,
+                )
+
+    def _beat(self, connection: sqlite3.Connection) -> None:
+        connection.execute(SQLITE_HEARTBEAT, (self._owner, time.time()))
+
+    def _unregister(self, connection: sqlite3.Connection) -> None:
+        connection.execute(SQLITE_UNREGISTER, (self._owner,))
 
     def _initialise_sync(self) -> None:
-        connection = sqlite3.connect(
-            str(self._path),
-            timeout=self._connect_timeout,
-            isolation_level=None,
+        connection = self._connection
+        if connection is None:
+            connection = self._open_connection()
+            self._connection = connection
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(SQLITE_CREATE_TABLE)
+        connection.execute(SQLITE_CREATE_OWNERS_TABLE)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(idempotency_keys)")}
+        if "owner" not in columns:
+            connection.execute(SQLITE_ADD_OWNER_COLUMN)
+        now = time.time()
+        self._beat(connection)
+        if self._recover_on_start:
+            alive_since = now - self._owner_timeout
+            recovered = connection.execute(SQLITE_RECOVER, (alive_since,)).rowcount
+            connection.execute(SQLITE_PURGE_OWNERS, (alive_since,))
+            if recovered:
+                logger.info(
+                    "Cleared idempotency reservations left by a previous run",
+                    extra={
+                        "event": "hdm.idempotency.recovered",
+                        "count": recovered,
+                        "path": str(self._path),
+                    },
+                )
+
+
+def _reservation_from_row(row: Any) -> IdempotencyReservation:
+    if row is None:
+        return IdempotencyReservation(
+            acquired=False,
+            already_processed=False,
+            reason="in_progress",
         )
-        try:
-            connection.execute("PRAGMA journal_mode=WAL")
-            connection.execute(SQLITE_CREATE_TABLE)
-            connection.commit()
-        finally:
-            connection.close()
+    if hasattr(row, "keys"):
+        raw_status = row["status"]
+    else:
+        raw_status = row[0]
+    status = str(raw_status)
+    already_processed = status == "completed"
+    reason = "already_completed" if already_processed else "in_progress"
+    return IdempotencyReservation(
+        acquired=False,
+        already_processed=already_processed,
+        reason=reason,
+    )
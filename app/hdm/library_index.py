@@ -0,0 +1,318 @@
+"""Index of the files already present in the music library."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import re
+from typing import Any
+
+from app.logging import get_logger
+from app.utils.text_normalization import clean_track_title, normalise_artist, normalize_unicode
+
+from .executors import METADATA_POOL, HdmExecutors, run_blocking
+from .models import DownloadItem
+
+logger = get_logger("hdm.library_index")
+
+AUDIO_SUFFIXES: frozenset[str] = frozenset(
+    {".aac", ".aiff", ".alac", ".ape", ".flac", ".m4a", ".mp3", ".mp4", ".ogg", ".opus", ".wav"}
+)
+DEFAULT_DURATION_TOLERANCE_SECONDS = 3.0
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+_SNAPSHOT_VERSION = 1
+_BUILD_BATCH_SIZE = 256
+
+
+def _normalise_title(title: str) -> str:
+    cleaned = normalize_unicode(clean_track_title(title))
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", cleaned)).strip()
+
+
+def _normalise_artist(artist: str) -> str:
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", normalise_artist(artist))).strip()
+
+
+def library_key(artist: str, title: str) -> tuple[str, str]:
+    """Return the normalised ``(artist, title)`` pair used to match recordings."""
+
+    return _normalise_artist(artist), _normalise_title(title)
+
+
+@dataclass(slots=True, frozen=True)
+class LibraryEntry:
+    """A single indexed library file."""
+
+    path: str
+    artist: str
+    title: str
+    duration_seconds: float | None
+    mtime_ns: int
+    size: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "artist": self.artist,
+            "title": self.title,
+            "duration_seconds": self.duration_seconds,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, path: str, payload: dict[str, Any]) -> LibraryEntry:
+        duration = payload.get("duration_seconds")
+        return cls(
+            path=path,
+            artist=str(payload.get("artist") or ""),
+            title=str(payload.get("title") or ""),
+            duration_seconds=float(duration) if isinstance(duration, int | float) else None,
+            mtime_ns=int(payload.get("mtime_ns") or 0),
+            size=int(payload.get("size") or 0),
+        )
+
+
+def _read_entry(path: Path, stat: os.stat_result) -> LibraryEntry | None:
+    try:
+        from mutagen import File  # type: ignore
+
+        audio = File(path, easy=True)
+    except Exception:  # pragma: no cover - unreadable file
+        logger.debug("Failed to read library file %s", path, exc_info=True)
+        return None
+    if audio is None or not audio.tags:
+        return None
+    artist = (audio.tags.get("artist") or [""])[0]
+    title = (audio.tags.get("title") or [""])[0]
+    if not artist or not title:
+        return None
+    length = getattr(getattr(audio, "info", None), "length", None)
+    return LibraryEntry(
+        path=str(path),
+        artist=artist,
+        title=title,
+        duration_seconds=float(length) if isinstance(length, int | float) and length else None,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+    )
+
+
+def _first_existing(paths: list[str]) -> tuple[Path | None, list[str]]:
+    """Return the first of *paths* that exists and the missing ones checked before it."""
+
+    missing: list[str] = []
+    for candidate in paths:
+        path = Path(candidate)
+        if path.exists():
+            return path, missing
+        missing.append(candidate)
+    return None, missing
+
+
+class LibraryIndex:
+    """Match requested recordings against files already under the music dir.
+
+    Entries are keyed by the normalised artist and title (see
+    :func:`library_key`); when both sides know the track length, durations
+    must agree within ``duration_tolerance_seconds``. The index is rebuilt
+    incrementally on start: a JSON snapshot caches the parsed tags and only
+    files whose size or mtime changed are opened again. Completed downloads
+    are added through :meth:`record` as they are moved into the library.
+    """
+
+    def __init__(
+        self,
+        music_dir: Path,
+        *,
+        snapshot_path: Path,
+        duration_tolerance_seconds: float = DEFAULT_DURATION_TOLERANCE_SECONDS,
+        executors: HdmExecutors | None = None,
+    ) -> None:
+        self._music_dir = music_dir
+        self._snapshot_path = snapshot_path
+        self._tolerance = max(0.0, float(duration_tolerance_seconds))
+        self._executors = executors
+        self._entries: dict[str, LibraryEntry] = {}
+        self._by_key: dict[tuple[str, str], dict[str, LibraryEntry]] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def build(self) -> int:
+        """Scan the music directory and return the number of indexed files."""
+
+        snapshot = await run_blocking(self._executors, METADATA_POOL, self._load_snapshot)
+        paths = await run_blocking(self._executors, METADATA_POOL, self._list_audio_files)
+        parsed = 0
+        for start in range(0, len(paths), _BUILD_BATCH_SIZE):
+            chunk = paths[start : start + _BUILD_BATCH_SIZE]
+            entries, fresh = await run_blocking(
+                self._executors, METADATA_POOL, self._index_chunk, chunk, snapshot
+            )
+            parsed += fresh
+            for entry in entries:
+                self._add(entry)
+        if parsed or len(snapshot) != len(self._entries):
+            self._dirty = True
+        await self.flush()
+        logger.info(
+            "HDM library index built",
+            extra={
+                "event": "hdm.library_index.built",
+                "files": len(self._entries),
+                "parsed": parsed,
+            },
+        )
+        return len(self._entries)
+
+    async def lookup(self, item: DownloadItem) -> Path | None:
+        """Return an existing library file for *item*, if one is indexed.
+
+        Candidates whose file has disappeared are dropped from the index. The
+        existence checks run on the metadata pool so a slow library mount
+        does not stall the event loop.
+        """
+
+        candidates = self._by_key.get(library_key(item.artist, item.title))
+        if not candidates:
+            return None
+        paths = [
+            entry.path
+            for entry in list(candidates.values())
+            if self._duration_matches(item.duration_seconds, entry.duration_seconds)
+        ]
+        if not paths:
+            return None
+        found, missing = await run_blocking(self._executors, METADATA_POOL, _first_existing, paths)
+        for path in missing:
+            self._remove(path)
+        return found
+
+    async def record(
+        self, item: DownloadItem, path: Path, duration_seconds: float | None
+    ) -> None:
+        """Add a file that was just moved into the library."""
+
+        try:
+            stat = await run_blocking(self._executors, METADATA_POOL, path.stat)
+        except FileNotFoundError:
+            return
+        self._add(
+            LibraryEntry(
+                path=str(path),
+                artist=item.artist,
+                title=item.title,
+                duration_seconds=duration_seconds or item.duration_seconds,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+        )
+        self._dirty = True
+
+    async def flush(self) -> None:
+        """Persist the snapshot if entries changed since the last write."""
+
+        if not self._dirty:
+            return
+        payload = {
+            "version": _SNAPSHOT_VERSION,
+            "entries": {path: entry.to_dict() for path, entry in self._entries.items()},
+        }
+        self._dirty = False
+        await run_blocking(self._executors, METADATA_POOL, self._write_snapshot, payload)
+
+    def _duration_matches(self, requested: float | None, indexed: float | None) -> bool:
+        if not requested or not indexed:
+            return True
+        return abs(requested - indexed) <= self._tolerance
+
+    def _add(self, entry: LibraryEntry) -> None:
+        previous = self._entries.get(entry.path)
+        if previous is not None:
+            self._remove(previous.path)
+        self._entries[entry.path] = entry
+        key = library_key(entry.artist, entry.title)
+        self._by_key.setdefault(key, {})[entry.path] = entry
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        key = library_key(entry.artist, entry.title)
+        bucket = self._by_key.get(key)
+        if bucket is not None:
+            bucket.pop(path, None)
+            if not bucket:
+                self._by_key.pop(key, None)
+        self._dirty = True
+
+    def _list_audio_files(self) -> list[Path]:
+        if not self._music_dir.exists():
+            return []
+        found: list[Path] = []
+        for root, _dirs, files in os.walk(self._music_dir):
+            for name in files:
+                if os.path.splitext(name)[1].lower() in AUDIO_SUFFIXES:
+                    found.append(Path(root) / name)
+        return found
+
+    @staticmethod
+    def _index_chunk(
+        paths: Iterable[Path], snapshot: dict[str, LibraryEntry]
+    ) -> tuple[list[LibraryEntry], int]:
+        entries: list[LibraryEntry] = []
+        parsed = 0
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            cached = snapshot.get(str(path))
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                entries.append(cached)
+                continue
+            parsed += 1
+            entry = _read_entry(path, stat)
+            if entry is not None:
+                entries.append(entry)
+        return entries, parsed
+
+    def _load_snapshot(self) -> dict[str, LibraryEntry]:
+        try:
+            with self._snapshot_path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError):
+            logger.warning("library index snapshot unreadable, rebuilding", exc_info=True)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _SNAPSHOT_VERSION:
+            return {}
+        entries = data.get("entries") or {}
+        return {
+            str(path): LibraryEntry.from_dict(str(path), payload)
+            for path, payload in entries.items()
+            if isinstance(payload, dict)
+        }
+
+    def _write_snapshot(self, payload: dict[str, Any]) -> None:
+        # The snapshot is only a cache of parsed tags; a lost write costs a
+        # re-parse on the next start, so no fsync.
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._snapshot_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        tmp.replace(self._snapshot_path)
+
+
+__all__ = ["LibraryEntry", "LibraryIndex", "library_key"]
@@ -55,6 +55,8 @@ class DownloadBatchRequest:
     batch_id: str | None = None
     priority: int | None = None
     dedupe_key: str | None = None
+    weight: int | None = None
+    interactive: bool | None = None
 
 
 @dataclass(slots=True)
@@ -4,15 +4,19 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import random
 import time
+from typing import Any
 import uuid
 
 from app.logging import get_logger
+from app.utils.metrics import gauge
 
 from .aggregation import DownloadBatchAggregator
+from .concurrency import AdaptiveConcurrencyController
 from .idempotency import IdempotencyStore
+from .library_index import LibraryIndex
 from .models import (
     BatchSummary,
     DownloadBatchRequest,
@@ -38,38 +42,90 @@ class BatchHandle:
         return await self._aggregator.wait_for_summary(self.batch_id)
 
 
+FAST_LANE = "fast"
+BULK_LANE = "bulk"
+
+_QUEUE_DEPTH: Any
+
+
+def register_metrics() -> None:
+    global _QUEUE_DEPTH
+
+    _QUEUE_DEPTH = gauge(
+        "hdm_queue_depth",
+        "HDM items waiting for a worker grouped by scheduling lane",
+        label_names=("lane",),
+    )
+
+
+register_metrics()
+
+
+@dataclass(slots=True)
+class _BatchLane:
+    """Pending items of one batch at one priority level."""
+
+    key: tuple[str, int]
+    weight: int
+    items: deque[DownloadItem] = field(default_factory=deque)
+    credit: int = 0
+
+
 class _RoundRobinQueue:
-    """Round robin queue ensuring fair scheduling across batches."""
+    """Weighted round robin queue with priority levels and a fast lane.
+
+    Items submitted interactively bypass the bulk rotation through a FIFO fast
+    lane; after ``fast_lane_burst`` consecutive fast-lane items one bulk item
+    is served so that imports keep moving. Bulk items are grouped by priority
+    (highest first) and, within a priority, batches take turns serving up to
+    ``weight`` items each (deficit round robin). All operations are O(1) apart
+    from picking the highest non-empty priority level.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, *, fast_lane_burst: int = 4) -> None:
         self._condition = asyncio.Condition()
-        self._queues: dict[str, deque[DownloadItem]] = {}
-        self._order: deque[str] = deque()
+        self._fast: deque[DownloadItem] = deque()
+        self._lanes: dict[tuple[str, int], _BatchLane] = {}
+        self._levels: dict[int, deque[_BatchLane]] = {}
+        self._bulk_size = 0
+        self._fast_lane_burst = max(1, int(fast_lane_burst))
+        self._fast_streak = 0
         self._stopping = False
 
-    async def put(self, item: DownloadItem) -> None:
+    def __len__(self) -> int:
+        return len(self._fast) + self._bulk_size
+
+    async def put(
+        self,
+        item: DownloadItem,
+        *,
+        weight: int = 1,
+        interactive: bool = False,
+    ) -> None:
         async with self._condition:
-            queue = self._queues.setdefault(item.batch_id, deque())
-            queue.append(item)
-            if item.batch_id not in self._order:
-                self._order.append(item.batch_id)
+            if interactive:
+                self._fast.append(item)
+                _QUEUE_DEPTH.labels(lane=FAST_LANE).inc()
+            else:
+                key = (item.batch_id, item.priority)
+                lane = self._lanes.get(key)
+                if lane is None:
+                    lane = _BatchLane(key=key, weight=max(1, int(weight)))
+                    self._lanes[key] = lane
+                    self._levels.setdefault(item.priority, deque()).append(lane)
+                lane.items.append(item)
+                self._bulk_size += 1
+                _QUEUE_DEPTH.labels(lane=BULK_LANE).inc()
             self._condition.notify()
 
     async def get(self) -> DownloadItem | None:
         async with self._condition:
             while True:
-                if self._stopping and not self._order:
-                    return None
-                if self._order:
-                    batch_id = self._order[0]
-                    queue = self._queues[batch_id]
-                    item = queue.popleft()
-                    if queue:
-                        self._order.rotate(-1)
-                    else:
-                        self._order.popleft()
-                        del self._queues[batch_id]
+                item = self._next_item()
+                if item is not None:
                     return item
+                if self._stopping:
+                    return None
                 await self._condition.wait()
 
     async def stop(self) -> None:
@@ -77,6 +133,54 @@ class _RoundRobinQueue:
             self._stopping = True
             self._condition.notify_all()
 
+    def drain(self) -> list[DownloadItem]:
+        """Remove and return every pending item."""
+
+        drained = list(self._fast)
+        self._fast.clear()
+        for priority in sorted(self._levels, reverse=True):
+            for lane in self._levels[priority]:
+                drained.extend(lane.items)
+        self._levels.clear()
+        self._lanes.clear()
+        self._bulk_size = 0
+        self._fast_streak = 0
+        _QUEUE_DEPTH.labels(lane=FAST_LANE).set(0)
+        _QUEUE_DEPTH.labels(lane=BULK_LANE).set(0)
+        return drained
+
+    def _next_item(self) -> DownloadItem | None:
+        serve_fast = bool(self._fast) and (
+            self._fast_streak < self._fast_lane_burst or not self._bulk_size
+        )
+        if serve_fast:
+            self._fast_streak += 1
+            _QUEUE_DEPTH.labels(lane=FAST_LANE).dec()
+            return self._fast.popleft()
+        self._fast_streak = 0
+        if not self._bulk_size:
+            return None
+        return self._next_bulk_item()
+
+    def _next_bulk_item(self) -> DownloadItem:
+        priority = max(self._levels)
+        rotation = self._levels[priority]
+        lane = rotation[0]
+        if lane.credit <= 0:
+            lane.credit = lane.weight
+        item = lane.items.popleft()
+        lane.credit -= 1
+        self._bulk_size -= 1
+        _QUEUE_DEPTH.labels(lane=BULK_LANE).dec()
+        if not lane.items:
+            rotation.popleft()
+            del self._lanes[lane.key]
+            if not rotation:
+                del self._levels[priority]
+        elif lane.credit <= 0:
+            rotation.rotate(-1)
+        return item
+
 
 class HdmOrchestrator:
     """Coordinate download, enrichment, and move jobs with bounded concurrency."""
@@ -92,6 +196,10 @@ class HdmOrchestrator:
         retry_base_seconds: float = 0.5,
         retry_jitter_pct: float = 0.2,
         rng: random.Random | None = None,
+        min_worker_concurrency: int | None = None,
+        max_worker_concurrency: int | None = None,
+        library_index: LibraryIndex | None = None,
+        fast_lane_burst: int = 4,
     ) -> None:
         if worker_concurrency <= 0:
             raise ValueError("worker_concurrency must be positive")
@@ -101,14 +209,21 @@ class HdmOrchestrator:
             raise ValueError("batch_max_items must be positive")
         self._pipeline = pipeline
         self._idempotency = idempotency_store
-        self._worker_concurrency = worker_concurrency
+        self._library = library_index
+        minimum = min_worker_concurrency or worker_concurrency
+        maximum = max(max_worker_concurrency or worker_concurrency, minimum)
+        self._concurrency = AdaptiveConcurrencyController(
+            min_workers=minimum,
+            max_workers=maximum,
+            initial_workers=worker_concurrency,
+        )
         self._max_retries = max_retries
         self._batch_max_items = batch_max_items
         self._retry_base_seconds = max(0.01, float(retry_base_seconds))
         self._retry_jitter_pct = max(0.0, float(retry_jitter_pct))
         self._rng = rng or random.Random()
         self._aggregator = DownloadBatchAggregator()
-        self._queue = _RoundRobinQueue()
+        self._queue = _RoundRobinQueue(fast_lane_burst=fast_lane_burst)
         self._workers: list[asyncio.Task[None]] = []
         self._started = False
         self._start_lock = asyncio.Lock()
@@ -123,7 +238,7 @@ class HdmOrchestrator:
                 return
             self._workers = [
                 asyncio.create_task(self._worker_loop(index))
-                for index in range(self._worker_concurrency)
+                for index in range(self._concurrency.max_workers)
             ]
             self._started = True
 
@@ -139,11 +254,23 @@ class HdmOrchestrator:
                 continue
         self._workers.clear()
         self._started = False
+        pending = self._queue.drain()
+        if pending:
+            # Queued items hold reservations taken at submission time.
+            await self._idempotency.release_many(pending, success=False)
+
+    @property
+    def concurrency(self) -> AdaptiveConcurrencyController:
+        return self._concurrency
 
     async def submit_single(self, item: DownloadRequestItem) -> BatchHandle:
         if not item.requested_by:
             raise ValueError("requested_by is required for single submissions")
-        request = DownloadBatchRequest(items=[item], requested_by=item.requested_by)
+        request = DownloadBatchRequest(
+            items=[item],
+            requested_by=item.requested_by,
+            interactive=True,
+        )
         return await self.submit_batch(request)
 
     async def submit_batch(self, request: DownloadBatchRequest) -> BatchHandle:
@@ -160,15 +287,43 @@ class HdmOrchestrator:
             self._normalise_item(batch_id, request, index, item)
             for index, item in enumerate(request.items)
         ]
+        interactive = (
+            request.interactive if request.interactive is not None else len(normalised) == 1
+        )
+        weight = max(1, int(request.weight)) if request.weight else 1
         await self.start()
         state = self._aggregator.create_batch(
             batch_id,
             requested_by=request.requested_by,
             total=len(normalised),
         )
+        # Recordings already in the library never reach the network: they are
+        # reported as duplicates before an idempotency key is reserved.
+        to_reserve: list[DownloadItem] = []
         for item in normalised:
+            existing = await self._library.lookup(item) if self._library is not None else None
+            if existing is None:
+                to_reserve.append(item)
+                continue
+            await self._aggregator.record_duplicate(
+                state,
+                item,
+                reason="library_match",
+                already_processed=True,
+                final_path=existing,
+            )
+        reservations = await self._idempotency.reserve_many(to_reserve)
+        for item, reservation in zip(to_reserve, reservations):
+            if not reservation.acquired:
+                await self._aggregator.record_duplicate(
+                    state,
+                    item,
+                    reason=reservation.reason or "duplicate",
+                    already_processed=reservation.already_processed,
+                )
+                continue
             await self._aggregator.record_queued(state, item)
-            await self._queue.put(item)
+            await self._queue.put(item, weight=weight, interactive=interactive)
         return BatchHandle(
             batch_id=batch_id,
             items_total=len(normalised),
@@ -179,10 +334,14 @@ class HdmOrchestrator:
     async def _worker_loop(self, worker_index: int) -> None:
         try:
             while True:
-                item = await self._queue.get()
-                if item is None:
-                    return
-                await self._process_item(item)
+                await self._concurrency.acquire()
+                try:
+                    item = await self._queue.get()
+                    if item is None:
+                        return
+                    await self._process_item(item)
+                finally:
+                    await self._concurrency.release()
         except asyncio.CancelledError:
             return
         except Exception:  # pragma: no cover - defensive guard
@@ -192,17 +351,9 @@ class HdmOrchestrator:
             )
 
     async def _process_item(self, item: DownloadItem) -> None:
-        reservation = await self._idempotency.reserve(item)
-        state = self._aggregator.get_batch(item.batch_id)
-        if not reservation.acquired:
-            await self._aggregator.record_duplicate(
-                state,
-                item,
-                reason=reservation.reason or "duplicate",
-                already_processed=reservation.already_processed,
-            )
-            return
+        """Process *item*, whose idempotency key was reserved on submission."""
 
+        state = self._aggregator.get_batch(item.batch_id)
         attempt = 1
         success = False
         try:
@@ -215,6 +366,7 @@ class HdmOrchestrator:
                     raise
                 except RetryableDownloadError as retryable:
                     processing_seconds = time.monotonic() - start
+                    await self._concurrency.record_retry(retryable.retry_after_seconds)
                     await self._aggregator.record_retry(
                         state,
                         item,
@@ -260,6 +412,7 @@ class HdmOrchestrator:
                     if outcome.events:
                         events.extend(outcome.events)
                     processing_seconds = time.monotonic() - start
+                    await self._concurrency.record_success(processing_seconds)
                     await self._aggregator.record_success(
                         state,
                         item,
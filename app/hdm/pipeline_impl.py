@@ -2,25 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any
 
 from app.integrations.slskd_client import (
+    SlskdDownloadEvent,
     SlskdDownloadStatus,
     SlskdHttpClient,
+    SlskdTransferHub,
 )
 
 from .completion import (
+    CompletionResult,
     DownloadCompletionMonitor,
     build_item_event,
     record_detection_event,
 )
 from .dedup import DeduplicationManager
+from .executors import COPY_POOL, METADATA_POOL, HdmExecutors, run_blocking
+from .library_index import LibraryIndex
 from .models import DownloadOutcome, DownloadWorkItem
 from .move import AtomicFileMover
 from .pipeline import DownloadPipeline, DownloadPipelineError, RetryableDownloadError
-from .recovery import SidecarStore
+from .recovery import DownloadSidecar, SidecarStore
 from .tagging import AudioTagger
 
 
@@ -37,6 +43,9 @@ class DefaultDownloadPipeline(DownloadPipeline):
         sidecars: SidecarStore,
         slskd_client: SlskdHttpClient | None = None,
         status_poll_interval: float = 1.0,
+        executors: HdmExecutors | None = None,
+        library_index: LibraryIndex | None = None,
+        transfer_hub: SlskdTransferHub | None = None,
     ) -> None:
         self._completion = completion_monitor
         self._tagger = tagger
@@ -45,6 +54,9 @@ class DefaultDownloadPipeline(DownloadPipeline):
         self._sidecars = sidecars
         self._slskd = slskd_client
         self._status_poll_interval = max(0.25, float(status_poll_interval))
+        self._executors = executors
+        self._library = library_index
+        self._transfers = transfer_hub
 
     async def execute(self, work_item: DownloadWorkItem) -> DownloadOutcome:  # type: ignore[override]
         item = work_item.item
@@ -68,21 +80,11 @@ class DefaultDownloadPipeline(DownloadPipeline):
                     events=(build_item_event("dedupe.skip", final_path=str(existing)),),
                 )
 
-            if self._slskd is not None:
-                await self._follow_remote_download(work_item, sidecar)
+            completion = await self._reuse_verified_download(work_item, sidecar)
+            if completion is None:
+                completion = await self._download(work_item, sidecar)
 
-            expected_path = Path(sidecar.source_path) if sidecar.source_path else None
-            completion = await self._completion.wait_for_completion(
-                work_item, expected_path=expected_path
-            )
-            record_detection_event(
-                work_item, path=completion.path, bytes_written=completion.bytes_written
-            )
-            sidecar.mark(status="downloaded", source_path=completion.path)
-            sidecar.bytes_written = completion.bytes_written
-            await self._sidecars.save(sidecar)
-
-            tagging = self._tagger.apply_tags(completion.path, item)
+            tagging = await self._tagger.process(completion.path, item)
             if tagging.applied:
                 work_item.record_event(
                     "tagging.completed",
@@ -95,7 +97,9 @@ class DefaultDownloadPipeline(DownloadPipeline):
                 work_item.record_event("tagging.skipped")
 
             destination = self._deduper.plan_destination(item, completion.path)
-            final_path = self._mover.move(completion.path, destination)
+            final_path = await run_blocking(
+                self._executors, COPY_POOL, self._mover.move, completion.path, destination
+            )
             work_item.record_event(
                 "file.moved",
                 meta={
@@ -108,7 +112,9 @@ class DefaultDownloadPipeline(DownloadPipeline):
             await self._sidecars.save(sidecar)
 
             duration = tagging.duration_seconds or completion.duration_seconds
-            quality = _format_quality(tagging.codec, tagging.bitrate)
+            if self._library is not None:
+                await self._library.record(item, final_path, duration)
+            quality = _format_quality(tagging.codec or completion.codec, tagging.bitrate)
             events = (
                 build_item_event(
                     "tagging.completed" if tagging.applied else "tagging.skipped",
@@ -126,56 +132,143 @@ class DefaultDownloadPipeline(DownloadPipeline):
                 events=events,
             )
 
-    async def _follow_remote_download(self, work_item: DownloadWorkItem, sidecar) -> None:
+    async def _download(
+        self, work_item: DownloadWorkItem, sidecar: DownloadSidecar
+    ) -> CompletionResult:
+        # Only a transfer slskd reported as finished may be accepted on size
+        # alone; otherwise the file must also stop growing, since clients can
+        # preallocate it at full size.
+        finished_bytes: int | None = None
+        if self._slskd is not None:
+            await self._follow_remote_download(work_item, sidecar)
+            finished_bytes = sidecar.expected_bytes
+
+        expected_path = Path(sidecar.source_path) if sidecar.source_path else None
+        completion = await self._completion.wait_for_completion(
+            work_item,
+            expected_path=expected_path,
+            expected_bytes=finished_bytes,
+        )
+        record_detection_event(
+            work_item, path=completion.path, bytes_written=completion.bytes_written
+        )
+        expected_bytes = sidecar.expected_bytes
+        if expected_bytes and completion.bytes_written != expected_bytes:
+            work_item.record_event(
+                "download.size_mismatch",
+                meta={
+                    "path": str(completion.path),
+                    "bytes_written": completion.bytes_written,
+                    "expected_bytes": expected_bytes,
+                },
+            )
+            # The transfer has finished and the file has settled, so a retry
+            # would only find the same file again.
+            relation = "larger" if completion.bytes_written > expected_bytes else "smaller"
+            raise DownloadPipelineError(f"downloaded file is {relation} than reported by slskd")
+        sidecar.record_download(completion.path, completion.bytes_written, completion.checksum)
+        await self._sidecars.save(sidecar)
+        return completion
+
+    async def _reuse_verified_download(
+        self, work_item: DownloadWorkItem, sidecar: DownloadSidecar
+    ) -> CompletionResult | None:
+        """Skip the download when a previous attempt left a file with a matching checksum."""
+
+        source = sidecar.verified_source()
+        if source is None:
+            return None
+        try:
+            checksum = await self._completion.checksum(source)
+        except FileNotFoundError:
+            return None
+        if checksum != sidecar.checksum:
+            work_item.record_event("download.checksum_mismatch", meta={"path": str(source)})
+            sidecar.checksum = None
+            return None
+        bytes_written = sidecar.bytes_written or 0
+        work_item.record_event(
+            "download.verified",
+            meta={"path": str(source), "bytes_written": bytes_written},
+        )
+        return CompletionResult(
+            path=source,
+            bytes_written=bytes_written,
+            codec=None,
+            duration_seconds=None,
+            checksum=checksum,
+        )
+
+    async def _follow_remote_download(
+        self, work_item: DownloadWorkItem, sidecar: DownloadSidecar
+    ) -> None:
         if self._slskd is None:
             return
 
         idempotency_key = work_item.item.dedupe_key
         poll_interval = self._status_poll_interval
 
-        async for event in self._slskd.stream_download_events(
-            idempotency_key, poll_interval=poll_interval
-        ):
-            meta: dict[str, object] = {"download_id": event.download_id}
-            if event.bytes_written is not None:
-                meta["bytes_written"] = event.bytes_written
-            path = event.path
-            if path:
-                meta["path"] = path
-
-            if event.status is SlskdDownloadStatus.ACCEPTED:
-                work_item.record_event("download.accepted", meta=meta)
-                if sidecar.download_id != event.download_id:
+        events: AsyncIterator[SlskdDownloadEvent]
+        if self._transfers is not None:
+            events = self._transfers.subscribe(idempotency_key)
+        else:
+            events = self._slskd.stream_download_events(
+                idempotency_key, poll_interval=poll_interval
+            )
+        async with aclosing(events):
+            async for event in events:
+                meta: dict[str, object] = {"download_id": event.download_id}
+                if event.bytes_written is not None:
+                    meta["bytes_written"] = event.bytes_written
+                if event.expected_bytes is not None:
+                    meta["expected_bytes"] = event.expected_bytes
+                path = event.path
+                if path:
+                    meta["path"] = path
+                expected_changed = bool(
+                    event.expected_bytes and event.expected_bytes != sidecar.expected_bytes
+                )
+                if expected_changed:
+                    sidecar.expected_bytes = event.expected_bytes
+
+                if event.status is SlskdDownloadStatus.ACCEPTED:
+                    work_item.record_event("download.accepted", meta=meta)
+                    if sidecar.download_id != event.download_id or expected_changed:
+                        sidecar.download_id = event.download_id
+                        await self._sidecars.save(sidecar)
+                    continue
+
+                if event.status is SlskdDownloadStatus.IN_PROGRESS:
+                    work_item.record_event("download.in_progress", meta=meta)
+                    if path and sidecar.source_path != path:
+                        sidecar.source_path = path
+                        expected_changed = True
+                    if expected_changed:
+                        await self._sidecars.save(sidecar)
+                    continue
+
+                if event.status is SlskdDownloadStatus.COMPLETED:
+                    work_item.record_event("download.completed", meta=meta)
+                    if path:
+                        sidecar.source_path = path
+                        await self._completion.publish_event(
+                            work_item.item.dedupe_key,
+                            path=Path(path),
+                            bytes_written=event.bytes_written or 0,
+                        )
                     sidecar.download_id = event.download_id
                     await self._sidecars.save(sidecar)
-                continue
+                    return
 
-            if event.status is SlskdDownloadStatus.IN_PROGRESS:
-                work_item.record_event("download.in_progress", meta=meta)
-                continue
-
-            if event.status is SlskdDownloadStatus.COMPLETED:
-                work_item.record_event("download.completed", meta=meta)
-                if path:
-                    sidecar.source_path = path
-                    await self._completion.publish_event(
-                        work_item.item.dedupe_key,
-                        path=Path(path),
-                        bytes_written=event.bytes_written or 0,
-                    )
-                sidecar.download_id = event.download_id
-                await self._sidecars.save(sidecar)
-                return
-
-            if event.status is SlskdDownloadStatus.FAILED:
-                work_item.record_event("download.failed", meta=meta)
-                if event.retryable:
-                    retry_after = _retry_after_seconds(event.payload)
-                    raise RetryableDownloadError(
-                        "slskd reported retryable download failure",
-                        retry_after_seconds=retry_after,
-                    )
-                raise DownloadPipelineError("slskd reported fatal download failure")
+                if event.status is SlskdDownloadStatus.FAILED:
+                    work_item.record_event("download.failed", meta=meta)
+                    if event.retryable:
+                        retry_after = _retry_after_seconds(event.payload)
+                        raise RetryableDownloadError(
+                            "slskd reported retryable download failure",
+                            retry_after_seconds=retry_after,
+                        )
+                    raise DownloadPipelineError("slskd reported fatal download failure")
 
         raise DownloadPipelineError("slskd download stream terminated unexpectedly")
 
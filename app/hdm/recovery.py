@@ -3,23 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 import json
 import os
 from pathlib import Path
+from typing import Any, TypeVar
 
 from app.logging import get_logger
 
 from .completion import (
+    CHECKSUM_ALGORITHM,
     CompletionEventBus,
     DownloadCompletionEvent,
     DownloadCompletionMonitor,
 )
+from .executors import METADATA_POOL, HdmExecutors, run_blocking
 from .models import DownloadItem
 
 logger = get_logger("hdm.recovery")
 
+_T = TypeVar("_T")
+
 
 def _now() -> datetime:
     return datetime.now(UTC)
@@ -57,6 +63,8 @@ class DownloadSidecar:
     final_path: str | None = None
     bytes_written: int | None = None
     download_id: str | None = None
+    expected_bytes: int | None = None
+    checksum: str | None = None
     updated_at: datetime = field(default_factory=_now)
 
     def to_dict(self) -> dict[str, object]:
@@ -70,6 +78,9 @@ class DownloadSidecar:
             "final_path": self.final_path,
             "bytes_written": self.bytes_written,
             "download_id": self.download_id,
+            "expected_bytes": self.expected_bytes,
+            "checksum": self.checksum,
+            "checksum_algorithm": CHECKSUM_ALGORITHM if self.checksum else None,
             "updated_at": self.updated_at.isoformat(),
         }
 
@@ -86,6 +97,10 @@ class DownloadSidecar:
         attempt_value = _coerce_int(payload.get("attempt"), default=1)
         attempt = attempt_value if attempt_value and attempt_value > 0 else 1
         bytes_written_value = _coerce_int(payload.get("bytes_written"))
+        checksum = payload.get("checksum")
+        if payload.get("checksum_algorithm") != CHECKSUM_ALGORITHM:
+            # Digests from another algorithm cannot be compared; drop them.
+            checksum = None
         return cls(
             path=path,
             batch_id=str(payload.get("batch_id")),
@@ -97,6 +112,8 @@ class DownloadSidecar:
             final_path=str(payload.get("final_path")) if payload.get("final_path") else None,
             bytes_written=bytes_written_value,
             download_id=str(payload.get("download_id")) if payload.get("download_id") else None,
+            expected_bytes=_coerce_int(payload.get("expected_bytes")),
+            checksum=str(checksum) if checksum else None,
             updated_at=updated,
         )
 
@@ -106,6 +123,20 @@ class DownloadSidecar:
             self.source_path = str(source_path)
         self.updated_at = _now()
 
+    def record_download(self, path: Path, bytes_written: int, checksum: str | None) -> None:
+        """Mark the source file as fully downloaded with its content checksum."""
+
+        self.mark(status="downloaded", source_path=path)
+        self.bytes_written = bytes_written
+        self.checksum = checksum
+
+    def verified_source(self) -> Path | None:
+        """Return the source path if a previous attempt recorded a checksum for it."""
+
+        if self.status != "downloaded" or not self.source_path or not self.checksum:
+            return None
+        return Path(self.source_path)
+
     def set_final(self, path: Path, bytes_written: int) -> None:
         self.final_path = str(path)
         self.bytes_written = bytes_written
@@ -116,8 +147,9 @@ class DownloadSidecar:
 class SidecarStore:
     """Manage persistence of :class:`DownloadSidecar` entries."""
 
-    def __init__(self, base_dir: Path) -> None:
+    def __init__(self, base_dir: Path, *, executors: HdmExecutors | None = None) -> None:
         self._dir = base_dir
+        self._executors = executors
         self._dir.mkdir(parents=True, exist_ok=True)
         self._locks: dict[Path, asyncio.Lock] = {}
         self._global_lock = asyncio.Lock()
@@ -130,7 +162,7 @@ class SidecarStore:
         lock = await self._lock_for(path)
         async with lock:
             if path.exists():
-                payload = await asyncio.to_thread(self._read_json, path)
+                payload = await self._run(self._read_json, path)
                 sidecar = DownloadSidecar.from_dict(path, payload)
             else:
                 sidecar = DownloadSidecar(
@@ -140,26 +172,29 @@ class SidecarStore:
                     dedupe_key=item.dedupe_key,
                     attempt=attempt,
                 )
-                await asyncio.to_thread(self._write_json, path, sidecar.to_dict())
+                await self._run(self._write_json, path, sidecar.to_dict())
         return sidecar
 
     async def save(self, sidecar: DownloadSidecar) -> None:
         lock = await self._lock_for(sidecar.path)
         async with lock:
-            await asyncio.to_thread(self._write_json, sidecar.path, sidecar.to_dict())
+            await self._run(self._write_json, sidecar.path, sidecar.to_dict())
 
     async def iter_active(self) -> list[DownloadSidecar]:
-        entries = await asyncio.to_thread(list, self._dir.glob("*.json"))
+        entries = await self._run(list, self._dir.glob("*.json"))
         result: list[DownloadSidecar] = []
         for entry in entries:
             try:
-                payload = await asyncio.to_thread(self._read_json, entry)
+                payload = await self._run(self._read_json, entry)
             except json.JSONDecodeError:  # pragma: no cover - corrupted sidecar
                 logger.warning("Corrupted sidecar %s", entry)
                 continue
             result.append(DownloadSidecar.from_dict(entry, payload))
         return result
 
+    async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        return await run_blocking(self._executors, METADATA_POOL, func, *args)
+
     async def _lock_for(self, path: Path) -> asyncio.Lock:
         async with self._global_lock:
             lock = self._locks.get(path)
@@ -249,10 +284,35 @@ class HdmRecovery:
             path = Path(sidecar.source_path)
             if not path.exists():
                 continue
-            bytes_written = await self._monitor.ensure_stable(path)
+            # The transfer state is unknown here, so the file must stop growing
+            # before it is trusted, even if it already has the expected size.
+            stable = await self._monitor.verify_stable(path)
+            if sidecar.expected_bytes and stable.size < sidecar.expected_bytes:
+                # A partial file is left alone rather than published.
+                logger.info(
+                    "HDM recovery found a partial download",
+                    extra={
+                        "event": "hdm.recovery.partial",
+                        "path": str(path),
+                        "bytes_written": stable.size,
+                        "expected_bytes": sidecar.expected_bytes,
+                    },
+                )
+                continue
+            if sidecar.checksum and stable.checksum != sidecar.checksum:
+                logger.warning(
+                    "HDM recovery checksum mismatch",
+                    extra={
+                        "event": "hdm.recovery.checksum_mismatch",
+                        "path": str(path),
+                        "expected": sidecar.checksum,
+                        "actual": stable.checksum,
+                    },
+                )
+                continue
             event = DownloadCompletionEvent(
                 path=path,
-                bytes_written=bytes_written,
+                bytes_written=stable.size,
                 timestamp=_now(),
             )
             await self._bus.publish(sidecar.dedupe_key, event)
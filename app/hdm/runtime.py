@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
+
 from app.config import HdmConfig, SoulseekConfig
-from app.integrations.slskd_client import SlskdHttpClient
+from app.integrations.slskd_client import SlskdHttpClient, SlskdTransferHub
 
 from .completion import CompletionEventBus, DownloadCompletionMonitor
 from .dedup import DeduplicationManager
+from .executors import HdmExecutors
 from .idempotency import (
     IdempotencyStore,
     InMemoryIdempotencyStore,
     SQLiteIdempotencyStore,
 )
+from .library_index import LibraryIndex
 from .move import AtomicFileMover
 from .orchestrator import HdmOrchestrator
 from .pipeline import DownloadPipeline
@@ -31,10 +36,62 @@ class HdmRuntime:
     pipeline: DownloadPipeline
     idempotency_store: IdempotencyStore
     recovery: HdmRecovery
-
-
-def build_hdm_runtime(config: HdmConfig, soulseek: SoulseekConfig) -> HdmRuntime:
-    """Initialise HDM components using the supplied configuration."""
+    executors: HdmExecutors
+    deduper: DeduplicationManager
+    library_index: LibraryIndex | None = None
+    library_task: asyncio.Task[int] | None = None
+    slskd_client: SlskdHttpClient | None = None
+    transfer_hub: SlskdTransferHub | None = None
+
+    async def start(self) -> None:
+        """Clean up stale state and start the orchestrator and recovery loop.
+
+        The library index is built in the background; until it finishes,
+        lookups simply miss and items fall through to the regular dedupe.
+        """
+
+        await self.deduper.cleanup_stale_locks()
+        if self.library_index is not None and self.library_task is None:
+            self.library_task = asyncio.create_task(self.library_index.build())
+        await self.orchestrator.start()
+        await self.recovery.start()
+
+    async def shutdown(self) -> None:
+        """Stop background tasks and release the dedicated I/O executors."""
+
+        await self.orchestrator.shutdown()
+        await self.recovery.shutdown()
+        if self.transfer_hub is not None:
+            await self.transfer_hub.aclose()
+        if self.slskd_client is not None:
+            await self.slskd_client.aclose()
+        if self.library_task is not None:
+            self.library_task.cancel()
+            try:
+                await self.library_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:  # pragma: no cover - logged by the build itself
+                pass
+            self.library_task = None
+        if self.library_index is not None:
+            await self.library_index.flush()
+        await self.idempotency_store.close()
+        self.deduper.close()
+        self.executors.shutdown(wait=False)
+
+
+def build_hdm_runtime(
+    config: HdmConfig,
+    soulseek: SoulseekConfig,
+    *,
+    slskd_transport: httpx.AsyncBaseTransport | None = None,
+) -> HdmRuntime:
+    """Initialise HDM components using the supplied configuration.
+
+    ``slskd_transport`` replaces the network transport of the slskd client,
+    e.g. with the in-process stand-in used by :mod:`app.hdm.benchmark`.
+    """
 
     downloads_dir = Path(config.downloads_dir).expanduser().resolve()
     music_dir = Path(config.music_dir).expanduser().resolve()
@@ -42,29 +99,50 @@ def build_hdm_runtime(config: HdmConfig, soulseek: SoulseekConfig) -> HdmRuntime
     downloads_dir.mkdir(parents=True, exist_ok=True)
     music_dir.mkdir(parents=True, exist_ok=True)
     state_dir = downloads_dir / ".harmony"
-    sidecar_store = SidecarStore(state_dir / "sidecars")
+    executors = HdmExecutors(
+        lock_workers=config.io_lock_workers,
+        metadata_workers=config.io_metadata_workers,
+        copy_workers=config.io_copy_workers,
+        process_workers=config.tag_process_workers,
+    )
+    sidecar_store = SidecarStore(state_dir / "sidecars", executors=executors)
     event_bus = CompletionEventBus()
     completion_monitor = DownloadCompletionMonitor(
         downloads_dir=downloads_dir,
         size_stable_seconds=config.size_stable_seconds,
         event_bus=event_bus,
+        executors=executors,
+        inspect_metadata=False,
     )
-    tagger = AudioTagger()
+    tagger = AudioTagger(executors=executors)
     mover = AtomicFileMover()
     deduper = DeduplicationManager(
         music_dir=music_dir,
         state_dir=state_dir,
         move_template=config.move_template,
+        executors=executors,
+        lock_mode=config.dedupe_lock_mode,
+        lock_stripes=config.dedupe_lock_stripes,
     )
 
+    library_index: LibraryIndex | None = None
+    if config.library_index_enabled:
+        library_index = LibraryIndex(
+            music_dir,
+            snapshot_path=state_dir / "library_index.json",
+            executors=executors,
+        )
+
     slskd_client = SlskdHttpClient(
         base_url=soulseek.base_url,
         api_key=soulseek.api_key,
+        transport=slskd_transport,
         timeout_ms=config.slskd_timeout_seconds * 1000,
         max_attempts=max(1, config.max_retries),
         backoff_base_ms=soulseek.retry_backoff_base_ms,
         jitter_pct=int(round(soulseek.retry_jitter_pct)),
     )
+    transfer_hub = SlskdTransferHub(slskd_client, poll_interval=1.0)
 
     pipeline: DownloadPipeline = DefaultDownloadPipeline(
         completion_monitor=completion_monitor,
@@ -74,6 +152,9 @@ def build_hdm_runtime(config: HdmConfig, soulseek: SoulseekConfig) -> HdmRuntime
         sidecars=sidecar_store,
         slskd_client=slskd_client,
         status_poll_interval=1.0,
+        executors=executors,
+        library_index=library_index,
+        transfer_hub=transfer_hub,
     )
 
     if config.idempotency_backend == "sqlite":
@@ -87,6 +168,10 @@ def build_hdm_runtime(config: HdmConfig, soulseek: SoulseekConfig) -> HdmRuntime
         worker_concurrency=config.worker_concurrency,
         max_retries=config.max_retries,
         batch_max_items=config.batch_max_items,
+        min_worker_concurrency=config.worker_concurrency_min or None,
+        max_worker_concurrency=config.worker_concurrency_max or None,
+        library_index=library_index,
+        fast_lane_burst=config.fast_lane_burst,
     )
     recovery = HdmRecovery(
         size_stable_seconds=config.size_stable_seconds,
@@ -100,6 +185,11 @@ def build_hdm_runtime(config: HdmConfig, soulseek: SoulseekConfig) -> HdmRuntime
         pipeline=pipeline,
         idempotency_store=idempotency_store,
         recovery=recovery,
+        executors=executors,
+        deduper=deduper,
+        library_index=library_index,
+        slskd_client=slskd_client,
+        transfer_hub=transfer_hub,
     )
 
 
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from app.logging import get_logger
 
+from .executors import METADATA_POOL, HdmExecutors, run_blocking
 from .models import DownloadItem
 
 logger = get_logger("hdm.tagging")
 
+# Containers whose tag parsing/saving is CPU-bound enough to be worth the
+# process hop (large FLAC metadata blocks, MP4 atom trees).
+PROCESS_POOL_SUFFIXES: frozenset[str] = frozenset({".flac", ".m4a", ".mp4", ".alac", ".ape"})
+
 
 @dataclass(slots=True)
 class TaggingResult:
@@ -22,58 +29,126 @@ class TaggingResult:
     duration_seconds: float | None = None
 
 
-class AudioTagger:
-    """Apply simple metadata tags using :mod:`mutagen`."""
-
-    def apply_tags(self, path: Path, item: DownloadItem) -> TaggingResult:
-        try:
-            from mutagen import File  # type: ignore
-        except Exception as exc:  # pragma: no cover - mutagen import failure
-            logger.warning("mutagen unavailable: %s", exc)
-            return TaggingResult(applied=False)
-
-        audio = File(path, easy=True)
-        if audio is None:
-            logger.info(
-                "Unsupported audio file for tagging",
-                extra={
-                    "event": "hdm.tagging.unsupported",
-                    "path": str(path),
-                },
-            )
-            return TaggingResult(applied=False)
-
-        audio["artist"] = [item.artist]
-        audio["title"] = [item.title]
-        if item.album:
-            audio["album"] = [item.album]
-        if item.duration_seconds:
-            audio["length"] = [str(item.duration_seconds)]
-        if item.isrc:
-            audio["isrc"] = [item.isrc]
+def build_tag_values(item: DownloadItem) -> dict[str, list[str]]:
+    """Return the easy-mode tag mapping written for *item*."""
+
+    tags: dict[str, list[str]] = {
+        "artist": [item.artist],
+        "title": [item.title],
+    }
+    if item.album:
+        tags["album"] = [item.album]
+    if item.duration_seconds:
+        tags["length"] = [str(item.duration_seconds)]
+    if item.isrc:
+        tags["isrc"] = [item.isrc]
+    return tags
+
+
+def inspect_and_tag(path: str | Path, tags: Mapping[str, list[str]]) -> TaggingResult:
+    """Parse *path* once, write *tags* and return the stream information.
+
+    Kept at module level (and free of non-picklable arguments) so it can run
+    inside a process pool.
+    """
+
+    try:
+        from mutagen import File  # type: ignore
+    except Exception as exc:  # pragma: no cover - mutagen import failure
+        logger.warning("mutagen unavailable: %s", exc)
+        return TaggingResult(applied=False)
+
+    audio = File(path, easy=True)
+    if audio is None:
+        logger.info(
+            "Unsupported audio file for tagging",
+            extra={
+                "event": "hdm.tagging.unsupported",
+                "path": str(path),
+            },
+        )
+        return TaggingResult(applied=False)
 
+    codec, bitrate, duration_seconds = _stream_info(audio)
+    applied = True
+    try:
+        for key, values in tags.items():
+            audio[key] = list(values)
         audio.save()
-
-        codec: str | None = None
-        bitrate: int | None = None
-        duration_seconds: float | None = None
-
-        info = getattr(audio, "info", None)
-        if info is not None:
-            codec = getattr(info, "codec", None) or getattr(info, "mime", [None])[0]
-            bitrate_value = getattr(info, "bitrate", None)
-            if isinstance(bitrate_value, int | float):
-                bitrate = int(round(bitrate_value / 1000)) if bitrate_value else None
-            duration_value = getattr(info, "length", None)
-            if isinstance(duration_value, int | float):
-                duration_seconds = float(duration_value)
-
-        return TaggingResult(
-            applied=True,
-            codec=codec,
-            bitrate=bitrate,
-            duration_seconds=duration_seconds,
+    except Exception as exc:
+        # The stream information is still valid; report it so the pipeline
+        # can record codec and duration for an untaggable file.
+        logger.warning(
+            "Failed to write tags",
+            extra={"event": "hdm.tagging.failed", "path": str(path), "error": str(exc)},
         )
+        applied = False
+
+    return TaggingResult(
+        applied=applied,
+        codec=codec,
+        bitrate=bitrate,
+        duration_seconds=duration_seconds,
+    )
+
+
+def _stream_info(audio: Any) -> tuple[str | None, int | None, float | None]:
+    codec: str | None = None
+    bitrate: int | None = None
+    duration_seconds: float | None = None
 
+    info = getattr(audio, "info", None)
+    if info is not None:
+        codec = getattr(info, "codec", None) or getattr(info, "mime", [None])[0]
+        bitrate_value = getattr(info, "bitrate", None)
+        if isinstance(bitrate_value, int | float):
+            bitrate = int(round(bitrate_value / 1000)) if bitrate_value else None
+        duration_value = getattr(info, "length", None)
+        if isinstance(duration_value, int | float):
+            duration_seconds = float(duration_value)
+    if codec is None:
+        mime = getattr(audio, "mime", None)
+        if mime:
+            codec = str(mime[0])
+    return codec, bitrate, duration_seconds
 
-__all__ = ["AudioTagger", "TaggingResult"]
+
+class AudioTagger:
+    """Apply simple metadata tags using :mod:`mutagen`.
+
+    Tagging doubles as the metadata inspection step: the file is parsed once
+    and the codec, bitrate and duration are read from the same handle that
+    writes the tags.
+    """
+
+    def __init__(self, *, executors: HdmExecutors | None = None) -> None:
+        self._executors = executors
+
+    def apply_tags(self, path: Path, item: DownloadItem) -> TaggingResult:
+        return inspect_and_tag(path, build_tag_values(item))
+
+    async def process(self, path: Path, item: DownloadItem) -> TaggingResult:
+        """Inspect and tag *path* off the event loop.
+
+        CPU-heavy containers go to the process pool when one is configured;
+        everything else runs on the metadata thread pool.
+        """
+
+        tags = build_tag_values(item)
+        executors = self._executors
+        if (
+            executors is not None
+            and executors.has_process_pool
+            and path.suffix.lower() in PROCESS_POOL_SUFFIXES
+        ):
+            return await executors.run_process(inspect_and_tag, str(path), tags)
+        return await run_blocking(executors, METADATA_POOL, inspect_and_tag, path, tags)
+
+
+__all__ = [
+    "AudioTagger",
+    "PROCESS_POOL_SUFFIXES",
+    "TaggingResult",
+    "build_tag_values",
+    "inspect_and_tag",
+]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -97,18 +97,52 @@ def _overall_status(reports: Sequence[ProviderHealth]) -> str:
     return "ok"
 
 
+def _apply_resilience(
+    report: ProviderHealth, resilience: Mapping[str, Mapping[str, Any]]
+) -> ProviderHealth:
+    state = resilience.get(report.provider)
+    if state is None:
+        return report
+    details = {**report.details, **state}
+    circuit = state.get("circuit")
+    breaker_state = circuit.get("state") if isinstance(circuit, Mapping) else None
+    status = report.status
+    if breaker_state == "open":
+        status = "down"
+    elif breaker_state == "half_open" and status == "ok":
+        status = "degraded"
+    return ProviderHealth(provider=report.provider, status=status, details=details)
+
+
+ResilienceSource = Callable[[], Mapping[str, Mapping[str, Any]]]
+
+
 class ProviderHealthMonitor:
-    """Evaluate health information for providers registered in the system."""
+    """Evaluate health information for providers registered in the system.
 
-    def __init__(self, registry: ProviderRegistry) -> None:
+    When *resilience* is given (usually ``ProviderGateway.resilience_snapshot``)
+    each report also carries the gateway's circuit breaker and concurrency
+    state; an open breaker marks the provider as down.
+    """
+
+    def __init__(
+        self, registry: ProviderRegistry, *, resilience: ResilienceSource | None = None
+    ) -> None:
         self._registry = registry
+        self._resilience = resilience
+
+    async def _evaluate(self, provider: TrackProvider) -> ProviderHealth:
+        report = await _invoke_health(provider)
+        if self._resilience is None:
+            return report
+        return _apply_resilience(report, self._resilience())
 
     async def check_provider(self, name: str) -> ProviderHealth:
         try:
             provider = self._registry.get_track_provider(name)
         except KeyError:
             return ProviderHealth(provider=name, status="down", details={"reason": "disabled"})
-        report = await _invoke_health(provider)
+        report = await self._evaluate(provider)
         log_event(
             logger,
             "integration.health",
@@ -120,7 +154,7 @@ class ProviderHealthMonitor:
 
     async def check_all(self) -> IntegrationHealth:
         providers = list(self._registry.track_providers().values())
-        reports = await asyncio.gather(*(_invoke_health(provider) for provider in providers))
+        reports = await asyncio.gather(*(self._evaluate(provider) for provider in providers))
         overall = _overall_status(reports)
         log_event(
             logger,
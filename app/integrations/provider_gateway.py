@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Mapping, Sequence
+from collections import Counter
+import copy
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
 from dataclasses import dataclass
 from time import perf_counter
-from typing import TypeVar
+from typing import Any, TypeVar
 
-from app.config import ExternalCallPolicy, ProviderProfile, settings
+from app.config import (
+    ExternalCallPolicy,
+    ProviderProfile,
+    ProviderResilienceConfig,
+    settings,
+)
 from app.integrations.contracts import (
     ProviderAlbumDetails,
     ProviderArtist,
@@ -24,15 +31,44 @@ from app.integrations.contracts import (
     SearchQuery,
     TrackProvider,
 )
+from app.integrations.provider_resilience import (
+    CLOSED,
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    HedgeBudget,
+    LatencyWindow,
+)
 from app.logging import get_logger
 from app.logging_events import log_event
+from app.utils.metrics import counter
 from app.utils.retry import RetryDirective, with_retry
 
 logger = get_logger(__name__)
 
+_COALESCED_COUNTER = counter(
+    "provider_gateway_coalesced_calls_total",
+    "Provider calls served by an identical call that was already in flight",
+    label_names=("provider", "operation"),
+)
+_HEDGED_COUNTER = counter(
+    "provider_gateway_hedged_requests_total",
+    "Slow provider calls that were due a hedge, grouped by outcome",
+    label_names=("provider", "outcome"),
+)
+
 
 T = TypeVar("T")
 
+_DEFAULT_RESILIENCE = ProviderResilienceConfig(
+    adaptive_concurrency=True,
+    min_concurrency=1,
+    breaker_failure_threshold=5,
+    breaker_reset_ms=30_000,
+    breaker_half_open_probes=1,
+    hedge_searches=False,
+    hedge_budget_pct=10.0,
+)
+
 
 @dataclass(slots=True, frozen=True)
 class ProviderRetryPolicy:
@@ -62,6 +98,7 @@ class ProviderGatewayConfig:
     max_concurrency: int
     default_policy: ProviderRetryPolicy
     provider_policies: Mapping[str, ProviderRetryPolicy]
+    resilience: ProviderResilienceConfig = _DEFAULT_RESILIENCE
 
     def policy_for(self, provider: str) -> ProviderRetryPolicy:
         return self.provider_policies.get(provider, self.default_policy)
@@ -73,6 +110,7 @@ class ProviderGatewayConfig:
         max_concurrency: int,
         external_policy: ExternalCallPolicy | None = None,
         provider_profiles: Mapping[str, ProviderProfile] | None = None,
+        resilience: ProviderResilienceConfig | None = None,
     ) -> ProviderGatewayConfig:
         """Create a gateway configuration backed by centralised settings."""
 
@@ -86,6 +124,7 @@ class ProviderGatewayConfig:
             max_concurrency=max(1, max_concurrency),
             default_policy=default_policy,
             provider_policies=provider_policies,
+            resilience=resilience or _DEFAULT_RESILIENCE,
         )
 
 
@@ -104,6 +143,19 @@ class ProviderGatewayTimeoutError(ProviderGatewayError):
         self.timeout_ms = timeout_ms
 
 
+class ProviderGatewayQueueTimeoutError(ProviderGatewayTimeoutError):
+    """Raised when a call times out waiting for a provider concurrency slot."""
+
+    def __init__(self, provider: str, timeout_ms: int, *, cause: Exception | None = None) -> None:
+        ProviderGatewayError.__init__(
+            self,
+            provider,
+            f"{provider} had no free concurrency slot within {timeout_ms}ms",
+            cause=cause,
+        )
+        self.timeout_ms = timeout_ms
+
+
 class ProviderGatewayValidationError(ProviderGatewayError):
     def __init__(
         self, provider: str, *, status_code: int | None, cause: Exception | None = None
@@ -144,10 +196,109 @@ class ProviderGatewayDependencyError(ProviderGatewayError):
         self.status_code = status_code
 
 
+class ProviderGatewayCircuitOpenError(ProviderGatewayDependencyError):
+    """Raised without calling the provider while its circuit breaker is open."""
+
+    def __init__(self, provider: str, *, retry_after_ms: int) -> None:
+        super().__init__(provider, status_code=None)
+        self.retry_after_ms = retry_after_ms
+
+
 class ProviderGatewayInternalError(ProviderGatewayError):
     pass
 
 
+class _ProviderControl:
+    """Concurrency limiter, circuit breaker and hedging state of one provider."""
+
+    def __init__(self, provider: str, resilience: ProviderResilienceConfig, limit: int) -> None:
+        self.provider = provider
+        self.limiter = AdaptiveConcurrencyLimiter(
+            max_limit=limit,
+            min_limit=resilience.min_concurrency,
+            adaptive=resilience.adaptive_concurrency,
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=resilience.breaker_failure_threshold,
+            reset_timeout=resilience.breaker_reset_ms / 1000,
+            half_open_probes=resilience.breaker_half_open_probes,
+        )
+        self.latencies = LatencyWindow()
+        self.hedge_budget = HedgeBudget(ratio=resilience.hedge_budget_pct / 100)
+
+    def hedge_delay_ms(self) -> float | None:
+        """Return how long to wait before hedging a call, or ``None`` to not hedge."""
+
+        self.hedge_budget.deposit()
+        if self.breaker.state != CLOSED:
+            return None
+        return self.latencies.percentile(0.95)
+
+    def admit(self) -> None:
+        state = self.breaker.state
+        admitted = self.breaker.try_acquire()
+        self._log_transition(state)
+        if not admitted:
+            raise ProviderGatewayCircuitOpenError(
+                self.provider, retry_after_ms=self.breaker.retry_after_ms()
+            )
+
+    def record_success(self, latency_ms: float) -> None:
+        state = self.breaker.state
+        self.limiter.record_success(latency_ms)
+        self.latencies.record(latency_ms)
+        self.breaker.record_success()
+        self._log_transition(state)
+
+    def record_error(self, error: ProviderGatewayError) -> None:
+        if isinstance(error, ProviderGatewayCircuitOpenError):
+            return
+        if isinstance(error, ProviderGatewayQueueTimeoutError):
+            # The provider was never called; waiting for our own limiter says
+            # nothing about its health.
+            self.breaker.release_probe()
+            return
+        state = self.breaker.state
+        if isinstance(error, ProviderGatewayNotFoundError | ProviderGatewayValidationError):
+            # The provider answered; the request itself was unserviceable.
+            self.breaker.record_success()
+        else:
+            if isinstance(
+                error,
+                (
+                    ProviderGatewayTimeoutError
+                    | ProviderGatewayRateLimitedError
+                    | ProviderGatewayDependencyError
+                ),
+            ):
+                self.limiter.record_failure()
+            # Internal errors (garbage payloads, unexpected exceptions) mean the
+            # provider is not answering usefully either.
+            self.breaker.record_failure()
+        self._log_transition(state)
+
+    def snapshot(self) -> Mapping[str, Any]:
+        return {
+            "circuit": dict(self.breaker.snapshot()),
+            "concurrency_limit": self.limiter.limit,
+            "in_flight": self.limiter.in_flight,
+            "p95_ms": self.latencies.percentile(0.95),
+        }
+
+    def _log_transition(self, previous: str) -> None:
+        current = self.breaker.state
+        if current == previous:
+            return
+        log_event(
+            logger,
+            "provider_gateway.circuit",
+            component="provider_gateway",
+            status=current,
+            dependency=self.provider,
+            meta={"previous": previous, "failures": self.breaker.consecutive_failures},
+        )
+
+
 @dataclass(slots=True, frozen=True)
 class ProviderGatewaySearchResult:
     """Container describing the outcome of a single provider call."""
@@ -195,7 +346,12 @@ class ProviderGatewaySearchResponse:
 
 
 class ProviderGateway:
-    """Coordinates provider calls and normalises failures."""
+    """Coordinates provider calls and normalises failures.
+
+    Read operations are single-flight: while a call for the same provider,
+    operation and normalised arguments is in flight, further callers await
+    its result instead of issuing another upstream request.
+    """
 
     def __init__(
         self,
@@ -205,7 +361,30 @@ class ProviderGateway:
     ) -> None:
         self._providers = {name.lower(): provider for name, provider in providers.items()}
         self._config = config
-        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        self._controls: dict[str, _ProviderControl] = {}
+        self._inflight: dict[tuple[str, str, Hashable], asyncio.Future[Any]] = {}
+        self._coalesced: Counter[str] = Counter()
+
+    @property
+    def coalesced_counts(self) -> Mapping[str, int]:
+        """Number of calls per provider that joined an in-flight request."""
+
+        return dict(self._coalesced)
+
+    def resilience_snapshot(self) -> Mapping[str, Mapping[str, Any]]:
+        """Circuit breaker and concurrency state per provider that has been called."""
+
+        return {name: control.snapshot() for name, control in self._controls.items()}
+
+    def _control_for(self, provider: TrackProvider) -> _ProviderControl:
+        # Keyed by the adapter name so aliases such as "soulseek" share state.
+        control = self._controls.get(provider.name)
+        if control is None:
+            control = _ProviderControl(
+                provider.name, self._config.resilience, self._config.max_concurrency
+            )
+            self._controls[provider.name] = control
+        return control
 
     async def search_tracks(self, provider: str, query: SearchQuery) -> list[ProviderTrack]:
         response = await self._search_provider(provider, query)
@@ -219,8 +398,10 @@ class ProviderGateway:
         if not providers:
             return ProviderGatewaySearchResponse(results=())
 
+        hedge = self._config.resilience.hedge_searches
+
         async def _run(name: str) -> ProviderGatewaySearchResult:
-            return await self._search_provider(name, query)
+            return await self._search_provider(name, query, hedge=hedge)
 
         provider_list = list(providers)
         tasks = [asyncio.create_task(_run(provider)) for provider in provider_list]
@@ -246,14 +427,53 @@ class ProviderGateway:
         provider: str,
         operation: str,
         call: Callable[[TrackProvider], Awaitable[T]],
+        *,
+        key: Hashable | None = None,
+        hedge: bool = False,
     ) -> T:
         normalized = provider.lower()
         if normalized not in self._providers:
             raise KeyError(f"Provider {provider!r} is not registered")
+        if key is None:
+            return await self._call_provider(normalized, operation, call, hedge=hedge)
+
+        flight_key = (normalized, operation, key)
+        flight = self._inflight.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._call_provider(normalized, operation, call, hedge=hedge)
+            )
+            self._inflight[flight_key] = flight
+            flight.add_done_callback(lambda done: self._land(flight_key, done))
+        else:
+            self._coalesced[normalized] += 1
+            _COALESCED_COUNTER.labels(provider=normalized, operation=operation).inc()
+        # Shielded so one caller giving up does not cancel the call for the
+        # others sharing it. Each caller gets its own shallow copy so that
+        # one of them reordering or extending a result list is not seen by
+        # the rest.
+        return copy.copy(await asyncio.shield(flight))
+
+    def _land(self, flight_key: tuple[str, str, Hashable], flight: asyncio.Future[Any]) -> None:
+        if self._inflight.get(flight_key) is flight:
+            del self._inflight[flight_key]
+        if not flight.cancelled():
+            # Mark the exception as retrieved when every caller has gone.
+            flight.exception()
+
+    async def _call_provider(
+        self,
+        normalized: str,
+        operation: str,
+        call: Callable[[TrackProvider], Awaitable[T]],
+        *,
+        hedge: bool = False,
+    ) -> T:
         track_provider = self._providers[normalized]
         policy = self._config.policy_for(normalized)
         attempts = max(1, policy.retry_max + 1)
         jitter_pct = self._jitter_pct(policy)
+        control = self._control_for(track_provider)
         attempt_counter = 0
         started = 0.0
 
@@ -261,11 +481,39 @@ class ProviderGateway:
             nonlocal attempt_counter, started
             attempt_counter += 1
             started = perf_counter()
-            async with self._semaphore:
-                return await call(track_provider)
+            control.admit()
+            try:
+                if hedge:
+                    return await self._hedged(track_provider.name, control, _invoke)
+                return await _invoke()
+            except asyncio.CancelledError:
+                control.breaker.release_probe()
+                raise
+
+        # The timeout is applied separately to waiting for a limiter slot and
+        # to the provider call, so queueing never eats into the call's budget.
+        timeout = policy.timeout_ms / 1000 if policy.timeout_ms > 0 else None
+
+        async def _invoke(acquired: asyncio.Event | None = None) -> T:
+            try:
+                await asyncio.wait_for(control.limiter.acquire(), timeout)
+            except asyncio.TimeoutError as exc:
+                raise ProviderGatewayQueueTimeoutError(
+                    track_provider.name, policy.timeout_ms, cause=exc
+                ) from exc
+            try:
+                if acquired is not None:
+                    acquired.set()
+                called_at = perf_counter()
+                result = await asyncio.wait_for(call(track_provider), timeout)
+            finally:
+                control.limiter.release()
+            control.record_success((perf_counter() - called_at) * 1000)
+            return result
 
         def _classify(exc: Exception) -> RetryDirective:
             error = self._normalise_error(track_provider, policy, exc)
+            control.record_error(error)
             self._log(
                 track_provider.name,
                 operation,
@@ -284,7 +532,7 @@ class ProviderGateway:
                 attempts=attempts,
                 base_ms=policy.backoff_base_ms,
                 jitter_pct=jitter_pct,
-                timeout_ms=policy.timeout_ms,
+                timeout_ms=None,
                 classify_err=_classify,
             )
         except ProviderGatewayError as error:
@@ -304,8 +552,66 @@ class ProviderGateway:
         )
         return result
 
+    @staticmethod
+    async def _hedged(
+        provider: str,
+        control: _ProviderControl,
+        invoke: Callable[[asyncio.Event | None], Awaitable[T]],
+    ) -> T:
+        """Run *invoke*, racing a second copy once it outlasts the provider's p95.
+
+        The p95 timer starts once the first copy holds a limiter slot, and no
+        copy is added while the limiter is saturated: time spent queueing is
+        not provider latency, and a hedge would only queue behind it. The
+        first successful copy wins and the other is cancelled; an error is
+        only raised once both copies have failed.
+        """
+
+        delay_ms = control.hedge_delay_ms()
+        if delay_ms is None:
+            return await invoke(None)
+        acquired = asyncio.Event()
+        primary = asyncio.ensure_future(invoke(acquired))
+        tasks = [primary]
+        try:
+            slot = asyncio.ensure_future(acquired.wait())
+            try:
+                await asyncio.wait([primary, slot], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                slot.cancel()
+            done, _ = await asyncio.wait(tasks, timeout=delay_ms / 1000)
+            if done:
+                return primary.result()
+            if control.limiter.saturated:
+                _HEDGED_COUNTER.labels(provider=provider, outcome="saturated").inc()
+                return await primary
+            if not control.hedge_budget.try_spend():
+                _HEDGED_COUNTER.labels(provider=provider, outcome="over_budget").inc()
+                return await primary
+            tasks.append(asyncio.ensure_future(invoke(None)))
+            pending = set(tasks)
+            failures: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    failure = task.exception()
+                    if failure is None:
+                        outcome = "primary" if task is primary else "hedge"
+                        _HEDGED_COUNTER.labels(provider=provider, outcome=outcome).inc()
+                        return task.result()
+                    failures.append(failure)
+            _HEDGED_COUNTER.labels(provider=provider, outcome="failed").inc()
+            raise failures[0]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Retrieve a losing copy's error so it is not reported as unhandled.
+                    task.exception()
+
     async def _search_provider(
-        self, provider: str, query: SearchQuery
+        self, provider: str, query: SearchQuery, *, hedge: bool = False
     ) -> ProviderGatewaySearchResult:
         normalized = provider.lower()
         if normalized not in self._providers:
@@ -317,6 +623,8 @@ class ProviderGateway:
                 provider,
                 "search_tracks",
                 lambda adapter: adapter.search_tracks(query),
+                key=(_normalise_text(query.text), _normalise_text(query.artist), query.limit),
+                hedge=hedge,
             )
         except ProviderGatewayError as error:
             return ProviderGatewaySearchResult(
@@ -337,6 +645,7 @@ class ProviderGateway:
             provider,
             "fetch_artist",
             lambda adapter: adapter.fetch_artist(artist_id=artist_id, name=name),
+            key=(artist_id, _normalise_text(name)),
         )
 
     async def fetch_artist_releases(
@@ -346,6 +655,7 @@ class ProviderGateway:
             provider,
             "fetch_artist_releases",
             lambda adapter: adapter.fetch_artist_releases(artist_source_id, limit=limit),
+            key=(artist_source_id, limit),
         )
         return list(releases)
 
@@ -354,6 +664,7 @@ class ProviderGateway:
             provider,
             "fetch_album",
             lambda adapter: adapter.fetch_album(album_source_id),
+            key=album_source_id,
         )
 
     async def fetch_artist_top_tracks(
@@ -363,6 +674,7 @@ class ProviderGateway:
             provider,
             "fetch_artist_top_tracks",
             lambda adapter: adapter.fetch_artist_top_tracks(artist_source_id, limit=limit),
+            key=(artist_source_id, limit),
         )
         return list(tracks)
 
@@ -380,6 +692,8 @@ class ProviderGateway:
         exc: Exception,
     ) -> ProviderGatewayError:
         name = provider.name
+        if isinstance(exc, ProviderGatewayError):
+            return exc
         if isinstance(exc, asyncio.TimeoutError):
             return ProviderGatewayTimeoutError(name, policy.timeout_ms, cause=exc)
         if isinstance(exc, ProviderTimeoutError):
@@ -406,6 +720,8 @@ class ProviderGateway:
 
     @staticmethod
     def _should_retry(error: ProviderGatewayError) -> bool:
+        if isinstance(error, ProviderGatewayCircuitOpenError):
+            return False
         return isinstance(
             error,
             (
@@ -457,16 +773,26 @@ class ProviderGateway:
                 meta["status_code"] = error.status_code
             if isinstance(error, ProviderGatewayTimeoutError):
                 meta["timeout_ms"] = error.timeout_ms
+            if isinstance(error, ProviderGatewayCircuitOpenError):
+                meta["retry_after_ms"] = error.retry_after_ms
         log_event(logger, "api.dependency", **payload)
 
 
+def _normalise_text(value: str | None) -> str | None:
+    if value is None:
+        return None
+    return " ".join(value.split()).casefold()
+
+
 __all__ = [
     "ProviderGateway",
+    "ProviderGatewayCircuitOpenError",
     "ProviderGatewayConfig",
     "ProviderGatewayDependencyError",
     "ProviderGatewayError",
     "ProviderGatewayInternalError",
     "ProviderGatewayNotFoundError",
+    "ProviderGatewayQueueTimeoutError",
     "ProviderGatewayRateLimitedError",
     "ProviderGatewayTimeoutError",
     "ProviderGatewayValidationError",
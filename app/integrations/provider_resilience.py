@@ -0,0 +1,241 @@
+"""Per-provider concurrency limiting, circuit breaking and hedging for the gateway."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Mapping
+import math
+import time
+from typing import Any
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# A success slower than this multiple of the latency baseline shrinks the limit.
+_LATENCY_TOLERANCE = 2.0
+_LATENCY_SMOOTHING = 0.1
+_FAILURE_BACKOFF = 0.5
+_LATENCY_BACKOFF = 0.9
+
+
+class AdaptiveConcurrencyLimiter:
+    """Async concurrency limit that follows a provider's latency and errors.
+
+    The limit grows additively (by ``1/limit`` per fast success) up to
+    ``max_limit`` and shrinks multiplicatively on failures or on successes
+    much slower than the smoothed latency baseline, never below
+    ``min_limit``. With ``adaptive=False`` it behaves like a semaphore of
+    ``max_limit``. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, *, max_limit: int, min_limit: int = 1, adaptive: bool = True) -> None:
+        self._max_limit = max(1, int(max_limit))
+        self._min_limit = max(1, min(int(min_limit), self._max_limit))
+        self._adaptive = adaptive
+        self._limit = float(self._max_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._baseline_ms: float | None = None
+
+    @property
+    def limit(self) -> int:
+        return max(self._min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def saturated(self) -> bool:
+        """Return whether a new caller would have to wait for a slot."""
+
+        return bool(self._waiters) or self._in_flight >= self.limit
+
+    async def acquire(self) -> None:
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake()
+
+    async def __aenter__(self) -> AdaptiveConcurrencyLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def record_success(self, latency_ms: float) -> None:
+        if not self._adaptive:
+            return
+        baseline = self._baseline_ms
+        if baseline is not None and latency_ms > baseline * _LATENCY_TOLERANCE:
+            self._limit = max(float(self._min_limit), self._limit * _LATENCY_BACKOFF)
+        else:
+            self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+        if baseline is None:
+            self._baseline_ms = latency_ms
+        else:
+            self._baseline_ms = baseline + _LATENCY_SMOOTHING * (latency_ms - baseline)
+        self._wake()
+
+    def record_failure(self) -> None:
+        if self._adaptive:
+            self._limit = max(float(self._min_limit), self._limit * _FAILURE_BACKOFF)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls, for percentile lookups."""
+
+    def __init__(self, *, size: int = 256, min_samples: int = 20) -> None:
+        self._samples: deque[float] = deque(maxlen=max(1, int(size)))
+        self._min_samples = max(1, int(min_samples))
+
+    def record(self, latency_ms: float) -> None:
+        self._samples.append(latency_ms)
+
+    def percentile(self, quantile: float) -> float | None:
+        """Return the *quantile* latency, or ``None`` until enough samples exist."""
+
+        count = len(self._samples)
+        if count < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(count - 1, max(0, math.ceil(quantile * count) - 1))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """Token budget capping hedged requests at a share of all requests.
+
+    Every eligible request deposits ``ratio`` tokens (up to ``burst``) and a
+    hedge spends one, so over time at most ``ratio`` of requests are hedged.
+    """
+
+    def __init__(self, *, ratio: float, burst: float = 10.0) -> None:
+        self._ratio = min(1.0, max(0.0, float(ratio)))
+        self._burst = max(1.0, float(burst))
+        self._tokens = 0.0
+
+    def deposit(self) -> None:
+        self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    :meth:`try_acquire` refuses calls for ``reset_timeout`` seconds. It then
+    half-opens and admits up to ``half_open_probes`` concurrent probe calls:
+    a successful probe closes the breaker, a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, int(failure_threshold))
+        self._reset_timeout = max(0.0, float(reset_timeout))
+        self._half_open_probes = max(1, int(half_open_probes))
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    def retry_after_ms(self) -> int:
+        if self._state != OPEN:
+            return 0
+        remaining = self._reset_timeout - (self._clock() - self._opened_at)
+        return max(0, int(remaining * 1000))
+
+    def try_acquire(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        self._state = HALF_OPEN
+        if self._probes >= self._half_open_probes:
+            return False
+        self._probes += 1
+        return True
+
+    def release_probe(self) -> None:
+        """Free a probe slot for a call that ended without an outcome."""
+
+        if self._state == HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._state = CLOSED
+        self._probes = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self._failure_threshold:
+            self._state = OPEN
+            self._opened_at = self._clock()
+            self._probes = 0
+
+    def snapshot(self) -> Mapping[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_after_ms": self.retry_after_ms(),
+        }
+
+
+__all__ = [
+    "CLOSED",
+    "HALF_OPEN",
+    "OPEN",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreaker",
+    "HedgeBudget",
+    "LatencyWindow",
+]
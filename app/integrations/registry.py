@@ -8,11 +8,13 @@ import inspect
 from typing import Final
 
 from app.config import AppConfig
+from app.core.provider_cache import shared_provider_cache
 from app.core.spotify_client import SpotifyClient
 from app.integrations.contracts import TrackProvider
 from app.integrations.provider_gateway import ProviderGatewayConfig, ProviderRetryPolicy
 from app.integrations.slskd_adapter import SlskdAdapter
 from app.integrations.spotify_adapter import SpotifyAdapter
+from app.integrations.spotify_http import SpotifyHttpClient
 from app.logging import get_logger
 
 logger = get_logger(__name__)
@@ -75,6 +77,7 @@ class ProviderRegistry:
     def gateway_config(self) -> ProviderGatewayConfig:
         base_config = ProviderGatewayConfig.from_settings(
             max_concurrency=self._config.integrations.max_concurrency,
+            resilience=self._config.integrations.resilience,
         )
         provider_policies: dict[str, ProviderRetryPolicy] = dict(base_config.provider_policies)
         provider_policies.update(self._policies)
@@ -82,6 +85,7 @@ class ProviderRegistry:
             max_concurrency=base_config.max_concurrency,
             default_policy=base_config.default_policy,
             provider_policies=provider_policies,
+            resilience=base_config.resilience,
         )
 
     @property
@@ -118,12 +122,22 @@ class ProviderRegistry:
     def _build_track_provider(self, name: str) -> TrackProvider | None:
         normalized = name.lower()
         if normalized == "spotify":
+            spotify = self._config.spotify
             try:
-                client = SpotifyClient(self._config.spotify)
+                # Spotipy only handles OAuth here; API calls go through the
+                # async HTTP client.
+                auth_client = SpotifyClient(spotify)
             except Exception as exc:  # pragma: no cover - configuration guard
                 logger.warning("Spotify adapter disabled: %s", exc)
                 return None
-            return SpotifyAdapter(client=client)
+            http_client = SpotifyHttpClient(
+                token_provider=auth_client.access_token,
+                cache=shared_provider_cache(self._config.integrations.cache),
+                timeout_ms=self._config.integrations.timeouts_ms.get("spotify", 15000),
+                rate_per_second=spotify.rate_limit_per_second,
+                burst=spotify.rate_limit_burst,
+            )
+            return SpotifyAdapter(client=http_client)
         if normalized in {"slskd", "soulseek"}:
             soulseek = self._config.soulseek
             return SlskdAdapter(
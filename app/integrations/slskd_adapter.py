@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
+import heapq
+import json
 import re
 from types import MappingProxyType
 from typing import Any
@@ -41,6 +43,8 @@ logger = get_logger(__name__)
 _DEFAULT_SEARCH_PATH = "/api/v0/search/tracks"
 _DEFAULT_HEALTH_PATH = "/health"
 _ALLOWED_SCHEMES = {"http", "https"}
+_RESULT_KEYS = ("results", "matches", "tracks")
+_STREAM_WHITESPACE = re.compile(r"\s*")
 
 
 def _coerce_str(value: Any) -> str | None:
@@ -320,22 +324,195 @@ def _build_candidate(entry: Mapping[str, Any]) -> TrackCandidate:
     )
 
 
-def _sort_candidates(
-    candidates: list[TrackCandidate], preferred_formats: Mapping[str, int]
-) -> list[TrackCandidate]:
-    def sort_key(candidate: TrackCandidate) -> tuple[int, int, int, int, str]:
-        format_rank = preferred_formats.get(
-            (candidate.format or "").upper(), len(preferred_formats)
-        )
-        seeders = -(candidate.seeders or 0)
-        bitrate = -candidate.bitrate_kbps if candidate.bitrate_kbps is not None else 0
-        size = (
-            candidate.size_bytes if candidate.size_bytes is not None else 1_000_000_000
+def _candidate_sort_key(
+    candidate: TrackCandidate, preferred_formats: Mapping[str, int]
+) -> tuple[int, int, int, int, str]:
+    format_rank = preferred_formats.get(
+        (candidate.format or "").upper(), len(preferred_formats)
+    )
+    seeders = -(candidate.seeders or 0)
+    bitrate = -candidate.bitrate_kbps if candidate.bitrate_kbps is not None else 0
+    size = (
+        candidate.size_bytes if candidate.size_bytes is not None else 1_000_000_000
+    )
+    title = candidate.title.lower()
+    return (format_rank, seeders, bitrate, size, title)
+
+
+class _TopCandidates:
+    """Keep the best ``limit`` candidates in :func:`_candidate_sort_key` order.
+
+    Candidates are buffered and pruned back to ``limit`` with a heap
+    selection whenever the buffer doubles, so memory stays bounded no matter
+    how many files a search returns. ``heapq.nsmallest`` is stable, which
+    keeps ties in arrival order exactly like a full sort would.
+    """
+
+    def __init__(self, limit: int, preferred_formats: Mapping[str, int]) -> None:
+        self._limit = max(1, limit)
+        self._preferred_formats = preferred_formats
+        self._items: list[TrackCandidate] = []
+        self.seen = 0
+
+    def add(self, candidate: TrackCandidate) -> None:
+        self.seen += 1
+        self._items.append(candidate)
+        if len(self._items) >= 2 * self._limit:
+            self._items = self._select()
+
+    def ranked(self) -> list[TrackCandidate]:
+        return self._select()
+
+    def _select(self) -> list[TrackCandidate]:
+        return heapq.nsmallest(
+            self._limit,
+            self._items,
+            key=lambda candidate: _candidate_sort_key(candidate, self._preferred_formats),
         )
-        title = candidate.title.lower()
-        return (format_rank, seeders, bitrate, size, title)
 
-    return sorted(candidates, key=sort_key)
+
+class _SearchPayloadStream:
+    """Split a slskd search body into peer responses while it downloads.
+
+    Elements of a top-level list, or of the first ``results``/``matches``/
+    ``tracks`` array of a top-level object, are decoded one at a time as
+    soon as they are complete and the consumed text is dropped. Bodies of
+    any other shape are buffered and decoded in :meth:`close`. Malformed
+    JSON raises :class:`ValueError` from :meth:`close`.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._prefix: list[str] = []
+        self._pos = 0
+        self._state = "start"
+        self._streaming = False
+        self._retry_at = 0
+
+    def feed(self, chunk: str) -> list[Any]:
+        self._buffer += chunk
+        entries: list[Any] = []
+        while self._step(entries):
+            pass
+        self._compact()
+        return entries
+
+    def close(self) -> list[Any]:
+        if not self._streaming:
+            return [json.loads("".join(self._prefix) + self._buffer)]
+        # The body is complete, so retry values still waiting for more text.
+        self._retry_at = 0
+        entries: list[Any] = []
+        while self._step(entries):
+            pass
+        if self._state != "done":
+            raise ValueError("slskd search body ended inside the result list")
+        return entries
+
+    def _compact(self) -> None:
+        # Scanned text is only needed again if the body is not streamable.
+        cut = len(self._buffer) if self._state == "buffer" else self._pos
+        if cut <= 0:
+            return
+        if not self._streaming:
+            self._prefix.append(self._buffer[:cut])
+        self._buffer = self._buffer[cut:]
+        self._pos -= cut
+        self._retry_at = max(0, self._retry_at - cut)
+
+    def _skip_whitespace(self) -> str | None:
+        self._pos = _STREAM_WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos >= len(self._buffer):
+            return None
+        return self._buffer[self._pos]
+
+    def _decode_value(self) -> tuple[Any, int] | None:
+        """Decode the value at the cursor, or return ``None`` until it is complete.
+
+        A failed attempt is only retried once the pending text has doubled,
+        which keeps decoding linear for values spanning many chunks.
+        """
+
+        if len(self._buffer) < self._retry_at:
+            return None
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            self._retry_at = self._pos + 2 * (len(self._buffer) - self._pos)
+            return None
+        if end >= len(self._buffer) and not isinstance(value, dict | list | str):
+            # A number or literal at the end of the buffer may continue.
+            return None
+        self._retry_at = 0
+        return value, end
+
+    def _step(self, entries: list[Any]) -> bool:
+        if self._state in {"done", "buffer"}:
+            return False
+        char = self._skip_whitespace()
+        if char is None:
+            return False
+
+        if self._state == "start":
+            if char == "[":
+                self._enter_array()
+            elif char == "{":
+                self._pos += 1
+                self._state = "keys"
+            else:
+                self._state = "buffer"
+            return True
+
+        if char == ",":
+            self._pos += 1
+            return True
+        if char in "]}":
+            self._state = "done"
+            return False
+
+        if self._state == "value":
+            decoded = self._decode_value()
+            if decoded is None:
+                return False
+            self._pos = decoded[1]
+            self._state = "keys"
+            return True
+
+        if self._state == "keys":
+            key_start = self._pos
+            decoded = self._decode_value()
+            if decoded is None:
+                return False
+            key, key_end = decoded
+            colon = _STREAM_WHITESPACE.match(self._buffer, key_end).end()
+            value_start = _STREAM_WHITESPACE.match(self._buffer, colon + 1).end()
+            if value_start >= len(self._buffer):
+                self._pos = key_start
+                return False
+            if not isinstance(key, str) or self._buffer[colon] != ":":
+                self._state = "buffer"
+                return False
+            self._pos = value_start
+            if key in _RESULT_KEYS and self._buffer[value_start] == "[":
+                self._enter_array()
+            else:
+                self._state = "value"
+            return True
+
+        # self._state == "array"
+        decoded = self._decode_value()
+        if decoded is None:
+            return False
+        value, self._pos = decoded
+        entries.append(value)
+        return True
+
+    def _enter_array(self) -> None:
+        self._pos += 1
+        self._state = "array"
+        self._streaming = True
+        self._prefix.clear()
 
 
 def _parse_retry_after_ms(headers: Mapping[str, str]) -> int | None:
@@ -447,10 +624,13 @@ class SlskdAdapter(TrackProvider):
         effective_limit = max(1, min(int(query.limit), self._max_results))
         params = {"query": combined, "limit": effective_limit, "type": "track"}
 
+        top = _TopCandidates(effective_limit, self._format_ranking)
         try:
-            response = await self._client.get(
-                self._search_path, params=params, headers=self._headers
-            )
+            async with self._client.stream(
+                "GET", self._search_path, params=params, headers=self._headers
+            ) as response:
+                if response.status_code == httpx.codes.OK:
+                    await self._collect_candidates(response, top)
         except httpx.TimeoutException as exc:
             raise ProviderTimeoutError(self.name, self._timeout_ms, cause=exc) from exc
         except httpx.HTTPError as exc:
@@ -460,22 +640,13 @@ class SlskdAdapter(TrackProvider):
 
         status_code = response.status_code
         if status_code == httpx.codes.OK:
-            try:
-                payload = response.json()
-            except ValueError as exc:  # pragma: no cover - defensive guard
-                raise ProviderInternalError(
-                    self.name, "slskd returned invalid JSON", cause=exc
-                ) from exc
-            candidates = [_build_candidate(entry) for entry in _iter_files(payload)]
-            if not candidates:
+            if not top.seen:
                 raise ProviderNotFoundError(
                     self.name, "slskd returned no results", status_code=404
                 )
-            ranked = _sort_candidates(candidates, self._format_ranking)
-            limited = ranked[:effective_limit]
             return [
                 normalize_slskd_track(candidate, provider=self.name)
-                for candidate in limited
+                for candidate in top.ranked()
             ]
 
         if status_code in {httpx.codes.BAD_REQUEST, httpx.codes.UNPROCESSABLE_ENTITY}:
@@ -507,6 +678,25 @@ class SlskdAdapter(TrackProvider):
             self.name, f"slskd responded with an unexpected status ({status_code})"
         )
 
+    async def _collect_candidates(
+        self, response: httpx.Response, top: _TopCandidates
+    ) -> None:
+        """Parse the search body as it arrives, keeping only the best candidates."""
+
+        stream = _SearchPayloadStream()
+        try:
+            async for chunk in response.aiter_text():
+                for entry in stream.feed(chunk):
+                    for file_entry in _iter_files(entry):
+                        top.add(_build_candidate(file_entry))
+            for entry in stream.close():
+                for file_entry in _iter_files(entry):
+                    top.add(_build_candidate(file_entry))
+        except ValueError as exc:
+            raise ProviderInternalError(
+                self.name, "slskd returned invalid JSON", cause=exc
+            ) from exc
+
     async def fetch_artist(
         self, *, artist_id: str | None = None, name: str | None = None
     ) -> ProviderArtist | None:
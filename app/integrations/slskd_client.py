@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
-from dataclasses import dataclass
-from datetime import UTC, datetime
-from email.utils import parsedate_to_datetime
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import httpx
 
-from app.utils.retry import RetryDirective, with_retry
+from app.utils.retry import RetryDirective, parse_retry_after_ms, with_retry
+
+try:  # pragma: no cover - optional dependency
+    import h2  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - HTTP/1.1 only
+    _HTTP2_AVAILABLE = False
+else:  # pragma: no cover - depends on the environment
+    _HTTP2_AVAILABLE = True
 
 
 class SlskdClientError(RuntimeError):
@@ -90,11 +95,18 @@ class SlskdDownloadEvent:
     retryable: bool
     path: str | None = None
     bytes_written: int | None = None
+    expected_bytes: int | None = None
 
 
 @dataclass(slots=True)
 class SlskdHttpClient:
-    """HTTPX based client tailored to the Harmony Download Manager (HDM)."""
+    """HTTPX based client tailored to the Harmony Download Manager (HDM).
+
+    A single :class:`httpx.AsyncClient` is created lazily and reused for all
+    requests so status polls ride on kept-alive connections; call
+    :meth:`aclose` when the owning runtime shuts down. HTTP/2 is negotiated
+    for ``https`` endpoints when the optional ``h2`` package is installed.
+    """
 
     base_url: str
     api_key: str | None = None
@@ -104,6 +116,18 @@ class SlskdHttpClient:
     backoff_base_ms: int = 250
     jitter_pct: int = 20
     status_poll_interval: float = 1.0
+    max_connections: int = 64
+    max_keepalive_connections: int = 64
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     async def search_tracks(self, query: str, *, limit: int, timeout_ms: int) -> Any:
         """Issue a search request against slskd and return the JSON payload."""
@@ -132,6 +156,39 @@ class SlskdHttpClient:
         )
         return self._decode_json(response)
 
+    async def get_download_event(self, idempotency_key: str) -> SlskdDownloadEvent:
+        """Fetch the current state of a single download."""
+
+        response = await self._request(
+            "GET",
+            f"/api/v0/transfers/downloads/{idempotency_key}",
+            idempotency_key=idempotency_key,
+        )
+        payload = self._decode_json(response)
+        return self._parse_event(payload, fallback_id=idempotency_key)
+
+    async def list_download_events(self) -> dict[str, SlskdDownloadEvent]:
+        """Fetch all transfers in one request, keyed by every id they carry.
+
+        Entries are indexed under their idempotency key as well as their
+        download id so subscribers can look them up by either.
+        """
+
+        response = await self._request("GET", "/api/v0/transfers/downloads")
+        events: dict[str, SlskdDownloadEvent] = {}
+        for entry in _iter_transfer_entries(self._decode_json(response)):
+            keys = [
+                str(entry[key]).strip()
+                for key in ("idempotency_key", "download_id", "id", "job_id")
+                if entry.get(key) not in (None, "")
+            ]
+            if not keys:
+                continue
+            event = self._parse_event(entry, fallback_id=keys[0])
+            for key in keys:
+                events.setdefault(key, event)
+        return events
+
     async def stream_download_events(
         self,
         idempotency_key: str,
@@ -144,13 +201,7 @@ class SlskdHttpClient:
         interval = max(0.25, float(interval))
         last_status: SlskdDownloadStatus | None = None
         while True:
-            response = await self._request(
-                "GET",
-                f"/api/v0/transfers/downloads/{idempotency_key}",
-                idempotency_key=idempotency_key,
-            )
-            payload = self._decode_json(response)
-            event = self._parse_event(payload, fallback_id=idempotency_key)
+            event = await self.get_download_event(idempotency_key)
             if last_status != event.status:
                 yield event
                 last_status = event.status
@@ -190,29 +241,19 @@ class SlskdHttpClient:
         idempotency_key: str | None = None,
         timeout_ms: int | None = None,
     ) -> httpx.Response:
-        base_url = self.base_url.rstrip("/")
         timeout = self._build_timeout(timeout_ms or self.timeout_ms)
-
-        headers = {"Accept": "application/json"}
-        if self.api_key:
-            headers["X-API-Key"] = self.api_key
-        if idempotency_key:
-            headers["Idempotency-Key"] = idempotency_key
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
 
         async def _perform_request() -> httpx.Response:
             try:
-                async with httpx.AsyncClient(
-                    base_url=base_url,
-                    timeout=timeout,
+                response = await self._get_client().request(
+                    method,
+                    path,
+                    params=params,
+                    json=json,
                     headers=headers,
-                    transport=self.transport,
-                ) as client:
-                    response = await client.request(
-                        method,
-                        path,
-                        params=params,
-                        json=json,
-                    )
+                    timeout=timeout,
+                )
             except httpx.TimeoutException as exc:
                 raise SlskdTimeoutError() from exc
             except httpx.HTTPError as exc:
@@ -221,7 +262,7 @@ class SlskdHttpClient:
             if response.status_code == httpx.codes.OK:
                 return response
             if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
-                retry_after = _parse_retry_after_ms(response.headers)
+                retry_after = parse_retry_after_ms(response.headers)
                 raise SlskdRateLimitedError(headers=response.headers, retry_after_ms=retry_after)
 
             body_preview = response.text[:200]
@@ -269,6 +310,27 @@ class SlskdHttpClient:
             classify_err=_classify,
         )
 
+    def _get_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is None or client.is_closed:
+            headers = {"Accept": "application/json"}
+            if self.api_key:
+                headers["X-API-Key"] = self.api_key
+            client = httpx.AsyncClient(
+                base_url=self.base_url.rstrip("/"),
+                timeout=self._build_timeout(self.timeout_ms),
+                headers=headers,
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=max(1, int(self.max_connections)),
+                    max_keepalive_connections=max(0, int(self.max_keepalive_connections)),
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self.http2 and _HTTP2_AVAILABLE,
+            )
+            self._client = client
+        return client
+
     def _parse_event(
         self, payload: Mapping[str, Any] | Any, *, fallback_id: str
     ) -> SlskdDownloadEvent:
@@ -288,6 +350,7 @@ class SlskdHttpClient:
 
         path = _extract_path(payload)
         bytes_written = _extract_bytes(payload)
+        expected_bytes = _extract_expected_bytes(payload)
 
         return SlskdDownloadEvent(
             download_id=download_id,
@@ -296,6 +359,7 @@ class SlskdHttpClient:
             retryable=retryable,
             path=path,
             bytes_written=bytes_written,
+            expected_bytes=expected_bytes,
         )
 
     @staticmethod
@@ -317,6 +381,169 @@ class SlskdHttpClient:
         )
 
 
+_TERMINAL_STATUSES = frozenset({SlskdDownloadStatus.COMPLETED, SlskdDownloadStatus.FAILED})
+
+
+class SlskdTransferHub:
+    """Share one transfer-status poll loop between all in-flight downloads.
+
+    Instead of every download polling its own status endpoint, the hub
+    fetches the bulk transfers list once per ``poll_interval``, diffs it
+    against the previous snapshot and pushes changed entries to the
+    subscribers of the affected keys. New subscribers and keys missing from
+    the bulk view (e.g. a transfer slskd has not registered there yet) are
+    looked up individually, so after that first request the volume grows
+    with elapsed time rather than with the number of concurrent downloads.
+    The loop runs only while there are subscribers. A failed bulk poll only
+    skips its tick; subscribers see the error once ``max_poll_failures``
+    polls in a row have failed.
+    """
+
+    def __init__(
+        self,
+        client: SlskdHttpClient,
+        *,
+        poll_interval: float | None = None,
+        max_poll_failures: int = 3,
+    ) -> None:
+        interval = poll_interval if poll_interval is not None else client.status_poll_interval
+        self._client = client
+        self._interval = max(0.25, float(interval))
+        self._max_poll_failures = max(1, int(max_poll_failures))
+        self._snapshot: dict[str, SlskdDownloadEvent] = {}
+        self._subscribers: dict[str, list[asyncio.Queue[SlskdDownloadEvent | Exception]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def subscribe(self, idempotency_key: str) -> AsyncIterator[SlskdDownloadEvent]:
+        """Yield status events for *idempotency_key* until it is completed or failed."""
+
+        current = self._snapshot.get(idempotency_key)
+        if current is None:
+            # A key the poll loop has not seen yet is looked up once so its
+            # first state arrives without waiting for the next tick.
+            current = await self._client.get_download_event(idempotency_key)
+        queue: asyncio.Queue[SlskdDownloadEvent | Exception] = asyncio.Queue()
+        queue.put_nowait(current)
+        self._subscribers.setdefault(idempotency_key, []).append(queue)
+        self._snapshot.setdefault(idempotency_key, current)
+        if current.status not in _TERMINAL_STATUSES and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                if item.status in _TERMINAL_STATUSES:
+                    return
+        finally:
+            queues = self._subscribers.get(idempotency_key, [])
+            if queue in queues:
+                queues.remove(queue)
+            if not queues:
+                self._subscribers.pop(idempotency_key, None)
+                self._snapshot.pop(idempotency_key, None)
+
+    async def aclose(self) -> None:
+        """Stop the poll loop; pending subscribers are left waiting."""
+
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def poll_once(self) -> None:
+        """Fetch one snapshot and fan out the entries that changed."""
+
+        listed = await self._client.list_download_events()
+        snapshot = {key: listed[key] for key in self._subscribers if key in listed}
+        missing = [key for key in self._subscribers if key not in listed]
+        if missing:
+            results = await asyncio.gather(
+                *(self._client.get_download_event(key) for key in missing),
+                return_exceptions=True,
+            )
+            for key, result in zip(missing, results, strict=True):
+                if isinstance(result, Exception):
+                    self._publish(key, result)
+                elif isinstance(result, SlskdDownloadEvent):
+                    snapshot[key] = result
+        # Subscriptions may have come and gone while the lookups ran: keep
+        # the entries recorded for keys added meanwhile so their next event
+        # is not published twice, and drop keys nobody follows any more.
+        previous = self._snapshot
+        for key, event in previous.items():
+            snapshot.setdefault(key, event)
+        snapshot = {key: event for key, event in snapshot.items() if key in self._subscribers}
+        self._snapshot = snapshot
+        for key, event in snapshot.items():
+            if _event_signature(previous.get(key)) != _event_signature(event):
+                self._publish(key, event)
+
+    async def _run(self) -> None:
+        failures = 0
+        while self._subscribers:
+            await asyncio.sleep(self._interval)
+            if not self._subscribers:
+                break
+            try:
+                await self.poll_once()
+            except Exception as exc:
+                failures += 1
+                if failures < self._max_poll_failures:
+                    continue
+                failures = 0
+                for key in list(self._subscribers):
+                    self._publish(key, exc)
+            else:
+                failures = 0
+
+    def _publish(self, key: str, item: SlskdDownloadEvent | Exception) -> None:
+        for queue in self._subscribers.get(key, ()):
+            queue.put_nowait(item)
+
+
+def _event_signature(
+    event: SlskdDownloadEvent | None,
+) -> tuple[SlskdDownloadStatus, str | None, int | None] | None:
+    # Byte counters change on every poll while a transfer runs; only state,
+    # location and the announced size are worth waking a subscriber for.
+    if event is None:
+        return None
+    return event.status, event.path, event.expected_bytes
+
+
+def _iter_transfer_entries(payload: Any) -> Iterator[Mapping[str, Any]]:
+    """Flatten a bulk transfers payload into individual transfer entries.
+
+    Accepts a flat list, a ``{"downloads": [...]}`` wrapper or slskd's
+    nested ``user -> directories -> files`` layout.
+    """
+
+    if isinstance(payload, list):
+        for item in payload:
+            yield from _iter_transfer_entries(item)
+        return
+    if not isinstance(payload, Mapping):
+        return
+    nested = False
+    for key in ("downloads", "transfers", "directories", "files"):
+        children = payload.get(key)
+        if isinstance(children, list):
+            nested = True
+            yield from _iter_transfer_entries(children)
+    if not nested:
+        yield payload
+
+
 def _extract_path(payload: Mapping[str, Any]) -> str | None:
     for key in ("path", "file_path", "local_path", "source_path"):
         value = payload.get(key)
@@ -326,7 +553,15 @@ def _extract_path(payload: Mapping[str, Any]) -> str | None:
 
 
 def _extract_bytes(payload: Mapping[str, Any]) -> int | None:
-    for key in ("bytes", "bytes_written", "size_bytes"):
+    return _extract_int(payload, ("bytes", "bytes_written", "size_bytes"))
+
+
+def _extract_expected_bytes(payload: Mapping[str, Any]) -> int | None:
+    return _extract_int(payload, ("size", "expected_bytes", "total_bytes", "file_size"))
+
+
+def _extract_int(payload: Mapping[str, Any], keys: tuple[str, ...]) -> int | None:
+    for key in keys:
         value = payload.get(key)
         if isinstance(value, int) and value >= 0:
             return value
@@ -352,40 +587,6 @@ def _normalise_status(raw: str) -> SlskdDownloadStatus:
     return SlskdDownloadStatus.IN_PROGRESS
 
 
-def _parse_retry_after_ms(headers: Mapping[str, Any]) -> int | None:
-    value = headers.get("Retry-After") if isinstance(headers, Mapping) else None
-    if value is None:
-        return None
-
-    delay_seconds: float | None = None
-
-    if isinstance(value, int | float):
-        delay_seconds = float(value)
-    else:
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-
-        try:
-            delay_seconds = float(value_str)
-        except ValueError:
-            try:
-                target_dt = parsedate_to_datetime(value_str)
-            except (TypeError, ValueError):
-                return None
-            if target_dt is None:
-                return None
-            if target_dt.tzinfo is None:
-                target_dt = target_dt.replace(tzinfo=UTC)
-            now = datetime.now(UTC)
-            delay_seconds = (target_dt - now).total_seconds()
-
-    if delay_seconds is None:
-        return None
-
-    return max(0, int(delay_seconds * 1000))
-
-
 __all__ = [
     "SlskdClientError",
     "SlskdDownloadEvent",
@@ -395,4 +596,5 @@ __all__ = [
     "SlskdInvalidResponseError",
     "SlskdRateLimitedError",
     "SlskdTimeoutError",
+    "SlskdTransferHub",
 ]
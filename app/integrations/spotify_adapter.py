@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Iterable, Mapping
 from typing import Any
 
-from app.core.spotify_client import SpotifyClient
 from app.integrations.contracts import (
     ProviderAlbumDetails,
     ProviderArtist,
@@ -25,6 +23,7 @@ from app.integrations.normalizers import (
     from_spotify_release,
     normalize_spotify_track,
 )
+from app.integrations.spotify_http import SpotifyHttpClient
 from app.logging import get_logger
 
 logger = get_logger(__name__)
@@ -43,20 +42,25 @@ def _iter_track_items(payload: Any) -> Iterable[dict[str, Any]]:
 
 
 class SpotifyAdapter(TrackProvider):
-    """Adapter using :class:`SpotifyClient` for integration flows."""
+    """Adapter using :class:`SpotifyHttpClient` for integration flows."""
 
     name = "spotify"
 
-    def __init__(self, *, client: SpotifyClient, result_cap: int = 50) -> None:
+    def __init__(self, *, client: SpotifyHttpClient, result_cap: int = 50) -> None:
         self._client = client
         self._result_cap = max(1, result_cap)
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def search_tracks(self, query: SearchQuery) -> list[ProviderTrack]:
         effective_limit = max(1, min(query.limit, self._result_cap))
 
-        def _search() -> list[ProviderTrack]:
+        async def _search() -> list[ProviderTrack]:
             try:
-                payload = self._client.search_tracks(query.text, limit=effective_limit)
+                payload = await self._client.search(
+                    query.text, type="track", limit=effective_limit
+                )
             except Exception as exc:  # pragma: no cover - network errors mocked in tests
                 raise ProviderDependencyError(
                     self.name, "spotify search failed", cause=exc
@@ -71,7 +75,7 @@ class SpotifyAdapter(TrackProvider):
             return results
 
         try:
-            return await asyncio.to_thread(_search)
+            return await _search()
         except ProviderDependencyError:
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
@@ -89,8 +93,8 @@ class SpotifyAdapter(TrackProvider):
                 status_code=400,
             )
 
-        def _select_by_name(value: str) -> Any:
-            response = self._client.search_artists(value, limit=1)
+        async def _select_by_name(value: str) -> Any:
+            response = await self._client.search(value, type="artist", limit=1)
             if not isinstance(response, dict):
                 return None
             container = response.get("artists")
@@ -106,13 +110,13 @@ class SpotifyAdapter(TrackProvider):
                     return entry
             return None
 
-        def _load() -> ProviderArtist:
+        async def _load() -> ProviderArtist:
             try:
                 payload: Any
                 if identifier:
-                    payload = self._client.get_artist(identifier)
+                    payload = await self._client.artist(identifier)
                 else:
-                    payload = _select_by_name(query_name)
+                    payload = await _select_by_name(query_name)
             except Exception as exc:  # pragma: no cover - network errors mocked in tests
                 raise ProviderDependencyError(
                     self.name, "spotify artist lookup failed", cause=exc
@@ -127,7 +131,7 @@ class SpotifyAdapter(TrackProvider):
                 raise ProviderInternalError(self.name, "invalid artist payload") from exc
 
         try:
-            return await asyncio.to_thread(_load)
+            return await _load()
         except ProviderDependencyError:
             raise
         except ProviderNotFoundError:
@@ -153,9 +157,11 @@ class SpotifyAdapter(TrackProvider):
             except (TypeError, ValueError):
                 max_items = None
 
-        def _load() -> list[ProviderRelease]:
+        async def _load() -> list[ProviderRelease]:
             try:
-                payload = self._client.get_artist_releases(identifier)
+                payload = await self._client.artist_albums(
+                    identifier, include_groups="album,single,compilation"
+                )
             except Exception as exc:  # pragma: no cover - network errors mocked in tests
                 raise ProviderDependencyError(
                     self.name, "spotify artist releases failed", cause=exc
@@ -193,7 +199,7 @@ class SpotifyAdapter(TrackProvider):
             return releases
 
         try:
-            return await asyncio.to_thread(_load)
+            return await _load()
         except ProviderDependencyError:
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
@@ -208,9 +214,9 @@ class SpotifyAdapter(TrackProvider):
                 status_code=400,
             )
 
-        def _load() -> ProviderAlbumDetails:
+        async def _load() -> ProviderAlbumDetails:
             try:
-                album_payload: Any = self._client.get_album_details(identifier)
+                album_payload: Any = await self._client.album(identifier)
             except Exception as exc:  # pragma: no cover - network errors mocked in tests
                 raise ProviderDependencyError(
                     self.name, "spotify album lookup failed", cause=exc
@@ -220,7 +226,7 @@ class SpotifyAdapter(TrackProvider):
                 raise ProviderNotFoundError(self.name, "album not found", status_code=404)
 
             try:
-                tracks_payload: Any = self._client.get_album_tracks(identifier)
+                tracks_payload: Any = await self._client.album_tracks(identifier)
             except Exception as exc:  # pragma: no cover - network errors mocked in tests
                 raise ProviderDependencyError(
                     self.name, "spotify album tracks failed", cause=exc
@@ -245,7 +251,7 @@ class SpotifyAdapter(TrackProvider):
             )
 
         try:
-            return await asyncio.to_thread(_load)
+            return await _load()
         except ProviderDependencyError:
             raise
         except ProviderNotFoundError:
@@ -269,9 +275,9 @@ class SpotifyAdapter(TrackProvider):
         except (TypeError, ValueError):
             max_items = None
 
-        def _load() -> list[ProviderTrack]:
+        async def _load() -> list[ProviderTrack]:
             try:
-                payload: Any = self._client.get_artist_top_tracks(identifier)
+                payload: Any = await self._client.artist_top_tracks(identifier)
             except Exception as exc:  # pragma: no cover - network errors mocked in tests
                 raise ProviderDependencyError(
                     self.name, "spotify artist top tracks failed", cause=exc
@@ -298,7 +304,7 @@ class SpotifyAdapter(TrackProvider):
             return results
 
         try:
-            return await asyncio.to_thread(_load)
+            return await _load()
         except ProviderDependencyError:
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
@@ -0,0 +1,284 @@
+"""Async HTTP client for the Spotify Web API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+import httpx
+
+from app.core.provider_cache import ProviderCache
+from app.logging import get_logger
+from app.utils.concurrency import AsyncTokenBucket
+from app.utils.retry import RetryDirective, parse_retry_after_ms, with_retry
+
+logger = get_logger(__name__)
+
+SPOTIFY_API_BASE_URL = "https://api.spotify.com/v1"
+_ALBUM_TRACKS_PAGE_SIZE = 50
+
+
+class SpotifyHttpError(RuntimeError):
+    """Raised when a Spotify Web API request failed."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retryable: bool = False,
+        retry_after_ms: int | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after_ms = retry_after_ms
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    return isinstance(exc, SpotifyHttpError) and exc.status_code == 404
+
+
+@dataclass(slots=True)
+class SpotifyHttpClient:
+    """HTTPX based Spotify Web API client for async callers.
+
+    Requests share one pooled :class:`httpx.AsyncClient` and draw from an
+    :class:`AsyncTokenBucket`, so waiting for the rate limit costs no thread.
+    A ``429`` pauses the bucket for the ``Retry-After`` period, which holds
+    back every caller rather than just the one that was rejected. The OAuth
+    token comes from ``token_provider`` (Spotipy's auth manager); it is
+    fetched in a worker thread only when the cached token is older than
+    ``token_refresh_seconds`` or Spotify answered ``401``.
+
+    Artist and album lookups go through ``cache`` with the same operation
+    keys as :class:`~app.core.spotify_client.SpotifyClient`, so both clients
+    share cached payloads.
+    """
+
+    token_provider: Callable[[], str | None]
+    base_url: str = SPOTIFY_API_BASE_URL
+    transport: httpx.AsyncBaseTransport | None = None
+    cache: ProviderCache | None = None
+    timeout_ms: int = 15_000
+    max_attempts: int = 3
+    backoff_base_ms: int = 500
+    jitter_pct: int = 20
+    rate_per_second: float = 10.0
+    burst: int = 10
+    max_retry_after_ms: int = 60_000
+    max_connections: int = 32
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 30.0
+    token_refresh_seconds: float = 300.0
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _bucket: AsyncTokenBucket = field(init=False, repr=False)
+    _token: str | None = field(default=None, init=False, repr=False)
+    _token_fetched_at: float = field(default=0.0, init=False, repr=False)
+    _token_lock: asyncio.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._bucket = AsyncTokenBucket(rate=self.rate_per_second, capacity=self.burst)
+        self._token_lock = asyncio.Lock()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def search(self, query: str, *, type: str, limit: int = 20) -> Any:
+        return await self.get_json("/search", params={"q": query, "type": type, "limit": limit})
+
+    async def artist(self, artist_id: str) -> dict[str, Any] | None:
+        return await self._cached("artist", artist_id, f"/artists/{artist_id}")
+
+    async def artist_albums(
+        self,
+        artist_id: str,
+        *,
+        include_groups: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Any:
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if include_groups:
+            params["include_groups"] = include_groups
+        return await self.get_json(f"/artists/{artist_id}/albums", params=params)
+
+    async def artist_top_tracks(self, artist_id: str, *, market: str = "US") -> Any:
+        # Spotipy's artist_top_tracks defaults to country="US"; keep that so
+        # results match the adapter this client replaced.
+        return await self.get_json(f"/artists/{artist_id}/top-tracks", params={"market": market})
+
+    async def album(self, album_id: str) -> dict[str, Any] | None:
+        return await self._cached("album", album_id, f"/albums/{album_id}")
+
+    async def album_tracks(
+        self, album_id: str, *, market: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return every track of *album_id*, following pagination."""
+
+        async def _load() -> list[dict[str, Any]]:
+            tracks: list[dict[str, Any]] = []
+            offset = 0
+            while True:
+                params: dict[str, Any] = {"limit": _ALBUM_TRACKS_PAGE_SIZE, "offset": offset}
+                if market:
+                    params["market"] = market
+                page = await self.get_json(f"/albums/{album_id}/tracks", params=params)
+                items = page.get("items") if isinstance(page, Mapping) else None
+                if not isinstance(items, list) or not items:
+                    break
+                tracks.extend(item for item in items if isinstance(item, dict))
+                offset += _ALBUM_TRACKS_PAGE_SIZE
+                if not page.get("next"):
+                    break
+            return tracks
+
+        key = f"{album_id}:{market or ''}"
+        if self.cache is None:
+            try:
+                return await _load()
+            except SpotifyHttpError as exc:
+                if _is_not_found(exc):
+                    return []
+                raise
+        tracks = await self.cache.aget_or_load(
+            "album_tracks", key, _load, is_not_found=_is_not_found
+        )
+        return tracks or []
+
+    async def get_json(self, path: str, *, params: Mapping[str, Any] | None = None) -> Any:
+        response = await self._request("GET", path, params=params)
+        try:
+            return response.json()
+        except ValueError as exc:  # pragma: no cover - defensive guard
+            raise SpotifyHttpError("Spotify returned invalid JSON") from exc
+
+    async def _cached(self, operation: str, key: str, path: str) -> Any:
+        async def _load() -> Any:
+            return await self.get_json(path)
+
+        if self.cache is not None:
+            return await self.cache.aget_or_load(
+                operation, key, _load, is_not_found=_is_not_found
+            )
+        try:
+            return await _load()
+        except SpotifyHttpError as exc:
+            if _is_not_found(exc):
+                return None
+            raise
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+    ) -> httpx.Response:
+        refreshed_token = False
+
+        async def _perform_request() -> httpx.Response:
+            nonlocal refreshed_token
+            await self._bucket.acquire()
+            token = await self._access_token()
+            try:
+                response = await self._get_client().request(
+                    method,
+                    path,
+                    params=params,
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+            except httpx.TimeoutException as exc:
+                raise SpotifyHttpError("Spotify request timed out", retryable=True) from exc
+            except httpx.HTTPError as exc:
+                raise SpotifyHttpError(
+                    f"Spotify request failed: {exc}", retryable=True
+                ) from exc
+
+            status = response.status_code
+            if status < 300:
+                return response
+            if status == httpx.codes.UNAUTHORIZED:
+                self._token = None
+                retry = not refreshed_token
+                refreshed_token = True
+                raise SpotifyHttpError(
+                    "Spotify rejected the access token", status_code=status, retryable=retry
+                )
+            if status == httpx.codes.TOO_MANY_REQUESTS:
+                retry_after_ms = parse_retry_after_ms(response.headers)
+                wait_ms = retry_after_ms if retry_after_ms is not None else self.backoff_base_ms
+                self._bucket.pause(min(wait_ms, self.max_retry_after_ms) / 1000.0)
+                logger.warning(
+                    "Spotify rate limited the client",
+                    extra={"event": "spotify.http.rate_limited", "retry_after_ms": wait_ms},
+                )
+                raise SpotifyHttpError(
+                    "Spotify rate limited the request",
+                    status_code=status,
+                    retryable=wait_ms <= self.max_retry_after_ms,
+                    retry_after_ms=retry_after_ms,
+                )
+            raise SpotifyHttpError(
+                f"Spotify responded with status {status}",
+                status_code=status,
+                retryable=status >= 500,
+            )
+
+        def _classify(error: Exception) -> RetryDirective:
+            if isinstance(error, SpotifyHttpError):
+                # A rate limited retry waits on the paused bucket instead.
+                delay = 0 if error.status_code in {401, 429} else None
+                return RetryDirective(
+                    retry=error.retryable, error=error, delay_override_ms=delay
+                )
+            return RetryDirective(retry=False, error=error)
+
+        return await with_retry(
+            _perform_request,
+            attempts=max(1, int(self.max_attempts)),
+            base_ms=max(1, int(self.backoff_base_ms)),
+            jitter_pct=max(0, int(self.jitter_pct)),
+            timeout_ms=None,
+            classify_err=_classify,
+        )
+
+    async def _access_token(self) -> str:
+        async with self._token_lock:
+            now = time.monotonic()
+            if self._token and now - self._token_fetched_at < self.token_refresh_seconds:
+                return self._token
+            token = await asyncio.to_thread(self.token_provider)
+            if not token:
+                raise SpotifyHttpError("Spotify is not authenticated", status_code=401)
+            self._token = token
+            self._token_fetched_at = now
+            return token
+
+    def _get_client(self) -> httpx.AsyncClient:
+        client = self._client
+        if client is None or client.is_closed:
+            timeout_seconds = max(self.timeout_ms, 100) / 1000
+            client = httpx.AsyncClient(
+                base_url=self.base_url.rstrip("/"),
+                timeout=httpx.Timeout(timeout_seconds, connect=min(timeout_seconds, 5.0)),
+                headers={"Accept": "application/json"},
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=max(1, int(self.max_connections)),
+                    max_keepalive_connections=max(0, int(self.max_keepalive_connections)),
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+            self._client = client
+        return client
+
+
+__all__ = ["SPOTIFY_API_BASE_URL", "SpotifyHttpClient", "SpotifyHttpError"]
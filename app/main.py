@@ -519,8 +519,7 @@ async def _start_orchestrator_workers(
         await state.import_worker.start()
         worker_status["import"] = True
     state.hdm_runtime = orchestrator.hdm
-    await orchestrator.hdm.orchestrator.start()
-    await orchestrator.hdm.recovery.start()
+    await orchestrator.hdm.start()
     worker_status["hdm"] = True
     worker_status["orchestrator_scheduler"] = True
     worker_status["orchestrator_dispatcher"] = True
@@ -624,8 +623,7 @@ async def _stop_orchestrator_workers(app: FastAPI) -> None:
             delattr(state, attribute)
 
     if hdm_runtime is not None:
-        await hdm_runtime.orchestrator.shutdown()
-        await hdm_runtime.recovery.shutdown()
+        await hdm_runtime.shutdown()
 
     if orchestrator_status is not None:
         orchestrator_status["scheduler_running"] = False
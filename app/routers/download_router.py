@@ -104,6 +104,8 @@ async def submit_hdm_batch(
         batch_id=payload.batch_id,
         priority=payload.priority,
         dedupe_key=payload.dedupe_key,
+        weight=payload.weight,
+        interactive=payload.interactive,
     )
     log_event(
         logger,
@@ -133,6 +133,7 @@ async def soulseek_search(
             format_priority=tuple(payload.preferred_formats)
             if payload.preferred_formats is not None
             else None,
+            allow_stale=True,
         )
     except SoulseekClientError as exc:
         logger.error("Soulseek search failed: %s", exc)
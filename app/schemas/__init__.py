@@ -220,6 +220,16 @@ class HdmBatchRequest(BaseModel):
         None, ge=0, description="Priority to apply to all items if provided"
     )
     dedupe_key: str | None = Field(None, description="Optional idempotency key for the batch")
+    weight: int | None = Field(
+        None,
+        ge=1,
+        le=100,
+        description="Relative share of worker turns compared to other batches",
+    )
+    interactive: bool | None = Field(
+        None,
+        description="Schedule on the fast lane; defaults to true for single-item batches",
+    )
 
     @field_validator("requested_by")
     @classmethod
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import hashlib
@@ -106,11 +107,24 @@ class BackfillJobRecord:
 class BackfillService:
     """Orchestrate Spotify enrichment for FREE ingest items."""
 
-    def __init__(self, config: SpotifyConfig, spotify_client: SpotifyClient | None) -> None:
+    def __init__(
+        self,
+        config: SpotifyConfig,
+        spotify_client: SpotifyClient | None,
+        *,
+        search_concurrency: int = 4,
+        batch_size: int = 50,
+        checkpoint_items: int = 500,
+        checkpoint_seconds: float = 5.0,
+    ) -> None:
         self._config = config
         self._spotify = spotify_client
         self._default_limit = max(1, getattr(config, "backfill_max_items", 2_000))
         self._cache_ttl = max(60, getattr(config, "backfill_cache_ttl_seconds", 604_800))
+        self._search_concurrency = max(1, int(search_concurrency))
+        self._batch_size = max(1, int(batch_size))
+        self._checkpoint_items = max(1, int(checkpoint_items))
+        self._checkpoint_seconds = max(0.0, float(checkpoint_seconds))
 
     # Public API ---------------------------------------------------------
 
@@ -280,29 +294,41 @@ class BackfillService:
 
         try:
             candidates = self._load_candidates(job.limit)
-            for candidate in candidates:
-                processed += 1
-                matched_item, from_cache = self._process_candidate(
-                    candidate,
-                    metadata_cache,
-                    include_cached_results=job.include_cached_results,
-                )
-                if from_cache:
-                    cache_hits += 1
-                else:
-                    cache_misses += 1
-                if matched_item:
-                    matched += 1
-
-                self._persist_progress(
-                    job.id,
-                    processed=processed,
-                    matched=matched,
-                    cache_hits=cache_hits,
-                    cache_misses=cache_misses,
-                    expanded_playlists=playlists_expanded,
-                    expanded_tracks=tracks_added,
-                )
+            last_checkpoint = time.monotonic()
+            checkpointed = 0
+            with ThreadPoolExecutor(
+                max_workers=self._search_concurrency, thread_name_prefix="backfill-search"
+            ) as pool:
+                for start in range(0, len(candidates), self._batch_size):
+                    batch = candidates[start : start + self._batch_size]
+                    batch_matched, batch_hits = self._process_batch(
+                        batch,
+                        metadata_cache,
+                        pool,
+                        include_cached_results=job.include_cached_results,
+                    )
+                    processed += len(batch)
+                    matched += batch_matched
+                    cache_hits += batch_hits
+                    cache_misses += len(batch) - batch_hits
+
+                    now = time.monotonic()
+                    if (
+                        processed - checkpointed >= self._checkpoint_items
+                        or now - last_checkpoint >= self._checkpoint_seconds
+                        or processed == len(candidates)
+                    ):
+                        self._persist_progress(
+                            job.id,
+                            processed=processed,
+                            matched=matched,
+                            cache_hits=cache_hits,
+                            cache_misses=cache_misses,
+                            expanded_playlists=playlists_expanded,
+                            expanded_tracks=tracks_added,
+                        )
+                        checkpointed = processed
+                        last_checkpoint = now
 
             if job.expand_playlists:
                 playlists_expanded, tracks_added = self._expand_playlists(job.id)
@@ -338,7 +364,7 @@ class BackfillService:
                 duration_ms,
                 job.include_cached_results,
             )
-        except Exception as exc:  # pragma: no cover - defensive guard
+        except Exception as exc:
             logger.exception("event=backfill job_id=%s state=failed", job.id)
             duration_ms = int((time.perf_counter() - start_time) * 1000)
             self._finalise_job(
@@ -350,48 +376,76 @@ class BackfillService:
 
     # Candidate processing -----------------------------------------------
 
-    def _process_candidate(
+    def _process_batch(
         self,
-        candidate: CandidateItem,
+        candidates: Sequence[CandidateItem],
         metadata_cache: dict[str, dict[str, Any]],
+        pool: ThreadPoolExecutor,
         *,
         include_cached_results: bool,
-    ) -> tuple[bool, bool]:
-        key = self._build_cache_key(candidate)
-        cache_hit = False
-        metadata: dict[str, Any] | None = None
-
-        if include_cached_results and key:
-            cached = self._get_cache_entry(key)
-            if cached is not None:
-                cache_hit = True
-                cached_track_id, cached_album_id = cached
-                metadata = self._fetch_track_metadata(
-                    cached_track_id, cached_album_id, metadata_cache
-                )
-
-        if metadata is None:
-            cache_hit = False if key else cache_hit
-            client = self._require_spotify()
-            track = client.find_track_match(
-                artist=candidate.artist,
-                title=candidate.title,
-                album=candidate.album,
-                duration_ms=candidate.duration_ms,
+    ) -> tuple[int, int]:
+        """Resolve a batch of candidates and return ``(matched, cache_hits)``.
+
+        Cached matches are resolved through batched track lookups; the rest
+        are searched concurrently on *pool*. Cache entries and ingest items
+        are written in one transaction each.
+        """
+
+        keys = {candidate.id: self._build_cache_key(candidate) for candidate in candidates}
+        cached: dict[str, tuple[str, str | None]] = {}
+        if include_cached_results:
+            cached = self._get_cache_entries([key for key in keys.values() if key])
+
+        resolved: dict[int, dict[str, Any]] = {}
+        hits = 0
+        cached_tracks = {
+            candidate.id: cached[key]
+            for candidate in candidates
+            if (key := keys[candidate.id]) and key in cached
+        }
+        if cached_tracks:
+            self._fetch_tracks_metadata(
+                [track_id for track_id, _album_id in cached_tracks.values()], metadata_cache
             )
+            for item_id, (track_id, album_id) in cached_tracks.items():
+                metadata = metadata_cache.get(track_id)
+                if metadata is None:
+                    continue
+                if not metadata.get("album_id") and album_id:
+                    metadata = {**metadata, "album_id": album_id}
+                resolved[item_id] = metadata
+                hits += 1
+
+        pending = [candidate for candidate in candidates if candidate.id not in resolved]
+        new_entries: dict[str, tuple[str, str | None]] = {}
+        for candidate, track in zip(pending, pool.map(self._search_candidate, pending)):
             if not track:
-                return False, cache_hit
-
+                continue
             metadata = self._extract_track_metadata(track)
             track_id_value = metadata.get("track_id")
             if not isinstance(track_id_value, str) or not track_id_value:
-                return False, cache_hit
+                continue
             metadata_cache[track_id_value] = metadata
+            resolved[candidate.id] = metadata
+            key = keys[candidate.id]
             if key:
-                self._store_cache_entry(key, track_id_value, metadata.get("album_id"))
+                new_entries[key] = (track_id_value, metadata.get("album_id"))
 
-        self._update_ingest_item(candidate.id, metadata)
-        return True, cache_hit
+        if new_entries:
+            self._store_cache_entries(new_entries)
+        if resolved:
+            self._update_ingest_items(resolved)
+        return len(resolved), hits
+
+    def _search_candidate(self, candidate: CandidateItem) -> dict[str, Any] | None:
+        # Errors propagate through ``pool.map`` so an outage fails the job.
+        client = self._require_spotify()
+        return client.find_track_match(
+            artist=candidate.artist,
+            title=candidate.title,
+            album=candidate.album,
+            duration_ms=candidate.duration_ms,
+        )
 
     def _load_candidates(self, limit: int) -> list[CandidateItem]:
         statement: Select[tuple[int, str, str, str | None, int | None]] = (
@@ -431,21 +485,20 @@ class BackfillService:
             )
         return candidates
 
-    def _update_ingest_item(self, item_id: int, metadata: dict[str, Any]) -> None:
-        duration_ms = metadata.get("duration_ms")
-        duration_sec = int(round(duration_ms / 1000)) if duration_ms else None
-
+    def _update_ingest_items(self, resolved: dict[int, dict[str, Any]]) -> None:
         with session_scope() as session:
-            item = session.get(IngestItem, item_id)
-            if item is None:
-                return
-
-            item.spotify_track_id = metadata.get("track_id")
-            item.spotify_album_id = metadata.get("album_id")
-            item.isrc = metadata.get("isrc")
-            if duration_sec:
-                item.duration_sec = duration_sec
-            session.add(item)
+            items = session.scalars(
+                select(IngestItem).where(IngestItem.id.in_(tuple(resolved)))
+            )
+            for item in items:
+                metadata = resolved[item.id]
+                duration_ms = metadata.get("duration_ms")
+                duration_sec = int(round(duration_ms / 1000)) if duration_ms else None
+                item.spotify_track_id = metadata.get("track_id")
+                item.spotify_album_id = metadata.get("album_id")
+                item.isrc = metadata.get("isrc")
+                if duration_sec:
+                    item.duration_sec = duration_sec
 
     # Playlist expansion -------------------------------------------------
 
@@ -591,10 +644,19 @@ class BackfillService:
         tracks: list[dict[str, Any]] = []
         offset = 0
         limit = 100
+        snapshot_id: str | None = None
+        if client.cache is not None:
+            # Pages cached under the current snapshot are still exact.
+            try:
+                snapshot_id = client.get_playlist_snapshot_id(playlist_id)
+            except Exception:  # pragma: no cover - fall back to uncached pages
+                snapshot_id = None
 
         while True:
             try:
-                response = client.get_playlist_items(playlist_id, limit=limit, offset=offset)
+                response = client.get_playlist_items(
+                    playlist_id, limit=limit, offset=offset, snapshot_id=snapshot_id
+                )
             except Exception as exc:  # pragma: no cover - defensive guard
                 logger.warning(
                     "event=backfill playlist_fetch_failed playlist_id=%s error=%s",
@@ -727,68 +789,62 @@ class BackfillService:
             return None
         return f"{artist}|{title}|{album}".strip("|")
 
-    def _get_cache_entry(self, key: str) -> tuple[str, str | None] | None:
+    def _get_cache_entries(self, keys: Sequence[str]) -> dict[str, tuple[str, str | None]]:
+        if not keys:
+            return {}
         now = datetime.utcnow()
         with session_scope() as session:
-            entry = session.get(SpotifyCache, key)
-            if entry is None:
-                return None
-            if entry.expires_at <= now:
-                session.delete(entry)
-                return None
-            if not entry.track_id:
-                return None
-            return entry.track_id, entry.album_id
+            entries = session.scalars(
+                select(SpotifyCache).where(SpotifyCache.key.in_(tuple(set(keys))))
+            )
+            return {
+                entry.key: (entry.track_id, entry.album_id)
+                for entry in entries
+                if entry.track_id and entry.expires_at > now
+            }
 
-    def _store_cache_entry(self, key: str, track_id: str, album_id: str | None) -> None:
-        if not track_id:
-            return
+    def _store_cache_entries(self, entries: dict[str, tuple[str, str | None]]) -> None:
         expires_at = datetime.utcnow() + timedelta(seconds=self._cache_ttl)
         with session_scope() as session:
-            entry = session.get(SpotifyCache, key)
-            if entry is None:
-                entry = SpotifyCache(
-                    key=key,
-                    track_id=track_id,
-                    album_id=album_id,
-                    expires_at=expires_at,
+            existing = {
+                entry.key: entry
+                for entry in session.scalars(
+                    select(SpotifyCache).where(SpotifyCache.key.in_(tuple(entries)))
                 )
-                session.add(entry)
-            else:
-                entry.track_id = track_id
-                entry.album_id = album_id
-                entry.expires_at = expires_at
-                session.add(entry)
-
-    def _fetch_track_metadata(
-        self,
-        track_id: str,
-        album_id: str | None,
-        cache: dict[str, dict[str, Any]],
-    ) -> dict[str, Any]:
-        if not track_id:
-            return {
-                "track_id": None,
-                "album_id": album_id,
-                "isrc": None,
-                "duration_ms": None,
             }
+            for key, (track_id, album_id) in entries.items():
+                entry = existing.get(key)
+                if entry is None:
+                    session.add(
+                        SpotifyCache(
+                            key=key,
+                            track_id=track_id,
+                            album_id=album_id,
+                            expires_at=expires_at,
+                        )
+                    )
+                else:
+                    entry.track_id = track_id
+                    entry.album_id = album_id
+                    entry.expires_at = expires_at
 
-        if track_id in cache:
-            return cache[track_id]
-
+    def _fetch_tracks_metadata(
+        self, track_ids: Sequence[str], cache: dict[str, dict[str, Any]]
+    ) -> None:
+        missing = list(dict.fromkeys(track_id for track_id in track_ids if track_id not in cache))
+        if not missing:
+            return
         client = self._require_spotify()
         try:
-            track = client.get_track_details(track_id)
+            tracks = client.get_tracks_details(missing)
         except Exception as exc:  # pragma: no cover - defensive guard
-            logger.debug("Spotify track lookup failed for %s: %s", track_id, exc)
-            track = {}
-
-        metadata = self._extract_track_metadata(track)
-        if not metadata.get("album_id") and album_id:
-            metadata["album_id"] = album_id
-        cache[track_id] = metadata
-        return metadata
+            logger.debug("Spotify track batch lookup failed: %s", exc)
+            return
+        for track in tracks:
+            metadata = self._extract_track_metadata(track)
+            track_id = metadata.get("track_id")
+            if isinstance(track_id, str) and track_id:
+                cache[track_id] = metadata
 
     @staticmethod
     def _extract_track_metadata(track: dict[str, Any]) -> dict[str, Any]:
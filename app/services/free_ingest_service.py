@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable, Iterable, Sequence
 import csv
 from dataclasses import dataclass
@@ -63,6 +64,16 @@ class NormalizedTrack:
     raw_line: str
 
 
+@dataclass(slots=True)
+class _ResolvedTrack:
+    track: NormalizedTrack
+    username: str
+    candidate: dict[str, Any]
+    query: str
+    priority: int
+    download_id: int | None = None
+
+
 @dataclass(slots=True)
 class IngestAccepted:
     playlists: int
@@ -785,29 +796,58 @@ class FreeIngestService:
         await self._update_job_state(job_id, IngestJobState.QUEUED)
         queued = 0
         failed = 0
+        search_slots = asyncio.Semaphore(self._resolve_search_concurrency())
 
         for batch in self._chunk(tracks, batch_size):
-            for track in batch:
-                try:
-                    success = await self._enqueue_track(job_id, track)
-                except Exception as exc:
+            outcomes = await asyncio.gather(
+                *(self._resolve_track(track, search_slots) for track in batch),
+                return_exceptions=True,
+            )
+            states: dict[int, tuple[IngestItemState, str | None]] = {}
+            resolved: list[_ResolvedTrack] = []
+            for track, outcome in zip(batch, outcomes):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                if isinstance(outcome, BaseException):
                     logger.error(
                         "event=ingest_enqueue_failed job_id=%s item_id=%s error=%s",
                         job_id,
                         track.item_id,
-                        exc,
+                        outcome,
                     )
-                    await self._set_item_state(
-                        track.item_id,
-                        IngestItemState.FAILED,
-                        error=str(exc),
-                    )
-                    failed += 1
-                    continue
-                if success:
-                    queued += 1
+                    states[track.item_id] = (IngestItemState.FAILED, str(outcome))
+                elif outcome is None:
+                    states[track.item_id] = (IngestItemState.FAILED, "no_match")
                 else:
-                    failed += 1
+                    resolved.append(outcome)
+
+            if resolved:
+                await self._create_download_records(job_id, resolved)
+                results = await asyncio.gather(
+                    *(self._submit_download(entry) for entry in resolved),
+                    return_exceptions=True,
+                )
+                for entry, result in zip(resolved, results):
+                    item_id = entry.track.item_id
+                    if isinstance(result, asyncio.CancelledError):
+                        raise result
+                    if isinstance(result, BaseException):
+                        logger.error(
+                            "event=ingest_enqueue_failed job_id=%s item_id=%s error=%s",
+                            job_id,
+                            item_id,
+                            result,
+                        )
+                        states[item_id] = (IngestItemState.FAILED, str(result))
+                    else:
+                        states[item_id] = (IngestItemState.QUEUED, None)
+
+            await self._set_item_states(states)
+            batch_queued = sum(
+                1 for state, _ in states.values() if state is IngestItemState.QUEUED
+            )
+            queued += batch_queued
+            failed += len(states) - batch_queued
 
         logger.info(
             "event=ingest_enqueued source=FREE job_id=%s queued=%s failed=%s batches=%s",
@@ -818,102 +858,121 @@ class FreeIngestService:
         )
         return queued, failed
 
-    async def _enqueue_track(self, job_id: str, track: NormalizedTrack) -> bool:
-        queries = self._generate_search_queries(track)
-        username: str | None = None
-        candidate: dict[str, Any] | None = None
-        query_used: str | None = None
+    def _resolve_search_concurrency(self) -> int:
+        limit = max(1, self._config.free_ingest.search_concurrency)
+        # Never hold more searches in flight than one slskd rate-limit window admits.
+        budget = getattr(self._soulseek, "RATE_LIMIT_COUNT", None)
+        if isinstance(budget, int) and budget > 0:
+            limit = min(limit, budget)
+        return limit
 
-        for query in queries:
-            if not query:
-                continue
-            try:
+    async def _resolve_track(
+        self,
+        track: NormalizedTrack,
+        search_slots: asyncio.Semaphore,
+    ) -> _ResolvedTrack | None:
+        queries = [query for query in self._generate_search_queries(track) if query]
+        if not queries:
+            return None
+
+        async def _search(query: str) -> tuple[str, str | None, dict[str, Any] | None]:
+            async with search_slots:
                 results = await self._soulseek.search(
                     query,
                     format_priority=tuple(LOSSLESS_FORMATS),
                 )
-            except Exception:
-                raise
             username, candidate = self._select_candidate(results)
-            if username and candidate:
-                query_used = query
-                break
-
-        if not username or not candidate or not query_used:
-            await self._set_item_state(track.item_id, IngestItemState.FAILED, error="no_match")
-            return False
-
-        priority = 10 if str(candidate.get("format", "")).lower() in LOSSLESS_FORMATS else 0
-        download_id = await self._create_download_record(
-            job_id=job_id,
-            track=track,
-            username=username,
-            file_info=candidate,
-            priority=priority,
-            query=query_used,
-        )
-
-        job_file = dict(candidate)
-        job_file.setdefault("filename", job_file.get("name"))
-        job_file["download_id"] = download_id
-        job_file["priority"] = priority
-        job_payload = {"username": username, "files": [job_file]}
+            return query, username, candidate
 
+        # All variants search concurrently, but results are taken in priority
+        # order: a broader variant only wins once every more precise one has
+        # finished without a match.
+        tasks = [asyncio.create_task(_search(query)) for query in queries]
+        first_error: Exception | None = None
         try:
-            if self._sync_worker is not None:
-                await self._sync_worker.enqueue(job_payload)
-            else:
-                await self._soulseek.download(job_payload)
-        except Exception:
-            await self._set_item_state(track.item_id, IngestItemState.FAILED, error="queue_error")
-            raise
+            for task in tasks:
+                try:
+                    query, username, candidate = await task
+                except Exception as exc:
+                    first_error = first_error or exc
+                    continue
+                if username and candidate:
+                    fmt = str(candidate.get("format", "")).lower()
+                    return _ResolvedTrack(
+                        track=track,
+                        username=username,
+                        candidate=candidate,
+                        query=query,
+                        priority=10 if fmt in LOSSLESS_FORMATS else 0,
+                    )
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if first_error is not None:
+            raise first_error
+        return None
+
+    async def _submit_download(self, entry: _ResolvedTrack) -> None:
+        job_file = dict(entry.candidate)
+        job_file.setdefault("filename", job_file.get("name"))
+        job_file["download_id"] = entry.download_id
+        job_file["priority"] = entry.priority
+        job_payload = {"username": entry.username, "files": [job_file]}
 
-        await self._set_item_state(track.item_id, IngestItemState.QUEUED, error=None)
-        return True
+        if self._sync_worker is not None:
+            await self._sync_worker.enqueue(job_payload)
+            return
+        await self._soulseek.download(job_payload)
 
-    async def _create_download_record(
+    async def _create_download_records(
         self,
-        *,
         job_id: str,
-        track: NormalizedTrack,
-        username: str,
-        file_info: dict[str, Any],
-        priority: int,
-        query: str,
-    ) -> int:
-        def _create(session) -> int:
-            download = Download(
-                filename=file_info.get("filename")
-                or file_info.get("name")
-                or f"{track.title}.flac",
-                state="queued",
-                progress=0.0,
-                username=username,
-                priority=priority,
-            )
-            session.add(download)
+        entries: Sequence[_ResolvedTrack],
+    ) -> None:
+        def _create(session) -> list[int]:
+            downloads: list[Download] = []
+            for entry in entries:
+                track = entry.track
+                downloads.append(
+                    Download(
+                        filename=entry.candidate.get("filename")
+                        or entry.candidate.get("name")
+                        or f"{track.title}.flac",
+                        state="queued",
+                        progress=0.0,
+                        username=entry.username,
+                        priority=entry.priority,
+                        job_id=job_id,
+                    )
+                )
+            session.add_all(downloads)
             session.flush()
-            payload = {
-                "source": "free_ingest",
-                "job_id": job_id,
-                "ingest_item_id": track.item_id,
-                "query": query,
-                "track": {
-                    "artist": track.artist,
-                    "title": track.title,
-                    "album": track.album,
-                    "duration_sec": track.duration_sec,
-                },
-                "file": dict(file_info),
-            }
-            payload["download_id"] = download.id
-            payload["priority"] = priority
-            download.request_payload = payload
-            download.job_id = job_id
-            session.add(download)
-            return download.id
-
-        return await self._run_session(_create)
+            for entry, download in zip(entries, downloads):
+                track = entry.track
+                download.request_payload = {
+                    "source": "free_ingest",
+                    "job_id": job_id,
+                    "ingest_item_id": track.item_id,
+                    "query": entry.query,
+                    "track": {
+                        "artist": track.artist,
+                        "title": track.title,
+                        "album": track.album,
+                        "duration_sec": track.duration_sec,
+                    },
+                    "file": dict(entry.candidate),
+                    "download_id": download.id,
+                    "priority": entry.priority,
+                }
+            return [download.id for download in downloads]
+
+        download_ids = await self._run_session(_create)
+        for entry, download_id in zip(entries, download_ids):
+            entry.download_id = download_id
 
     @staticmethod
     def _generate_search_queries(track: NormalizedTrack) -> list[str]:
@@ -989,20 +1048,21 @@ class FreeIngestService:
         _, _, _, username, candidate = best
         return username, candidate
 
-    async def _set_item_state(
+    async def _set_item_states(
         self,
-        item_id: int,
-        state: IngestItemState | str,
-        *,
-        error: str | None,
+        states: dict[int, tuple[IngestItemState, str | None]],
     ) -> None:
+        if not states:
+            return
+
         def _update(session) -> None:
-            item = session.get(IngestItem, item_id)
-            if item is None:
-                return
-            item.state = state.value if isinstance(state, IngestItemState) else str(state)
-            item.error = error
-            session.add(item)
+            items = session.execute(
+                select(IngestItem).where(IngestItem.id.in_(list(states)))
+            ).scalars()
+            for item in items:
+                state, error = states[item.id]
+                item.state = state.value
+                item.error = error
 
         await self._run_session(_update)
 
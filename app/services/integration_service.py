@@ -42,7 +42,10 @@ class IntegrationService:
             self._gateway = ProviderGateway(providers=providers, config=config)
         else:
             self._gateway = gateway
-        self._health_monitor = ProviderHealthMonitor(self._registry)
+        self._health_monitor = ProviderHealthMonitor(
+            self._registry,
+            resilience=getattr(self._gateway, "resilience_snapshot", None),
+        )
         self._logger = get_logger(__name__)
 
     async def search_tracks(
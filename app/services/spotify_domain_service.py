@@ -78,6 +78,9 @@ class _FreeHealthCacheEntry:
 
 _FREE_HEALTH_CACHE_ATTR = "_spotify_free_health_cache"
 _FREE_HEALTH_CACHE_TTL_SECONDS = 60.0
+# Page reads within this window share one snapshot lookup; an edit made in
+# between shows up once the window has passed.
+_PLAYLIST_SNAPSHOT_MAX_AGE_SECONDS = 30.0
 
 
 class SpotifyDomainService:
@@ -442,10 +445,20 @@ class SpotifyDomainService:
         )
 
     def get_playlist_items(
-        self, playlist_id: str, *, limit: int, offset: int = 0
+        self,
+        playlist_id: str,
+        *,
+        limit: int,
+        offset: int = 0,
+        snapshot_id: str | None = None,
     ) -> PlaylistItemsResult:
         client = self._require_spotify()
-        payload = client.get_playlist_items(playlist_id, limit=limit, offset=offset)
+        payload = client.get_playlist_items(
+            playlist_id,
+            limit=limit,
+            offset=offset,
+            snapshot_id=snapshot_id or self._playlist_snapshot_id(client, playlist_id),
+        )
         total = payload.get("total") if isinstance(payload, Mapping) else None
         if total is None and isinstance(payload, Mapping):
             tracks_payload = payload.get("tracks")
@@ -804,6 +817,20 @@ class SpotifyDomainService:
                 return False
         return True
 
+    @staticmethod
+    def _playlist_snapshot_id(client: SpotifyClient, playlist_id: str) -> str | None:
+        # Checking the snapshot only pays off when pages can be served from
+        # the response cache.
+        if client.cache is None:
+            return None
+        try:
+            return client.get_playlist_snapshot_id(
+                playlist_id, max_age=_PLAYLIST_SNAPSHOT_MAX_AGE_SECONDS
+            )
+        except Exception:  # pragma: no cover - fall back to an uncached read
+            logger.debug("Spotify playlist snapshot lookup failed for %s", playlist_id)
+            return None
+
     def _require_spotify(self) -> SpotifyClient:
         if not self._pro_available or self._spotify is None:
             raise DependencyError(
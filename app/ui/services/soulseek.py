@@ -13,10 +13,12 @@ from app.config import AppConfig, SecurityConfig, SoulseekConfig
 from app.core.soulseek_client import SoulseekClient
 from app.dependencies import (
     get_app_config,
+    get_provider_gateway,
     get_provider_registry,
     get_soulseek_client,
 )
 from app.integrations.health import IntegrationHealth, ProviderHealthMonitor
+from app.integrations.provider_gateway import ProviderGateway
 from app.integrations.registry import ProviderRegistry
 from app.logging import get_logger
 from app.routers.soulseek_router import (
@@ -123,13 +125,17 @@ class SoulseekUiService:
         config: AppConfig,
         soulseek_client: SoulseekClient,
         registry: ProviderRegistry,
+        gateway: ProviderGateway | None = None,
     ) -> None:
         self._request = request
         self._config = config
         self._client = soulseek_client
         self._registry = registry
         self._registry.initialise()
-        self._health_monitor = ProviderHealthMonitor(self._registry)
+        self._health_monitor = ProviderHealthMonitor(
+            self._registry,
+            resilience=gateway.resilience_snapshot if gateway is not None else None,
+        )
 
     async def status(self) -> StatusResponse:
         """Return the Soulseek daemon connectivity status."""
@@ -665,6 +671,7 @@ def get_soulseek_ui_service(
     config: AppConfig = Depends(get_app_config),
     client: SoulseekClient = Depends(get_soulseek_client),
     registry: ProviderRegistry = Depends(get_provider_registry),
+    gateway: ProviderGateway = Depends(get_provider_gateway),
 ) -> SoulseekUiService:
     """FastAPI dependency returning the Soulseek UI service."""
 
@@ -673,6 +680,7 @@ def get_soulseek_ui_service(
         config=config,
         soulseek_client=client,
         registry=registry,
+        gateway=gateway,
     )
 
 
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from contextlib import asynccontextmanager
+import time
 
-__all__ = ["BoundedPools", "acquire_pair"]
+__all__ = ["AsyncTokenBucket", "BoundedPools", "acquire_pair"]
 
 
 class BoundedPools:
@@ -63,3 +64,62 @@ async def acquire_pair(global_sem: asyncio.Semaphore, pool_sem: asyncio.Semaphor
     async with global_sem:
         async with pool_sem:
             yield
+
+
+class AsyncTokenBucket:
+    """Rate limiter refilling ``rate`` tokens per second up to ``capacity``.
+
+    Waiting callers sleep on the event loop instead of blocking a thread and
+    are served in arrival order. :meth:`pause` stops handing out tokens for a
+    while, e.g. when the upstream answered with ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = float(rate)
+        self._capacity = max(1.0, float(capacity if capacity is not None else rate))
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next ``seconds`` and drop the saved burst."""
+
+        if seconds <= 0:
+            return
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, now + seconds)
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self._capacity, self._tokens + (now - start) * self._rate)
+        self._updated = max(self._updated, now)
@@ -10,6 +10,7 @@ try:  # pragma: no cover - exercised indirectly in tests
     from prometheus_client import (
         CollectorRegistry as PromCollectorRegistry,
         Counter as PromCounter,
+        Gauge as PromGauge,
         Histogram as PromHistogram,
     )
 except ModuleNotFoundError:  # pragma: no cover - fallback for offline environments
@@ -142,18 +143,79 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for offline environme
                 )
             return samples
 
+    class _GaugeChild:
+        __slots__ = ("_parent", "_labels")
+
+        def __init__(self, parent: FallbackGauge, labels: tuple[str, ...]) -> None:
+            self._parent = parent
+            self._labels = labels
+
+        def set(self, value: float) -> None:
+            self._parent._values[self._labels] = float(value)
+
+        def inc(self, amount: float = 1.0) -> None:
+            self._parent._values[self._labels] = (
+                self._parent._values.get(self._labels, 0.0) + amount
+            )
+
+        def dec(self, amount: float = 1.0) -> None:
+            self.inc(-amount)
+
+    class FallbackGauge:  # type: ignore[override]
+        def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: tuple[str, ...] | tuple[str, ...] = (),
+            registry: FallbackCollectorRegistry | None = None,
+        ) -> None:
+            self._name = name
+            self._labelnames = tuple(labelnames or ())
+            self._values: dict[tuple[str, ...], float] = {}
+            if registry is not None:
+                registry.register(self)
+
+        def labels(self, *values: str, **kwargs: str) -> _GaugeChild:
+            if kwargs:
+                if values:
+                    raise ValueError("cannot mix positional and keyword label values")
+                ordered = tuple(str(kwargs[name]) for name in self._labelnames)
+                return _GaugeChild(self, ordered)
+            if len(values) != len(self._labelnames):
+                raise ValueError("label value count does not match declaration")
+            return _GaugeChild(self, tuple(str(v) for v in values))
+
+        def set(self, value: float) -> None:
+            self.labels().set(value)
+
+        def inc(self, amount: float = 1.0) -> None:
+            self.labels().inc(amount)
+
+        def dec(self, amount: float = 1.0) -> None:
+            self.labels().dec(amount)
+
+        def _collect(self) -> list[Sample]:
+            samples: list[Sample] = []
+            for labels, value in self._values.items():
+                mapping = {name: str(label) for name, label in zip(self._labelnames, labels)}
+                samples.append(Sample(self._name, mapping, float(value)))
+            return samples
+
     PromCollectorRegistry = FallbackCollectorRegistry
     PromCounter = FallbackCounter
+    PromGauge = FallbackGauge
     PromHistogram = FallbackHistogram
 
 CollectorRegistry = PromCollectorRegistry
 Counter = PromCounter
+Gauge = PromGauge
 Histogram = PromHistogram
 
 
 __all__ = [
     "get_registry",
     "counter",
+    "gauge",
     "histogram",
     "reset_registry",
 ]
@@ -175,6 +237,7 @@ _registry_lock = RLock()
 _registry: PromCollectorRegistry = PromCollectorRegistry()
 _counters: dict[tuple[str, tuple[str, ...]], PromCounter] = {}
 _histograms: dict[tuple[str, tuple[str, ...]], PromHistogram] = {}
+_gauges: dict[tuple[str, tuple[str, ...]], PromGauge] = {}
 
 
 def get_registry() -> PromCollectorRegistry:
@@ -191,6 +254,7 @@ def reset_registry() -> None:
         _registry = PromCollectorRegistry()
         _counters.clear()
         _histograms.clear()
+        _gauges.clear()
 
 
 def counter(
@@ -239,3 +303,26 @@ def histogram(
             )
             _histograms[cache_key] = metric
         return metric
+
+
+def gauge(
+    name: str,
+    documentation: str,
+    *,
+    label_names: Sequence[str] | None = None,
+) -> PromGauge:
+    """Return (or create) a labelled Prometheus gauge registered globally."""
+
+    labels = tuple(label_names or ())
+    cache_key = (name, labels)
+    with _registry_lock:
+        metric = _gauges.get(cache_key)
+        if metric is None:
+            metric = PromGauge(
+                name,
+                documentation,
+                labelnames=labels,
+                registry=_registry,
+            )
+            _gauges[cache_key] = metric
+        return metric
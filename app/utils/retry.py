@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 import random
-from typing import TypeVar
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 
@@ -118,8 +120,49 @@ async def with_retry(
     raise RuntimeError("Retry loop exited unexpectedly")
 
 
+def parse_retry_after_ms(headers: Mapping[str, Any]) -> int | None:
+    """Return the ``Retry-After`` delay in *headers* in milliseconds.
+
+    Accepts both delta-seconds and HTTP-date values; ``None`` when the
+    header is missing or unparsable.
+    """
+
+    value = headers.get("Retry-After") if isinstance(headers, Mapping) else None
+    if value is None:
+        return None
+
+    delay_seconds: float | None = None
+
+    if isinstance(value, int | float):
+        delay_seconds = float(value)
+    else:
+        value_str = str(value).strip()
+        if not value_str:
+            return None
+
+        try:
+            delay_seconds = float(value_str)
+        except ValueError:
+            try:
+                target_dt = parsedate_to_datetime(value_str)
+            except (TypeError, ValueError):
+                return None
+            if target_dt is None:
+                return None
+            if target_dt.tzinfo is None:
+                target_dt = target_dt.replace(tzinfo=UTC)
+            now = datetime.now(UTC)
+            delay_seconds = (target_dt - now).total_seconds()
+
+    if delay_seconds is None:
+        return None
+
+    return max(0, int(delay_seconds * 1000))
+
+
 __all__ = [
     "RetryDirective",
     "exp_backoff_delays",
+    "parse_retry_after_ms",
     "with_retry",
 ]
@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta
+import json
 from typing import Any
 
+from sqlalchemy import select, update
+
 from app.config import DEFAULT_PLAYLIST_SYNC_STALE_AFTER
 from app.core.spotify_client import SpotifyClient
 from app.db import session_scope
@@ -25,6 +28,8 @@ from app.utils.worker_health import mark_worker_status, record_worker_heartbeat
 logger = get_logger(__name__)
 
 _UPDATED_AT_INCREMENT = timedelta(microseconds=1)
+_PLAYLIST_PAGE_SIZE = 50
+_PAGE_FETCH_CONCURRENCY = 4
 
 
 class PlaylistCacheInvalidator:
@@ -176,18 +181,14 @@ class PlaylistSyncWorker:
         """Fetch playlists from Spotify and persist them."""
 
         try:
-            response = await asyncio.to_thread(self._client.get_user_playlists)
+            pages = await self._fetch_playlist_pages()
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Failed to fetch playlists from Spotify: %s", exc)
             return
 
         items: list[dict[str, Any]] = []
-        if isinstance(response, dict):
-            raw_items = response.get("items")
-            if isinstance(raw_items, Iterable):
-                items = [item for item in raw_items if isinstance(item, dict)]
-        elif isinstance(response, list):
-            items = [item for item in response if isinstance(item, dict)]
+        for page in pages:
+            items.extend(self._extract_page_items(page))
 
         if not items:
             logger.debug("No playlists received from Spotify")
@@ -198,43 +199,112 @@ class PlaylistSyncWorker:
         cache_invalidator = self._build_cache_invalidator()
 
         try:
-            processed = await asyncio.to_thread(
+            processed, skipped = await asyncio.to_thread(
                 self._persist_playlists, items, now, cache_invalidator
             )
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Failed to persist playlists: %s", exc)
             return
 
-        logger.info("Synced %s playlists from Spotify", processed)
+        logger.info("Synced %s playlists from Spotify (%s unchanged)", processed, skipped)
+        log_event(
+            logger,
+            "worker.playlists.sync",
+            component="worker.playlist_sync",
+            status="ok",
+            playlist_count=len(items),
+            updated=processed,
+            skipped=skipped,
+            skip_ratio=round(skipped / len(items), 3),
+            page_count=len(pages),
+            bytes_fetched=sum(self._payload_size(page) for page in pages),
+        )
         record_worker_heartbeat("playlist")
 
+    async def _fetch_playlist_pages(self) -> list[Any]:
+        """Fetch every page of the user's playlists.
+
+        The first page reports the total; the remaining pages are then
+        requested concurrently, a few at a time.
+        """
+
+        first = await asyncio.to_thread(
+            self._client.get_user_playlists, _PLAYLIST_PAGE_SIZE, offset=0
+        )
+        total = self._extract_int(first, "total") if isinstance(first, Mapping) else None
+        if total is None or not (isinstance(first, Mapping) and first.get("next")):
+            return [first]
+
+        semaphore = asyncio.Semaphore(_PAGE_FETCH_CONCURRENCY)
+
+        async def _fetch(offset: int) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._client.get_user_playlists, _PLAYLIST_PAGE_SIZE, offset=offset
+                )
+
+        rest = await asyncio.gather(
+            *(_fetch(offset) for offset in range(_PLAYLIST_PAGE_SIZE, total, _PLAYLIST_PAGE_SIZE))
+        )
+        return [first, *rest]
+
+    @staticmethod
+    def _extract_page_items(page: Any) -> list[dict[str, Any]]:
+        if isinstance(page, dict):
+            raw_items = page.get("items")
+            if isinstance(raw_items, Iterable):
+                return [item for item in raw_items if isinstance(item, dict)]
+        elif isinstance(page, list):
+            return [item for item in page if isinstance(item, dict)]
+        return []
+
     def _persist_playlists(
         self,
         items: list[dict[str, Any]],
         timestamp: datetime,
         cache_invalidator: PlaylistCacheInvalidator | None,
-    ) -> int:
+    ) -> tuple[int, int]:
+        """Persist changed playlists; return ``(processed, skipped)`` counts.
+
+        A stored playlist whose name, track count and metadata match the
+        payload is skipped: only its ``synced_at`` and ``updated_at`` are
+        refreshed in one bulk update, and its cached responses are kept.
+        """
+
         processed = 0
+        skipped = 0
         updated_ids: list[str] = []
-        seen_ids: set[str] = set()
+        refreshed: list[dict[str, Any]] = []
         commit_successful = False
         last_assigned: datetime | None = None
 
+        payloads: dict[str, dict[str, Any]] = {}
+        for payload in items:
+            playlist_id = payload.get("id")
+            if playlist_id and payload.get("name"):
+                payloads.setdefault(str(playlist_id), payload)
+
         try:
             with session_scope() as session:
-                for payload in items:
-                    playlist_id = payload.get("id")
-                    name = payload.get("name")
-                    if not playlist_id or not name:
-                        continue
+                existing: dict[str, Playlist] = {}
+                if payloads:
+                    existing = {
+                        playlist.id: playlist
+                        for playlist in session.scalars(
+                            select(Playlist).where(Playlist.id.in_(tuple(payloads)))
+                        )
+                    }
 
+                created: list[Playlist] = []
+                for playlist_id, payload in payloads.items():
+                    name = str(payload.get("name"))
                     track_count = self._extract_track_count(payload)
-                    playlist = session.get(Playlist, str(playlist_id))
+                    playlist = existing.get(playlist_id)
 
                     if playlist is None:
                         playlist = Playlist(
-                            id=str(playlist_id),
-                            name=str(name),
+                            id=playlist_id,
+                            name=name,
                             track_count=track_count,
                         )
                         playlist.updated_at = self._compute_next_updated_at(
@@ -246,34 +316,77 @@ class PlaylistSyncWorker:
                             payload,
                             synced_at=timestamp,
                         )
-                        session.add(playlist)
+                        created.append(playlist)
                     else:
-                        playlist.name = str(name)
-                        playlist.track_count = track_count
-                        playlist.metadata_json = self._build_playlist_metadata(
+                        metadata = self._build_playlist_metadata(
                             payload,
                             previous=playlist.metadata_json,
                             synced_at=timestamp,
                         )
-                        playlist.updated_at = self._compute_next_updated_at(
+                        updated_at = self._compute_next_updated_at(
                             previous=playlist.updated_at,
                             candidate=timestamp,
                             floor=last_assigned,
                         )
+                        last_assigned = updated_at
+                        if self._is_unchanged(playlist, metadata, name=name, count=track_count):
+                            refreshed.append(
+                                {
+                                    "id": playlist_id,
+                                    "metadata_json": metadata,
+                                    "updated_at": updated_at,
+                                }
+                            )
+                            skipped += 1
+                            continue
+                        playlist.name = name
+                        playlist.track_count = track_count
+                        playlist.metadata_json = metadata
+                        playlist.updated_at = updated_at
 
                     last_assigned = playlist.updated_at
                     processed += 1
-                    playlist_id_str = str(playlist_id)
-                    if playlist_id_str not in seen_ids:
-                        updated_ids.append(playlist_id_str)
-                        seen_ids.add(playlist_id_str)
+                    updated_ids.append(playlist_id)
+
+                # Unchanged rows only need their sync timestamps moved on;
+                # one executemany covers them all.
+                if refreshed:
+                    session.execute(update(Playlist), refreshed)
+                # Only changed rows are dirty, so the flush on commit issues
+                # UPDATEs for those alone; new rows are inserted together.
+                session.add_all(created)
 
             commit_successful = True
         finally:
             if commit_successful and cache_invalidator is not None and updated_ids:
                 cache_invalidator.invalidate(tuple(updated_ids))
 
-        return processed
+        return processed, skipped
+
+    @staticmethod
+    def _is_unchanged(
+        playlist: Playlist, metadata: Mapping[str, Any] | None, *, name: str, count: int
+    ) -> bool:
+        """Return whether only ``synced_at`` differs between the row and *metadata*."""
+
+        if playlist.name != name or playlist.track_count != count:
+            return False
+        previous = playlist.metadata_json if isinstance(playlist.metadata_json, Mapping) else {}
+        current = metadata or {}
+        if not current.get("snapshot_id"):
+            return False
+        return {key: value for key, value in previous.items() if key != "synced_at"} == {
+            key: value for key, value in current.items() if key != "synced_at"
+        }
+
+    @staticmethod
+    def _payload_size(payload: Any) -> int:
+        # Spotipy hands back decoded JSON; its compact re-encoding stands in
+        # for the response body size.
+        try:
+            return len(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        except (TypeError, ValueError):  # pragma: no cover - defensive guard
+            return 0
 
     @staticmethod
     def _compute_next_updated_at(
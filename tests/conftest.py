@@ -0,0 +1,16 @@
+import pytest
+
+import app.db as db
+
+
+@pytest.fixture()
+def database(monkeypatch, tmp_path):
+    """Point the app at a fresh SQLite database for the duration of a test."""
+
+    db.reset_engine_for_tests()
+    raw_url = f"sqlite:///{tmp_path / 'test.db'}"
+    monkeypatch.setattr(db, "load_config", lambda: None)
+    monkeypatch.setattr(db, "get_database_url", lambda: raw_url)
+    db.init_db()
+    yield
+    db.reset_engine_for_tests()
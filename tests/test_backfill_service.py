@@ -0,0 +1,115 @@
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import app.db as db
+from app.models import BackfillJob, IngestItem, IngestJob
+from app.services.backfill_service import BackfillService
+
+
+class _Spotify:
+    def __init__(self) -> None:
+        self.searches: list[str] = []
+        self.track_batches: list[int] = []
+        self._lock = threading.Lock()
+
+    def is_authenticated(self) -> bool:
+        return True
+
+    @staticmethod
+    def _track(title: str) -> dict[str, Any]:
+        return {
+            "id": f"sp-{title}",
+            "album": {"id": f"al-{title}"},
+            "external_ids": {"isrc": f"ISRC{title}"},
+            "duration_ms": 180_000,
+        }
+
+    def find_track_match(self, *, artist: str, title: str, **_: Any) -> dict[str, Any] | None:
+        with self._lock:
+            self.searches.append(title)
+        return None if title.startswith("missing") else self._track(title)
+
+    def get_tracks_details(self, track_ids: list[str]) -> list[dict[str, Any]]:
+        self.track_batches.append(len(track_ids))
+        return [self._track(track_id.removeprefix("sp-")) for track_id in track_ids]
+
+
+def _add_items(job_id: str, titles: list[str]) -> None:
+    with db.session_scope() as session:
+        if session.get(IngestJob, job_id) is None:
+            session.add(IngestJob(id=job_id))
+        for index, title in enumerate(titles):
+            session.add(
+                IngestItem(
+                    job_id=job_id,
+                    source_type="FILE",
+                    artist="Artist",
+                    title=title,
+                    dedupe_hash=f"{job_id}-{index}",
+                    source_fingerprint=f"{job_id}-{index}",
+                )
+            )
+
+
+def _run(service: BackfillService) -> BackfillJob:
+    spec = service.create_job(max_items=1_000, expand_playlists=False)
+    service.run_job(spec)
+    with db.session_scope() as session:
+        return session.get(BackfillJob, spec.id)
+
+
+def test_backfill_resolves_batches_and_reuses_cached_matches(database) -> None:
+    spotify = _Spotify()
+    config = SimpleNamespace(backfill_max_items=1_000, backfill_cache_ttl_seconds=3_600)
+    service = BackfillService(config, spotify, batch_size=40)  # type: ignore[arg-type]
+    titles = [f"song{index}" for index in range(110)] + ["missing1", "missing2"]
+    _add_items("job-1", titles)
+
+    first = _run(service)
+
+    assert first.state == "completed"
+    assert (first.processed_items, first.matched_items) == (112, 110)
+    assert first.cache_misses == 112
+    assert sorted(spotify.searches) == sorted(titles)
+    with db.session_scope() as session:
+        item = session.query(IngestItem).filter(IngestItem.title == "song7").one()
+        assert (item.spotify_track_id, item.spotify_album_id, item.isrc) == (
+            "sp-song7",
+            "al-song7",
+            "ISRCsong7",
+        )
+
+    # Re-imported songs hit the match cache and resolve through batch lookups.
+    spotify.searches.clear()
+    fresh = BackfillService(config, spotify, batch_size=100)  # type: ignore[arg-type]
+    _add_items("job-2", titles[:60])
+
+    second = _run(fresh)
+
+    # The two unmatched items from the first run are still candidates.
+    assert (second.processed_items, second.matched_items, second.cache_hits) == (62, 60, 60)
+    assert sorted(spotify.searches) == ["missing1", "missing2"]
+    # One call per candidate batch; the client splits it into 50-id requests.
+    assert spotify.track_batches == [60]
+
+
+def test_backfill_fails_the_job_when_spotify_search_errors(database) -> None:
+    class _Outage(_Spotify):
+        def find_track_match(self, **kwargs: Any) -> dict[str, Any] | None:
+            super().find_track_match(**kwargs)
+            raise RuntimeError("spotify unavailable")
+
+    spotify = _Outage()
+    config = SimpleNamespace(backfill_max_items=1_000, backfill_cache_ttl_seconds=3_600)
+    service = BackfillService(config, spotify, batch_size=10)  # type: ignore[arg-type]
+    _add_items("job-1", [f"song{index}" for index in range(5)])
+
+    job = _run(service)
+
+    assert job.state == "failed"
+    assert job.error == "spotify unavailable"
+    assert job.matched_items == 0
+    with db.session_scope() as session:
+        matched = session.query(IngestItem).filter(IngestItem.spotify_track_id.isnot(None))
+        assert matched.count() == 0
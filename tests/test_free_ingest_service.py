@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import app.db as db
+from app.models import Download, IngestItem
+from app.services.free_ingest_service import FreeIngestService
+
+
+class _Soulseek:
+    RATE_LIMIT_COUNT = 35
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.cancelled: list[str] = []
+
+    async def search(self, query: str, **_: Any) -> dict[str, Any]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        words = query.split()
+        try:
+            # The broad title-only query answers first, the combined variants last.
+            await asyncio.sleep(0.01 if len(words) == 1 else 0.05 if "Album" in words else 0.2)
+        except asyncio.CancelledError:
+            self.cancelled.append(query)
+            raise
+        finally:
+            self.in_flight -= 1
+        index = "".join(char for char in words[0] if char.isdigit())
+        odd = index and int(index) % 2 == 1
+        if "Missing" in query or (odd and "Album" in words):
+            return {"results": []}
+        return {
+            "results": [
+                {
+                    "username": "peer",
+                    "files": [{"filename": f"{query}.flac", "bitrate": 1000}],
+                }
+            ]
+        }
+
+
+class _SyncWorker:
+    def __init__(self) -> None:
+        self.jobs: list[dict[str, Any]] = []
+
+    async def enqueue(self, job: dict[str, Any]) -> None:
+        self.jobs.append(job)
+
+
+def _service(soulseek: _Soulseek, worker: _SyncWorker) -> FreeIngestService:
+    config = SimpleNamespace(
+        ingest=SimpleNamespace(batch_size=5, max_pending_jobs=10),
+        free_ingest=SimpleNamespace(
+            max_playlists=10,
+            max_tracks=100,
+            batch_size=5,
+            search_concurrency=3,
+        ),
+    )
+    return FreeIngestService(
+        config=config,  # type: ignore[arg-type]
+        soulseek_client=soulseek,  # type: ignore[arg-type]
+        sync_worker=worker,  # type: ignore[arg-type]
+    )
+
+
+def test_tracks_resolve_concurrently_in_query_priority_order(database) -> None:
+    soulseek = _Soulseek()
+    worker = _SyncWorker()
+    service = _service(soulseek, worker)
+    lines = [f"Artist{index} - Song{index} (Album)" for index in range(8)]
+    lines.append("Missing - Missing")
+
+    submission = asyncio.run(service.submit(tracks=lines))
+
+    assert submission.ok and submission.error == "partial"
+    assert soulseek.peak == 3
+    # Once the precise query matches, the slower variants still running are cancelled.
+    assert "Song0 Artist0" in soulseek.cancelled
+    assert len(worker.jobs) == 8
+    with db.session_scope() as session:
+        items = {item.title: item for item in session.query(IngestItem).all()}
+        downloads = session.query(Download).all()
+        assert items["Missing"].state == "failed"
+        assert items["Missing"].error == "no_match"
+        assert {items[f"Song{index}"].state for index in range(8)} == {"queued"}
+        assert len(downloads) == 8
+        assert all(download.request_payload["download_id"] == download.id for download in downloads)
+        # The fast title-only query never beats a more precise variant.
+        queries = sorted(download.request_payload["query"] for download in downloads)
+        assert queries == sorted(
+            f"Song{index} Artist{index} Album" if index % 2 == 0 else f"Song{index} Artist{index}"
+            for index in range(8)
+        )
+    queued_ids = {job["files"][0]["download_id"] for job in worker.jobs}
+    assert queued_ids == {download.id for download in downloads}
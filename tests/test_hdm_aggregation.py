@@ -0,0 +1,62 @@
+import asyncio
+
+from app.hdm.aggregation import DownloadBatchAggregator, _percentile, _QuantileSketch
+from app.hdm.models import DownloadItem
+
+
+def _item(batch_id: str) -> DownloadItem:
+    return DownloadItem(
+        batch_id=batch_id,
+        item_id=f"{batch_id}-item",
+        artist="Artist",
+        title="Title",
+        album=None,
+        isrc=None,
+        requested_by="tester",
+        priority=0,
+        dedupe_key=f"{batch_id}-key",
+    )
+
+
+def test_finished_batches_are_evicted_after_ttl() -> None:
+    now = [0.0]
+    aggregator = DownloadBatchAggregator(finished_ttl_seconds=60, clock=lambda: now[0])
+
+    async def _run() -> None:
+        state = aggregator.create_batch("first", requested_by="tester", total=1)
+        await aggregator.record_failure(
+            state,
+            _item("first"),
+            attempts=1,
+            error=RuntimeError("boom"),
+            processing_seconds=0.5,
+        )
+        summary = await aggregator.wait_for_summary("first")
+        assert summary.totals.failed == 1
+        assert state.results == {}
+
+        now[0] = 30.0
+        aggregator.create_batch("second", requested_by="tester", total=1)
+        assert len(aggregator) == 2
+
+        now[0] = 61.0
+        aggregator.create_batch("third", requested_by="tester", total=1)
+        assert len(aggregator) == 2
+
+    asyncio.run(_run())
+
+
+def test_quantile_sketch_is_exact_for_small_samples_and_bounded_for_large() -> None:
+    small = [0.1, 0.4, 0.2, 3.0, 1.5]
+    sketch = _QuantileSketch()
+    for value in small:
+        sketch.add(value)
+    assert sketch.quantile(0.95) == _percentile(small, 0.95)
+
+    large = _QuantileSketch(exact_limit=16, max_buckets=64)
+    values = [index / 100 for index in range(1, 10_001)]
+    for value in values:
+        large.add(value)
+    assert len(large._buckets) <= 64
+    expected = _percentile(values, 0.95)
+    assert abs(large.quantile(0.95) - expected) / expected < 0.02
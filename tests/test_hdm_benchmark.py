@@ -0,0 +1,27 @@
+import asyncio
+
+from app.hdm.benchmark import BenchmarkScenario, run_scenario
+
+
+def test_benchmark_scenario_runs_pipeline_end_to_end(tmp_path) -> None:
+    scenario = BenchmarkScenario(
+        items=3,
+        audio_format="mp3",
+        file_bytes=64 * 1024,
+        worker_concurrency=3,
+        downloads_root=tmp_path,
+        music_root=tmp_path,
+        timeout_seconds=30,
+    )
+
+    result = asyncio.run(run_scenario(scenario, env={"HDM_TAG_PROCESS_WORKERS": "0"}))
+
+    assert result.succeeded == 3
+    assert result.failed == 0
+    assert result.items_per_second > 0
+    assert 0 < result.latency_p50_seconds <= result.latency_p99_seconds
+    # One temp-file fsync plus two directory fsyncs per move, plus sidecars.
+    assert result.fsync_calls >= 3 * 3
+    assert result.peak_rss_bytes > 0
+    assert set(result.executor_wait_seconds) == {"copy", "locks", "metadata"}
+    assert list(tmp_path.iterdir()) == []
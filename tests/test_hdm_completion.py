@@ -0,0 +1,172 @@
+import asyncio
+import hashlib
+from pathlib import Path
+import time
+from typing import Any
+
+import pytest
+
+from app.hdm.completion import (
+    CompletionEventBus,
+    CompletionResult,
+    DownloadCompletionMonitor,
+    StreamingChecksum,
+    file_checksum,
+)
+from app.hdm.models import DownloadItem, DownloadWorkItem
+from app.hdm.pipeline import DownloadPipelineError, RetryableDownloadError
+from app.hdm.pipeline_impl import DefaultDownloadPipeline
+from app.hdm.recovery import DownloadSidecar, HdmRecovery, SidecarStore
+
+
+def _blake2b(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def test_streaming_checksum_hashes_appended_bytes_incrementally(tmp_path) -> None:
+    path = tmp_path / "track.flac"
+    path.write_bytes(b"a" * 1000)
+    checksum = StreamingChecksum(path)
+    checksum.update(1000)
+
+    with path.open("ab") as handle:
+        handle.write(b"b" * 500)
+    checksum.update(1500)
+
+    assert checksum.offset == 1500
+    assert checksum.hexdigest() == _blake2b(b"a" * 1000 + b"b" * 500)
+    assert file_checksum(path) == checksum.hexdigest()
+
+    path.write_bytes(b"c" * 10)
+    checksum.update(10)
+    assert checksum.hexdigest() == _blake2b(b"c" * 10)
+
+
+def test_expected_size_skips_the_stability_window(tmp_path) -> None:
+    path = tmp_path / "track.flac"
+    payload = b"x" * 4096
+    path.write_bytes(payload)
+    monitor = DownloadCompletionMonitor(
+        downloads_dir=tmp_path,
+        size_stable_seconds=30,
+        event_bus=CompletionEventBus(),
+        poll_interval=0.25,
+    )
+
+    started = time.monotonic()
+    stable = asyncio.run(monitor.verify_stable(path, expected_bytes=len(payload)))
+
+    assert time.monotonic() - started < 5
+    assert stable.size == len(payload)
+    assert stable.checksum == _blake2b(payload)
+
+
+def test_sidecar_drops_checksums_from_unknown_algorithms(tmp_path) -> None:
+    sidecar = DownloadSidecar(
+        path=tmp_path / "sidecar.json",
+        batch_id="batch",
+        item_id="item",
+        dedupe_key="key",
+        attempt=1,
+    )
+    sidecar.expected_bytes = 4096
+    sidecar.record_download(tmp_path / "track.flac", 4096, "abc123")
+
+    payload = sidecar.to_dict()
+    restored = DownloadSidecar.from_dict(sidecar.path, payload)
+    assert restored.checksum == "abc123"
+    assert restored.expected_bytes == 4096
+    assert restored.verified_source() == tmp_path / "track.flac"
+
+    payload["checksum_algorithm"] = "md5"
+    assert DownloadSidecar.from_dict(sidecar.path, payload).checksum is None
+
+
+def _item() -> DownloadItem:
+    return DownloadItem(
+        batch_id="batch",
+        item_id="item",
+        artist="Artist",
+        title="Title",
+        album=None,
+        isrc=None,
+        requested_by="tester",
+        priority=0,
+        dedupe_key="key",
+    )
+
+
+class _SizedCompletion:
+    def __init__(self, path: Path, size: int) -> None:
+        self._result = CompletionResult(
+            path=path, bytes_written=size, codec=None, duration_seconds=None
+        )
+        self.expected_bytes: list[int | None] = []
+
+    async def wait_for_completion(
+        self, work_item: Any, *, expected_path: Any, expected_bytes: int | None
+    ) -> CompletionResult:
+        self.expected_bytes.append(expected_bytes)
+        return self._result
+
+
+@pytest.mark.parametrize(("size", "message"), [(2048, "smaller"), (8192, "larger")])
+def test_size_mismatch_fails_the_download(tmp_path: Path, size: int, message: str) -> None:
+    item = _item()
+    path = tmp_path / "track.flac"
+    sidecars = SidecarStore(tmp_path / "sidecars")
+    completion = _SizedCompletion(path, size)
+    pipeline = DefaultDownloadPipeline(
+        completion_monitor=completion,  # type: ignore[arg-type]
+        tagger=None,  # type: ignore[arg-type]
+        mover=None,  # type: ignore[arg-type]
+        deduper=None,  # type: ignore[arg-type]
+        sidecars=sidecars,
+    )
+    work_item = DownloadWorkItem(item=item, attempt=1)
+
+    async def _run() -> None:
+        sidecar = await sidecars.load(item, attempt=1)
+        sidecar.expected_bytes = 4096
+        with pytest.raises(DownloadPipelineError, match=message) as raised:
+            await pipeline._download(work_item, sidecar)
+        assert not isinstance(raised.value, RetryableDownloadError)
+
+    asyncio.run(_run())
+
+    assert work_item.events[-1].name == "download.size_mismatch"
+    # Without a finished slskd transfer the size alone never completes a file.
+    assert completion.expected_bytes == [None]
+
+
+def test_recovery_waits_for_a_preallocated_file_to_settle(tmp_path: Path) -> None:
+    path = tmp_path / "track.flac"
+    path.write_bytes(b"\0" * 4096)
+    bus = CompletionEventBus()
+    sidecars = SidecarStore(tmp_path / "sidecars")
+    recovery = HdmRecovery(
+        size_stable_seconds=1,
+        sidecars=sidecars,
+        completion_monitor=DownloadCompletionMonitor(
+            downloads_dir=tmp_path,
+            size_stable_seconds=1,
+            event_bus=bus,
+            poll_interval=0.25,
+        ),
+        event_bus=bus,
+    )
+
+    async def _run() -> float:
+        sidecar = await sidecars.load(_item(), attempt=1)
+        # slskd may create the file at full size before writing it.
+        sidecar.source_path = str(path)
+        sidecar.expected_bytes = 4096
+        await sidecars.save(sidecar)
+        queue = await bus.subscribe("key")
+        started = time.monotonic()
+        await recovery._scan()
+        event = queue.get_nowait()
+        assert event.bytes_written == 4096
+        return time.monotonic() - started
+
+    assert asyncio.run(_run()) >= 1
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+from app.hdm.dedup import LOCK_MODE_FILE, DeduplicationManager
+from app.hdm.models import DownloadItem
+
+
+def _item(dedupe_key: str) -> DownloadItem:
+    return DownloadItem(
+        batch_id="batch",
+        item_id=dedupe_key,
+        artist="Artist",
+        title="Title",
+        album=None,
+        isrc=None,
+        requested_by="tester",
+        priority=0,
+        dedupe_key=dedupe_key,
+    )
+
+
+def _manager(tmp_path, **kwargs) -> DeduplicationManager:
+    return DeduplicationManager(
+        music_dir=tmp_path / "music",
+        state_dir=tmp_path / "state",
+        move_template="{artist}/{title}.{extension}",
+        **kwargs,
+    )
+
+
+def test_local_locks_serialise_same_key_and_leave_no_files(tmp_path) -> None:
+    manager = _manager(tmp_path)
+    order: list[str] = []
+
+    async def _hold(name: str, key: str) -> None:
+        async with await manager.acquire_lock(_item(key)):
+            order.append(f"{name}:enter")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}:exit")
+
+    async def _run() -> None:
+        await asyncio.gather(_hold("a", "same"), _hold("b", "same"))
+
+    asyncio.run(_run())
+
+    assert order == ["a:enter", "a:exit", "b:enter", "b:exit"]
+    assert len(manager._keys) == 0
+    assert list((tmp_path / "state" / "locks").iterdir()) == []
+
+
+def test_file_locks_use_fixed_stripes_and_clean_legacy_files(tmp_path) -> None:
+    locks_dir = tmp_path / "state" / "locks"
+    locks_dir.mkdir(parents=True)
+    (locks_dir / "legacy-key.lock").write_bytes(b"")
+    manager = _manager(tmp_path, lock_mode=LOCK_MODE_FILE, lock_stripes=4)
+
+    async def _run() -> int:
+        removed = await manager.cleanup_stale_locks()
+        for index in range(20):
+            async with await manager.acquire_lock(_item(f"key-{index}")):
+                pass
+        return removed
+
+    removed = asyncio.run(_run())
+    manager.close()
+
+    assert removed == 1
+    names = sorted(path.name for path in locks_dir.iterdir())
+    assert names and len(names) <= 4
+    assert all(name.startswith("stripe-") for name in names)
+
+
+def test_destination_planning_and_stripe_files_stay_off_the_event_loop(tmp_path) -> None:
+    manager = _manager(tmp_path, lock_mode=LOCK_MODE_FILE, lock_stripes=2)
+    stripes = manager._stripes
+    assert stripes is not None
+    open_stripe = stripes._open_stripe
+    opened_on: list[int] = []
+
+    def _recording_open(stripe: int):
+        opened_on.append(threading.get_ident())
+        return open_stripe(stripe)
+
+    stripes._open_stripe = _recording_open  # type: ignore[method-assign]
+
+    async def _run() -> None:
+        for _ in range(3):
+            async with await manager.acquire_lock(_item("key")):
+                pass
+
+    asyncio.run(_run())
+    destination = manager.plan_destination(_item("key"), tmp_path / "source.flac")
+    manager.close()
+
+    # The stripe is opened once, off the loop, and reused afterwards.
+    assert len(opened_on) == 1 and opened_on[0] != threading.get_ident()
+    assert destination == tmp_path / "music" / "Artist" / "Title.flac"
+    assert not destination.parent.exists()
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+import pytest
+
+import app.hdm.executors as executors_module
+from app.hdm.executors import COPY_POOL, METADATA_POOL, HdmExecutors, run_blocking
+from app.utils.metrics import get_registry
+
+
+def _sample(name: str, pool: str) -> float:
+    for family in get_registry().collect():
+        for sample in family.samples:
+            if sample.name == name and sample.labels.get("pool") == pool:
+                return sample.value
+    return 0.0
+
+
+def test_pool_tracks_queue_depth_wait_time_and_cancellation() -> None:
+    executors_module.register_metrics()
+    executors = HdmExecutors(lock_workers=1, metadata_workers=1, copy_workers=1)
+    release = threading.Event()
+    ran: list[str] = []
+    waits = _sample("hdm_executor_wait_seconds_count", COPY_POOL)
+
+    def _work(name: str) -> str:
+        ran.append(name)
+        if name == "first":
+            release.wait(timeout=5)
+        return name
+
+    async def _run() -> None:
+        first = asyncio.create_task(executors.run(COPY_POOL, _work, "first"))
+        second = asyncio.create_task(executors.run(COPY_POOL, _work, "second"))
+        cancelled = asyncio.create_task(executors.run(COPY_POOL, _work, "cancelled"))
+        while executors.stats()[COPY_POOL].active != 1:
+            await asyncio.sleep(0.005)
+
+        stats = executors.stats()[COPY_POOL]
+        assert (stats.queued, stats.active) == (2, 1)
+        assert _sample("hdm_executor_queue_depth", COPY_POOL) == 2
+
+        # A task cancelled while queued never runs and leaves the queue.
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert executors.stats()[COPY_POOL].queued == 1
+
+        await asyncio.sleep(0.02)
+        release.set()
+        assert await asyncio.gather(first, second) == ["first", "second"]
+
+    asyncio.run(_run())
+    executors.shutdown()
+
+    stats = executors.stats()[COPY_POOL]
+    assert ran == ["first", "second"]
+    assert (stats.queued, stats.active, stats.completed) == (0, 0, 2)
+    assert stats.max_wait_seconds >= 0.02
+    assert _sample("hdm_executor_queue_depth", COPY_POOL) == 0
+    assert _sample("hdm_executor_active_tasks", COPY_POOL) == 0
+    assert _sample("hdm_executor_wait_seconds_count", COPY_POOL) == waits + 2
+
+
+def test_shutdown_rejects_new_work_and_run_blocking_falls_back_to_threads() -> None:
+    executors = HdmExecutors()
+
+    async def _run() -> None:
+        assert await run_blocking(None, METADATA_POOL, sum, [1, 2]) == 3
+        assert await run_blocking(executors, METADATA_POOL, sum, [1, 2]) == 3
+        with pytest.raises(ValueError):
+            await executors.run("unknown", sum, [1])
+        executors.shutdown()
+        executors.shutdown()
+        with pytest.raises(RuntimeError):
+            await executors.run(METADATA_POOL, sum, [1])
+
+    asyncio.run(_run())
+    assert executors.stats()[METADATA_POOL].completed == 1
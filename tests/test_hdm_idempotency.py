@@ -0,0 +1,130 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import app.hdm.idempotency as idempotency
+from app.hdm.idempotency import SQLiteIdempotencyStore
+from app.hdm.models import DownloadItem
+from app.utils.metrics import get_registry
+
+
+def _item(key: str) -> DownloadItem:
+    return DownloadItem(
+        batch_id="batch",
+        item_id=key,
+        artist="Artist",
+        title=key,
+        album=None,
+        isrc=None,
+        requested_by="tester",
+        priority=0,
+        dedupe_key=key,
+    )
+
+
+def _sample(name: str, operation: str) -> float:
+    for family in get_registry().collect():
+        for sample in family.samples:
+            if sample.name == name and sample.labels.get("operation") == operation:
+                return sample.value
+    return 0.0
+
+
+def test_batch_reservations_share_one_connection_thread_and_record_latency(
+    tmp_path: Path,
+) -> None:
+    idempotency.register_metrics()
+    store = SQLiteIdempotencyStore(tmp_path / "idempotency.db")
+    threads: set[str] = set()
+    original = store._run_with_connection
+
+    def _tracking(operation):  # type: ignore[no-untyped-def]
+        threads.add(threading.current_thread().name)
+        return original(operation)
+
+    store._run_with_connection = _tracking  # type: ignore[method-assign]
+    observed = _sample("hdm_idempotency_operation_seconds_count", "reserve_many")
+
+    async def _run() -> None:
+        first = await store.reserve_many([_item("a"), _item("b"), _item("c")])
+        assert [reservation.acquired for reservation in first] == [True, True, True]
+        connection = store._connection
+
+        await store.release_many([_item("a")], success=True)
+        await store.release_many([_item("b")], success=False)
+        again = await store.reserve_many([_item("a"), _item("b"), _item("c")])
+        assert [(r.acquired, r.reason) for r in again] == [
+            (False, "already_completed"),
+            (True, None),
+            (False, "in_progress"),
+        ]
+        assert again[0].already_processed
+        assert store._connection is connection
+        await store.close()
+        assert store._connection is None
+
+    asyncio.run(_run())
+
+    assert len(threads) == 1 and threads.pop().startswith("hdm-idempotency")
+    assert _sample("hdm_idempotency_operation_seconds_count", "reserve_many") == observed + 2
+    assert _sample("hdm_idempotency_keys_total", "release_many") >= 2
+
+
+def test_reservations_left_by_a_crash_are_recovered(tmp_path: Path) -> None:
+    path = tmp_path / "idempotency.db"
+
+    async def _crash() -> None:
+        store = SQLiteIdempotencyStore(path, owner_timeout_seconds=0.05)
+        await store.reserve_many([_item("queued-1"), _item("queued-2"), _item("done")])
+        await store.release_many([_item("done")], success=True)
+        # The process dies here: no release and no more heartbeats.
+        store._close_connection()
+        store._executor.shutdown(wait=True)
+
+    asyncio.run(_crash())
+    time.sleep(0.1)
+
+    async def _restart() -> list[tuple[bool, str | None]]:
+        store = SQLiteIdempotencyStore(path, owner_timeout_seconds=0.05)
+        try:
+            results = await store.reserve_many(
+                [_item("queued-1"), _item("queued-2"), _item("done")]
+            )
+        finally:
+            await store.close()
+        return [(reservation.acquired, reservation.reason) for reservation in results]
+
+    assert asyncio.run(_restart()) == [(True, None), (True, None), (False, "already_completed")]
+
+
+def test_reservations_of_a_live_store_are_never_taken_over(tmp_path: Path) -> None:
+    path = tmp_path / "idempotency.db"
+
+    async def _run() -> list[list[bool]]:
+        owner = SQLiteIdempotencyStore(path, owner_timeout_seconds=0.1)
+        await owner.reserve_many([_item("queued")])
+        # An item that has waited in the queue for a long time.
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "UPDATE idempotency_keys SET updated_at = ?", (time.time() - 86_400,)
+            )
+        # A second process sharing the file starts up while the owner runs.
+        other = SQLiteIdempotencyStore(path, owner_timeout_seconds=0.1)
+        try:
+            attempts = [[r.acquired for r in await other.reserve_many([_item("queued")])]]
+            await asyncio.sleep(0.3)
+            attempts.append([r.acquired for r in await other.reserve_many([_item("queued")])])
+            # The owner stops sending heartbeats, as if its process hung or died.
+            assert owner._heartbeat is not None
+            owner._heartbeat.cancel()
+            await asyncio.sleep(0.3)
+            attempts.append([r.acquired for r in await other.reserve_many([_item("queued")])])
+            attempts.append([r.acquired for r in await owner.reserve_many([_item("queued")])])
+        finally:
+            await owner.close()
+            await other.close()
+        return attempts
+
+    assert asyncio.run(_run()) == [[False], [False], [True], [False]]
@@ -0,0 +1,109 @@
+import asyncio
+from pathlib import Path
+
+from mutagen.easyid3 import EasyID3
+
+from app.hdm.benchmark import synthesize_audio
+from app.hdm.idempotency import InMemoryIdempotencyStore
+from app.hdm.library_index import LibraryIndex, library_key
+from app.hdm.models import (
+    DownloadBatchRequest,
+    DownloadItem,
+    DownloadRequestItem,
+    ItemState,
+)
+from app.hdm.orchestrator import HdmOrchestrator
+
+
+def _item(artist: str, title: str, duration: float | None = None) -> DownloadItem:
+    return DownloadItem(
+        batch_id="batch",
+        item_id="item",
+        artist=artist,
+        title=title,
+        album=None,
+        isrc=None,
+        requested_by="tester",
+        priority=0,
+        dedupe_key=f"{artist}-{title}",
+        duration_seconds=duration,
+    )
+
+
+def _write_track(path, *, artist: str, title: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(synthesize_audio("mp3", 64 * 1024))
+    tags = EasyID3()
+    tags["artist"] = artist
+    tags["title"] = title
+    tags.save(path)
+
+
+def test_index_matches_title_variants_and_reuses_snapshot(tmp_path) -> None:
+    music = tmp_path / "music"
+    track = music / "Beyoncé" / "Halo.mp3"
+    _write_track(track, artist="Beyoncé", title="Halo (feat. Someone)")
+    snapshot = tmp_path / "state" / "library_index.json"
+
+    index = LibraryIndex(music, snapshot_path=snapshot)
+    assert asyncio.run(index.build()) == 1
+
+    async def _lookups() -> list[Path | None]:
+        return [
+            await index.lookup(_item("beyonce", "Halo")),
+            await index.lookup(_item("Beyonce", "Halo!")),
+            # Track length of the synthetic file is ~4s.
+            await index.lookup(_item("Beyonce", "Halo", duration=240.0)),
+            await index.lookup(_item("Beyonce", "Single Ladies")),
+        ]
+
+    assert asyncio.run(_lookups()) == [track, track, None, None]
+
+    rebuilt = LibraryIndex(music, snapshot_path=snapshot)
+    assert asyncio.run(rebuilt.build()) == 1
+    assert asyncio.run(rebuilt.lookup(_item("Beyonce", "Halo"))) == track
+
+    # A file deleted behind the index's back is dropped on lookup.
+    track.unlink()
+    assert asyncio.run(rebuilt.lookup(_item("Beyonce", "Halo"))) is None
+    assert not rebuilt._by_key.get(library_key("Beyonce", "Halo"))
+
+
+def test_orchestrator_skips_library_matches_before_reserving(tmp_path) -> None:
+    music = tmp_path / "music"
+    track = music / "Artist" / "Song.mp3"
+    _write_track(track, artist="Artist", title="Song")
+    index = LibraryIndex(music, snapshot_path=tmp_path / "library_index.json")
+    store = InMemoryIdempotencyStore()
+
+    class _FailingPipeline:
+        async def execute(self, work_item):  # pragma: no cover - must not run
+            raise AssertionError("library matches must not be downloaded")
+
+    async def _run():
+        await index.build()
+        orchestrator = HdmOrchestrator(
+            pipeline=_FailingPipeline(),
+            idempotency_store=store,
+            worker_concurrency=1,
+            max_retries=1,
+            batch_max_items=10,
+            library_index=index,
+        )
+        handle = await orchestrator.submit_batch(
+            DownloadBatchRequest(
+                items=[DownloadRequestItem(artist="ARTIST", title="Song (Explicit)")],
+                requested_by="tester",
+            )
+        )
+        summary = await handle.wait()
+        await orchestrator.shutdown()
+        return summary
+
+    summary = asyncio.run(_run())
+
+    (result,) = summary.items
+    assert result.state is ItemState.DUPLICATE
+    assert result.final_path == track
+    assert summary.totals.dedupe_hits == 1
+    assert not store._in_progress and not store._completed
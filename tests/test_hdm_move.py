@@ -0,0 +1,45 @@
+import errno
+import os
+
+import pytest
+
+from app.hdm.move import AtomicFileMover
+
+
+def test_copy_across_devices_preserves_content_and_removes_source(tmp_path) -> None:
+    source = tmp_path / "downloads" / "track.flac"
+    source.parent.mkdir()
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    source.write_bytes(payload)
+    destination = tmp_path / "music" / "Artist" / "track.flac"
+    destination.parent.mkdir(parents=True)
+
+    AtomicFileMover()._copy_across_devices(source, destination)
+
+    assert destination.read_bytes() == payload
+    assert not source.exists()
+    assert not destination.with_suffix(".flac.tmpcopy").exists()
+
+
+def test_copy_contents_falls_back_when_kernel_copy_unsupported(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "source.mp3"
+    payload = os.urandom(512 * 1024)
+    source.write_bytes(payload)
+    target = tmp_path / "target.mp3"
+
+    def _unsupported(*_args, **_kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "copy_file_range", _unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported, raising=False)
+
+    copied, method = AtomicFileMover()._copy_contents(source, target)
+
+    assert method == "buffered"
+    assert copied == len(payload)
+    assert target.read_bytes() == payload
+
+
+def test_move_missing_source_raises(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        AtomicFileMover().move(tmp_path / "missing.flac", tmp_path / "dest.flac")
@@ -0,0 +1,119 @@
+import asyncio
+
+from app.config import HdmConfig
+from app.hdm.concurrency import AdaptiveConcurrencyController
+from app.hdm.models import DownloadItem
+from app.hdm.idempotency import InMemoryIdempotencyStore
+from app.hdm.orchestrator import HdmOrchestrator, _RoundRobinQueue
+
+
+def _item(batch_id: str, index: int, *, priority: int = 0) -> DownloadItem:
+    return DownloadItem(
+        batch_id=batch_id,
+        item_id=f"{batch_id}-{index}",
+        artist="Artist",
+        title=f"Title {index}",
+        album=None,
+        isrc=None,
+        requested_by="tester",
+        priority=priority,
+        dedupe_key=f"{batch_id}-{index}",
+    )
+
+
+async def _drain(queue: _RoundRobinQueue) -> list[str]:
+    await queue.stop()
+    drained: list[str] = []
+    while (item := await queue.get()) is not None:
+        drained.append(item.item_id)
+    return drained
+
+
+def test_queue_weights_batches_within_priority() -> None:
+    async def _run() -> list[str]:
+        queue = _RoundRobinQueue()
+        for index in range(4):
+            await queue.put(_item("bulk", index), weight=1)
+        for index in range(4):
+            await queue.put(_item("heavy", index), weight=2)
+        return await _drain(queue)
+
+    order = asyncio.run(_run())
+
+    assert order == [
+        "bulk-0",
+        "heavy-0",
+        "heavy-1",
+        "bulk-1",
+        "heavy-2",
+        "heavy-3",
+        "bulk-2",
+        "bulk-3",
+    ]
+
+
+def test_queue_serves_priority_and_fast_lane_first() -> None:
+    async def _run() -> list[str]:
+        queue = _RoundRobinQueue(fast_lane_burst=2)
+        for index in range(3):
+            await queue.put(_item("backfill", index))
+        await queue.put(_item("urgent", 0, priority=5))
+        for index in range(3):
+            await queue.put(_item(f"single{index}", 0), interactive=True)
+        return await _drain(queue)
+
+    order = asyncio.run(_run())
+
+    assert order == [
+        "single0-0",
+        "single1-0",
+        "urgent-0",
+        "single2-0",
+        "backfill-0",
+        "backfill-1",
+        "backfill-2",
+    ]
+
+
+def test_fast_lane_burst_is_configured_from_the_environment() -> None:
+    config = HdmConfig.from_env({"HDM_FAST_LANE_BURST": "2"})
+    orchestrator = HdmOrchestrator(
+        pipeline=object(),  # type: ignore[arg-type]
+        idempotency_store=InMemoryIdempotencyStore(),
+        worker_concurrency=1,
+        max_retries=1,
+        batch_max_items=10,
+        fast_lane_burst=config.fast_lane_burst,
+    )
+
+    assert config.fast_lane_burst == 2
+    assert HdmConfig.from_env({}).fast_lane_burst == 4
+    assert orchestrator._queue._fast_lane_burst == 2
+
+
+def test_adaptive_concurrency_grows_and_backs_off() -> None:
+    now = [0.0]
+    controller = AdaptiveConcurrencyController(
+        min_workers=2,
+        max_workers=8,
+        window_size=4,
+        clock=lambda: now[0],
+    )
+
+    async def _run() -> list[int]:
+        targets: list[int] = []
+        for _ in range(8):
+            await controller.record_success(1.0)
+        targets.append(controller.target)
+        await controller.record_retry(30.0)
+        targets.append(controller.target)
+        for _ in range(4):
+            await controller.record_success(1.0)
+        targets.append(controller.target)
+        now[0] = 31.0
+        for _ in range(4):
+            await controller.record_success(1.0)
+        targets.append(controller.target)
+        return targets
+
+    assert asyncio.run(_run()) == [4, 2, 2, 3]
@@ -0,0 +1,173 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+import sys
+import time
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import app.hdm.executors as executors_module
+from app.hdm.executors import METADATA_POOL, PROCESS_POOL, HdmExecutors
+from app.hdm.models import DownloadItem
+from app.hdm.tagging import AudioTagger, build_tag_values, inspect_and_tag
+from app.utils.metrics import get_registry
+
+
+def _item() -> DownloadItem:
+    return DownloadItem(
+        batch_id="batch",
+        item_id="item",
+        artist="Artist",
+        title="Title",
+        album="Album",
+        isrc="ISRC1",
+        requested_by="tester",
+        priority=0,
+        dedupe_key="key",
+    )
+
+
+def _sample(name: str, pool: str) -> float:
+    for family in get_registry().collect():
+        for sample in family.samples:
+            if sample.name == name and sample.labels.get("pool") == pool:
+                return sample.value
+    return 0.0
+
+
+class _FakeAudio(dict):
+    def __init__(self) -> None:
+        super().__init__()
+        self.info = SimpleNamespace(codec="flac", bitrate=912_000, length=201.5)
+        self.saves = 0
+
+    def save(self) -> None:
+        self.saves += 1
+
+
+def test_inspect_and_tag_parses_the_file_once(monkeypatch) -> None:
+    opened: list[tuple[str, bool]] = []
+    audio = _FakeAudio()
+
+    def _file(path: str, easy: bool = False) -> _FakeAudio | None:
+        opened.append((str(path), easy))
+        return None if str(path).endswith(".txt") else audio
+
+    fake_mutagen = ModuleType("mutagen")
+    fake_mutagen.File = _file  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "mutagen", fake_mutagen)
+
+    result = inspect_and_tag("/music/a.flac", build_tag_values(_item()))
+
+    assert opened == [("/music/a.flac", True)]
+    assert audio.saves == 1
+    assert audio["artist"] == ["Artist"] and audio["isrc"] == ["ISRC1"]
+    assert (result.applied, result.codec, result.bitrate, result.duration_seconds) == (
+        True,
+        "flac",
+        912,
+        201.5,
+    )
+    assert not inspect_and_tag("/music/notes.txt", {}).applied
+
+
+class _ReadOnlyAudio(_FakeAudio):
+    def save(self) -> None:
+        raise PermissionError("read-only file")
+
+
+def test_untaggable_file_still_reports_stream_info(monkeypatch) -> None:
+    fake_mutagen = ModuleType("mutagen")
+    fake_mutagen.File = lambda path, easy=False: _ReadOnlyAudio()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "mutagen", fake_mutagen)
+
+    result = inspect_and_tag("/music/a.flac", build_tag_values(_item()))
+
+    assert (result.applied, result.codec, result.bitrate, result.duration_seconds) == (
+        False,
+        "flac",
+        912,
+        201.5,
+    )
+
+
+class _RecordingExecutors:
+    has_process_pool = True
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    async def run_process(self, func: Any, *args: Any) -> str:
+        self.calls.append((PROCESS_POOL, args[0]))
+        return "process"
+
+    async def run(self, pool: str, func: Any, *args: Any, **kwargs: Any) -> str:
+        self.calls.append((pool, args[0]))
+        return "thread"
+
+
+def test_tagger_sends_heavy_containers_to_the_process_pool() -> None:
+    executors = _RecordingExecutors()
+    tagger = AudioTagger(executors=executors)  # type: ignore[arg-type]
+
+    async def _run() -> list[Any]:
+        return [
+            await tagger.process(Path("/music/a.FLAC"), _item()),
+            await tagger.process(Path("/music/b.mp3"), _item()),
+        ]
+
+    assert asyncio.run(_run()) == ["process", "thread"]
+    assert executors.calls == [
+        (PROCESS_POOL, "/music/a.FLAC"),
+        (METADATA_POOL, Path("/music/b.mp3")),
+    ]
+
+
+def test_process_pool_reports_only_waiting_tasks_as_queued() -> None:
+    executors_module.register_metrics()
+    executors = HdmExecutors(process_workers=1)
+
+    async def _run() -> None:
+        tasks = [asyncio.create_task(executors.run_process(time.sleep, 0.05)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert _sample("hdm_executor_active_tasks", PROCESS_POOL) == 1
+        assert _sample("hdm_executor_queue_depth", PROCESS_POOL) == 2
+        await asyncio.gather(*tasks)
+        assert await executors.run_process(pow, 2, 10) == 1024
+
+    try:
+        asyncio.run(_run())
+    finally:
+        executors.shutdown()
+    assert _sample("hdm_executor_active_tasks", PROCESS_POOL) == 0
+    assert _sample("hdm_executor_queue_depth", PROCESS_POOL) == 0
+
+
+class _BrokenPool:
+    def submit(self, *args: Any, **kwargs: Any) -> None:
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, **kwargs: Any) -> None:
+        pass
+
+
+def test_process_work_falls_back_to_the_metadata_pool() -> None:
+    without_pool = HdmExecutors(process_workers=0)
+    broken = HdmExecutors(process_workers=1)
+    broken._process_pool = _BrokenPool()  # type: ignore[assignment]
+
+    async def _run() -> tuple[int, int]:
+        return (
+            await without_pool.run_process(pow, 2, 3),
+            await broken.run_process(pow, 2, 4),
+        )
+
+    try:
+        assert asyncio.run(_run()) == (8, 16)
+    finally:
+        without_pool.shutdown()
+        broken.shutdown()
+    assert without_pool.stats()[METADATA_POOL].completed == 1
+    assert broken.stats()[METADATA_POOL].completed == 1
+    assert broken._process_pool is None
+    assert _sample("hdm_executor_queue_depth", PROCESS_POOL) == 0
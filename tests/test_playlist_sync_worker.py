@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any
+
+import app.db as db
+from app.models import Playlist
+from app.workers.playlist_sync_worker import PlaylistSyncWorker
+
+
+class _PlaylistClient:
+    def __init__(self, total: int) -> None:
+        self.snapshots = {f"p{index}": "s1" for index in range(total)}
+        self.offsets: list[int] = []
+        self.extra: dict[str, dict[str, Any]] = {}
+
+    def get_user_playlists(self, limit: int = 50, *, offset: int = 0) -> dict[str, Any]:
+        self.offsets.append(offset)
+        ids = list(self.snapshots)[offset : offset + limit]
+        return {
+            "items": [
+                {
+                    "id": playlist_id,
+                    "name": playlist_id.upper(),
+                    "snapshot_id": self.snapshots[playlist_id],
+                    "tracks": {"total": 3},
+                    **self.extra.get(playlist_id, {}),
+                }
+                for playlist_id in ids
+            ],
+            "total": len(self.snapshots),
+            "next": "more" if offset + limit < len(self.snapshots) else None,
+        }
+
+
+class _Invalidator:
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, ...]] = []
+
+    def invalidate(self, playlist_ids: tuple[str, ...]) -> None:
+        self.batches.append(tuple(playlist_ids))
+
+
+def _stored() -> dict[str, Playlist]:
+    with db.session_scope() as session:
+        return {playlist.id: playlist for playlist in session.query(Playlist).all()}
+
+
+def test_sync_pages_through_all_playlists_and_writes_only_changes(database) -> None:
+    client = _PlaylistClient(total=120)
+    worker = PlaylistSyncWorker(client)  # type: ignore[arg-type]
+    invalidator = _Invalidator()
+    worker._build_cache_invalidator = lambda: invalidator  # type: ignore[method-assign]
+
+    asyncio.run(worker.sync_once())
+    assert sorted(client.offsets) == [0, 50, 100]
+    assert len(invalidator.batches) == 1 and len(invalidator.batches[0]) == 120
+    fresh = _stored()
+
+    asyncio.run(worker.sync_once())
+    assert len(invalidator.batches) == 1
+
+    client.snapshots["p7"] = "s2"
+    asyncio.run(worker.sync_once())
+
+    assert invalidator.batches[-1] == ("p7",)
+    after = _stored()
+    assert after["p7"].metadata_json["snapshot_id"] == "s2"
+    # Unchanged rows only have their sync timestamps moved on.
+    assert after["p8"].updated_at > fresh["p8"].updated_at
+    assert after["p8"].metadata_json["synced_at"] == after["p7"].metadata_json["synced_at"]
+    assert after["p8"].metadata_json["sync_status"] == "fresh"
+
+
+def test_sync_persists_metadata_changes_that_keep_the_snapshot(database) -> None:
+    client = _PlaylistClient(total=3)
+    worker = PlaylistSyncWorker(client)  # type: ignore[arg-type]
+    invalidator = _Invalidator()
+    worker._build_cache_invalidator = lambda: invalidator  # type: ignore[method-assign]
+    asyncio.run(worker.sync_once())
+
+    client.extra["p1"] = {"owner": {"id": "u1", "display_name": "Alice"}}
+    client.extra["p2"] = {"public": False, "collaborative": True}
+    asyncio.run(worker.sync_once())
+
+    assert sorted(invalidator.batches[-1]) == ["p1", "p2"]
+    stored = _stored()
+    assert stored["p1"].metadata_json["owner_display_name"] == "Alice"
+    assert stored["p2"].metadata_json["public"] is False
+    assert stored["p2"].metadata_json["collaborative"] is True
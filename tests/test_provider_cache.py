@@ -0,0 +1,84 @@
+from pathlib import Path
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.provider_cache import ProviderCache
+from app.core.spotify_client import SpotifyClient, SpotifyException
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_persists_to_sqlite_and_serves_stale_while_refreshing(tmp_path: Path) -> None:
+    clock = _Clock()
+    path = tmp_path / "provider_cache.db"
+    calls: list[int] = []
+
+    def _loader() -> dict[str, object]:
+        calls.append(len(calls))
+        return {"id": "a1", "version": len(calls)}
+
+    cache = ProviderCache(path=path, ttl_seconds={"album": 60}, stale_seconds=600, clock=clock)
+    first = cache.get_or_load("album", "a1", _loader)
+    first["version"] = "mutated"
+    assert cache.get_or_load("album", "a1", _loader) == {"id": "a1", "version": 1}
+    cache.close()
+
+    reopened = ProviderCache(path=path, ttl_seconds={"album": 60}, stale_seconds=600, clock=clock)
+    assert reopened.get_or_load("album", "a1", _loader) == {"id": "a1", "version": 1}
+    assert len(calls) == 1
+
+    clock.now += 120
+    assert reopened.get_or_load("album", "a1", _loader) == {"id": "a1", "version": 1}
+    for _ in range(500):
+        if reopened.get_or_load("album", "a1", _loader)["version"] == 2:
+            break
+        time.sleep(0.01)
+    assert reopened.get_or_load("album", "a1", _loader) == {"id": "a1", "version": 2}
+    assert len(calls) == 2
+
+    clock.now += 10_000
+    assert reopened.get_or_load("album", "a1", _loader) == {"id": "a1", "version": 3}
+    reopened.close()
+
+
+def test_spotify_client_caches_not_found_lookups() -> None:
+    clock = _Clock()
+    lookups: list[str] = []
+
+    class _Spotipy:
+        def artist(self, artist_id: str) -> dict[str, str]:
+            lookups.append(artist_id)
+            if artist_id == "missing":
+                raise SpotifyException(404, -1, "not found")
+            return {"id": artist_id, "name": "Artist"}
+
+    cache = ProviderCache(negative_ttl=30, ttl_seconds={"artist": 300}, clock=clock)
+    client = SpotifyClient(
+        SimpleNamespace(),  # type: ignore[arg-type]
+        client=_Spotipy(),
+        rate_limit_seconds=0,
+        cache=cache,
+    )
+
+    # A remembered 404 raises just like the upstream one did.
+    for _ in range(2):
+        with pytest.raises(SpotifyException) as excinfo:
+            client.get_artist("missing")
+        assert excinfo.value.http_status == 404
+    assert client.get_artist("a1") == {"id": "a1", "name": "Artist"}
+    assert client.get_artist("a1") == {"id": "a1", "name": "Artist"}
+    assert lookups == ["missing", "a1"]
+
+    clock.now += 60
+    with pytest.raises(SpotifyException):
+        client.get_artist("missing")
+    assert lookups == ["missing", "a1", "missing"]
+    cache.close()
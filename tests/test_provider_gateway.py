@@ -0,0 +1,336 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.config import ProviderResilienceConfig
+from app.integrations.contracts import (
+    ProviderArtist,
+    ProviderDependencyError,
+    ProviderInternalError,
+    ProviderNotFoundError,
+    ProviderTrack,
+    SearchQuery,
+)
+from app.integrations.health import IntegrationHealth, ProviderHealthMonitor
+from app.integrations.provider_gateway import (
+    ProviderGateway,
+    ProviderGatewayCircuitOpenError,
+    ProviderGatewayConfig,
+    ProviderGatewayError,
+    ProviderGatewayNotFoundError,
+    ProviderGatewayQueueTimeoutError,
+    ProviderRetryPolicy,
+)
+
+
+class _SlowProvider:
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.calls: list[object] = []
+
+    async def fetch_artist(
+        self, *, artist_id: str | None = None, name: str | None = None
+    ) -> ProviderArtist | None:
+        self.calls.append(("artist", name))
+        await asyncio.sleep(0.05)
+        return ProviderArtist(source=self.name, name=name or "", source_id=artist_id)
+
+    async def fetch_album(self, album_source_id: str) -> None:
+        self.calls.append(("album", album_source_id))
+        await asyncio.sleep(0.05)
+        raise ProviderNotFoundError(self.name, "missing", status_code=404)
+
+
+def _gateway(provider: _SlowProvider) -> ProviderGateway:
+    policy = ProviderRetryPolicy(timeout_ms=1000, retry_max=0, backoff_base_ms=1, jitter_pct=0)
+    config = ProviderGatewayConfig(max_concurrency=4, default_policy=policy, provider_policies={})
+    return ProviderGateway(providers={"fake": provider}, config=config)
+
+
+def test_identical_concurrent_calls_share_one_upstream_request() -> None:
+    provider = _SlowProvider()
+    gateway = _gateway(provider)
+
+    async def _run() -> list[ProviderArtist | None]:
+        first = asyncio.create_task(gateway.fetch_artist("fake", name="Daft  Punk"))
+        await asyncio.sleep(0)
+        others = [gateway.fetch_artist("FAKE", name="daft punk") for _ in range(2)]
+        first.cancel()
+        results = await asyncio.gather(*others)
+        different = await gateway.fetch_artist("fake", name="Justice")
+        return [*results, different]
+
+    shared, again, different = asyncio.run(_run())
+
+    assert shared == again and shared is not again
+    assert different is not None and different.name == "Justice"
+    assert provider.calls == [("artist", "Daft  Punk"), ("artist", "Justice")]
+    assert gateway.coalesced_counts == {"fake": 2}
+
+
+def test_coalesced_callers_receive_the_same_failure() -> None:
+    provider = _SlowProvider()
+    gateway = _gateway(provider)
+
+    async def _run() -> list[object]:
+        return await asyncio.gather(
+            gateway.fetch_album("fake", "album-1"),
+            gateway.fetch_album("fake", "album-1"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_run())
+
+    assert all(isinstance(result, ProviderGatewayNotFoundError) for result in results)
+    assert provider.calls == [("album", "album-1")]
+    with pytest.raises(ProviderGatewayNotFoundError):
+        asyncio.run(gateway.fetch_album("fake", "album-1"))
+
+
+class _FlakyProvider:
+    def __init__(self, name: str, *, failing: bool) -> None:
+        self.name = name
+        self.failing = failing
+        self.calls = 0
+
+    async def fetch_album(self, album_source_id: str) -> None:
+        self.calls += 1
+        if self.failing:
+            raise ProviderDependencyError(self.name, "down", status_code=503)
+        return None
+
+    async def check_health(self) -> dict[str, str]:
+        return {"status": "ok"}
+
+
+def _resilient_gateway(
+    *providers: Any, hedge_searches: bool = False, hedge_budget_pct: float = 0.0
+) -> ProviderGateway:
+    policy = ProviderRetryPolicy(timeout_ms=1000, retry_max=3, backoff_base_ms=1, jitter_pct=0)
+    config = ProviderGatewayConfig(
+        max_concurrency=8,
+        default_policy=policy,
+        provider_policies={},
+        resilience=ProviderResilienceConfig(
+            adaptive_concurrency=True,
+            min_concurrency=1,
+            breaker_failure_threshold=3,
+            breaker_reset_ms=100,
+            breaker_half_open_probes=1,
+            hedge_searches=hedge_searches,
+            hedge_budget_pct=hedge_budget_pct,
+        ),
+    )
+    return ProviderGateway(
+        providers={provider.name: provider for provider in providers}, config=config
+    )
+
+
+def test_circuit_breaker_fails_fast_and_recovers_through_a_probe() -> None:
+    slskd = _FlakyProvider("slskd", failing=True)
+    spotify = _FlakyProvider("spotify", failing=False)
+    gateway = _resilient_gateway(slskd, spotify)
+
+    async def _run() -> None:
+        # Retries stop as soon as the breaker opens on the third failure.
+        with pytest.raises(ProviderGatewayCircuitOpenError):
+            await gateway.fetch_album("slskd", "a1")
+        assert slskd.calls == 3
+        with pytest.raises(ProviderGatewayCircuitOpenError):
+            await gateway.fetch_album("slskd", "a2")
+        assert slskd.calls == 3
+        await gateway.fetch_album("spotify", "a1")
+
+        state = gateway.resilience_snapshot()
+        assert state["slskd"]["circuit"]["state"] == "open"
+        assert state["slskd"]["concurrency_limit"] == 1
+        assert state["spotify"]["circuit"]["state"] == "closed"
+        assert state["spotify"]["concurrency_limit"] == 8
+
+        await asyncio.sleep(0.15)
+        assert gateway.resilience_snapshot()["slskd"]["circuit"]["state"] == "half_open"
+        slskd.failing = False
+        assert await gateway.fetch_album("slskd", "a3") is None
+        assert gateway.resilience_snapshot()["slskd"]["circuit"]["state"] == "closed"
+
+    asyncio.run(_run())
+
+
+class _GarbageProvider:
+    name = "slskd"
+
+    def __init__(self) -> None:
+        self.error: Exception = ProviderNotFoundError(self.name, "missing", status_code=404)
+
+    async def fetch_album(self, album_source_id: str) -> None:
+        raise self.error
+
+
+def test_garbage_responses_open_the_breaker_but_not_found_does_not() -> None:
+    provider = _GarbageProvider()
+    gateway = _resilient_gateway(provider)
+
+    async def _run() -> list[str]:
+        states: list[str] = []
+        for index in range(3):
+            with pytest.raises(ProviderGatewayNotFoundError):
+                await gateway.fetch_album("slskd", f"missing-{index}")
+        states.append(gateway.resilience_snapshot()["slskd"]["circuit"]["state"])
+        provider.error = ProviderInternalError(provider.name, "invalid JSON")
+        for index in range(3):
+            with pytest.raises(ProviderGatewayError):
+                await gateway.fetch_album("slskd", f"garbage-{index}")
+        states.append(gateway.resilience_snapshot()["slskd"]["circuit"]["state"])
+        return states
+
+    assert asyncio.run(_run()) == ["closed", "open"]
+
+
+def test_health_monitor_reports_open_breaker_as_down() -> None:
+    slskd = _FlakyProvider("slskd", failing=True)
+    spotify = _FlakyProvider("spotify", failing=False)
+    gateway = _resilient_gateway(slskd, spotify)
+    registry = SimpleNamespace(track_providers=lambda: {"slskd": slskd, "spotify": spotify})
+    monitor = ProviderHealthMonitor(
+        registry,  # type: ignore[arg-type]
+        resilience=gateway.resilience_snapshot,
+    )
+
+    async def _run() -> IntegrationHealth:
+        with pytest.raises(ProviderGatewayCircuitOpenError):
+            await gateway.fetch_album("slskd", "a1")
+        await gateway.fetch_album("spotify", "a1")
+        return await monitor.check_all()
+
+    health = asyncio.run(_run())
+
+    reports = {report.provider: report for report in health.providers}
+    assert health.overall == "down"
+    assert reports["slskd"].status == "down"
+    assert reports["slskd"].details["circuit"]["state"] == "open"
+    assert reports["spotify"].status == "ok"
+
+
+class _StallingSearchProvider:
+    name = "slskd"
+
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+        self.cancelled = 0
+        self.calls = 0
+
+    async def search_tracks(self, query: SearchQuery) -> list[ProviderTrack]:
+        self.calls += 1
+        delay = self.delays.pop(0) if self.delays else 0.002
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return [ProviderTrack(name=query.text, provider=self.name)]
+
+
+def test_slow_search_is_hedged_once_it_exceeds_the_observed_p95() -> None:
+    provider = _StallingSearchProvider()
+    gateway = _resilient_gateway(provider, hedge_searches=True, hedge_budget_pct=100.0)
+
+    def _query(text: str) -> SearchQuery:
+        return SearchQuery(text=text, artist=None, limit=5)
+
+    async def _run() -> None:
+        for index in range(20):
+            await gateway.search_many(["slskd"], _query(f"warm {index}"))
+        assert gateway.resilience_snapshot()["slskd"]["p95_ms"] is not None
+
+        # The first copy stalls; the hedge fired after the p95 answers instead.
+        provider.delays = [5.0, 0.002]
+        started = asyncio.get_running_loop().time()
+        response = await asyncio.wait_for(
+            gateway.search_many(["slskd"], _query("stalled")), timeout=1.0
+        )
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert [track.name for track in response.tracks] == ["stalled"]
+        await asyncio.sleep(0)
+        assert provider.cancelled == 1
+
+        # Single-provider lookups are never hedged.
+        provider.delays = [0.1]
+        assert await gateway.search_tracks("slskd", _query("direct"))
+        assert provider.delays == [] and provider.cancelled == 1
+
+    asyncio.run(_run())
+
+
+def test_hedging_ignores_time_spent_waiting_for_a_limiter_slot() -> None:
+    provider = _StallingSearchProvider()
+    gateway = _resilient_gateway(provider, hedge_searches=True, hedge_budget_pct=100.0)
+
+    def _query(text: str) -> SearchQuery:
+        return SearchQuery(text=text, artist=None, limit=5)
+
+    async def _run() -> None:
+        for index in range(20):
+            await gateway.search_many(["slskd"], _query(f"warm {index}"))
+        limiter = gateway._controls["slskd"].limiter
+        for _ in range(limiter.limit):
+            await limiter.acquire()
+
+        # Queued well past the p95 behind a saturated limiter: not hedged.
+        provider.calls = 0
+        provider.delays = [0.0]
+        queued = asyncio.create_task(gateway.search_many(["slskd"], _query("queued")))
+        await asyncio.sleep(0.1)
+        limiter.release()
+        assert (await queued).tracks
+        assert provider.calls == 1
+
+        # Slow while holding the last free slot: a hedge could only queue.
+        while limiter.in_flight < limiter.limit - 1:
+            await limiter.acquire()
+        provider.delays = [0.1]
+        assert (await gateway.search_many(["slskd"], _query("busy"))).tracks
+        assert provider.calls == 2 and provider.cancelled == 0
+        while limiter.in_flight:
+            limiter.release()
+
+    asyncio.run(_run())
+
+
+def test_waiting_for_a_limiter_slot_does_not_count_against_the_provider() -> None:
+    provider = _StallingSearchProvider()
+    policy = ProviderRetryPolicy(timeout_ms=50, retry_max=1, backoff_base_ms=1, jitter_pct=0)
+    config = ProviderGatewayConfig(
+        max_concurrency=2,
+        default_policy=policy,
+        provider_policies={},
+        resilience=ProviderResilienceConfig(
+            adaptive_concurrency=True,
+            min_concurrency=1,
+            breaker_failure_threshold=1,
+            breaker_reset_ms=1_000,
+            breaker_half_open_probes=1,
+            hedge_searches=False,
+            hedge_budget_pct=0.0,
+        ),
+    )
+    gateway = ProviderGateway(providers={"slskd": provider}, config=config)
+    query = SearchQuery(text="queued", artist=None, limit=5)
+
+    async def _run() -> None:
+        assert await gateway.search_tracks("slskd", query)
+        control = gateway._controls["slskd"]
+        held = control.limiter.limit
+        for _ in range(held):
+            await control.limiter.acquire()
+        with pytest.raises(ProviderGatewayQueueTimeoutError):
+            await gateway.search_tracks("slskd", query)
+        assert control.breaker.state == "closed"
+        assert control.limiter.limit == held
+        for _ in range(held):
+            control.limiter.release()
+
+    asyncio.run(_run())
+    assert provider.calls == 1
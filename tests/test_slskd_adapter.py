@@ -1,6 +1,18 @@
+import asyncio
+from collections.abc import AsyncIterator
+import json
+
+import httpx
 import pytest
 
-from app.integrations.slskd_adapter import SlskdAdapter
+from app.integrations.contracts import SearchQuery
+from app.integrations.slskd_adapter import (
+    SlskdAdapter,
+    _build_candidate,
+    _candidate_sort_key,
+    _iter_files,
+    _SearchPayloadStream,
+)
 
 
 def _base_kwargs() -> dict[str, object]:
@@ -37,3 +49,80 @@ def test_slskd_adapter_invalid_base_url_raises(base_url: str) -> None:
             preferred_formats=("MP3",),
             max_results=5,
         )
+
+
+def _search_body(peers: int) -> bytes:
+    formats = ("mp3", "flac", "ogg")
+    results = [
+        {
+            "username": f"peer{index}",
+            "files": [
+                {
+                    "filename": f'Artist\\Song "{index}-{slot}".{formats[(index + slot) % 3]}',
+                    "bitrate": 128 + (index * 7 + slot) % 200,
+                    "size": 1_000 + index,
+                    "seeders": (index * 3 + slot) % 11,
+                }
+                for slot in range(3)
+            ],
+        }
+        for index in range(peers)
+    ]
+    return json.dumps({"search": "ünïcode ☃", "results": results, "state": "done"}).encode()
+
+
+def test_search_payload_stream_matches_full_decode_for_any_chunking() -> None:
+    body = _search_body(25).decode()
+    expected = json.loads(body)["results"]
+
+    for size in (1, 7, 64, len(body)):
+        stream = _SearchPayloadStream()
+        entries: list[object] = []
+        for start in range(0, len(body), size):
+            entries.extend(stream.feed(body[start : start + size]))
+        entries.extend(stream.close())
+        assert entries == expected
+
+    fallback = _SearchPayloadStream()
+    assert fallback.feed('{"username": "peer", "files": [') == []
+    assert fallback.feed('{"filename": "a.flac"}]}') == []
+    assert fallback.close() == [{"username": "peer", "files": [{"filename": "a.flac"}]}]
+
+    truncated = _SearchPayloadStream()
+    truncated.feed(body[: len(body) // 2])
+    with pytest.raises(ValueError):
+        truncated.close()
+
+
+def test_search_tracks_streams_body_and_keeps_sorted_top_results() -> None:
+    body = _search_body(400)
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), 4_096):
+            yield body[start : start + 4_096]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"Content-Type": "application/json"}, content=_chunks()
+        )
+
+    adapter = SlskdAdapter(
+        api_key="token",
+        client=httpx.AsyncClient(
+            base_url="https://example.com", transport=httpx.MockTransport(_handler)
+        ),
+        **_base_kwargs(),
+    )
+
+    tracks = asyncio.run(adapter.search_tracks(SearchQuery(text="song", artist=None, limit=10)))
+
+    candidates = [
+        _build_candidate(entry) for entry in _iter_files(json.loads(body.decode()))
+    ]
+    expected = sorted(
+        candidates,
+        key=lambda candidate: _candidate_sort_key(candidate, adapter._format_ranking),
+    )[:10]
+    assert [track.candidates[0].download_uri for track in tracks] == [
+        candidate.download_uri for candidate in expected
+    ]
@@ -0,0 +1,187 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.integrations.slskd_client import (
+    SlskdClientError,
+    SlskdDownloadEvent,
+    SlskdDownloadStatus,
+    SlskdHttpClient,
+    SlskdTransferHub,
+)
+
+
+def test_client_reuses_one_connection_pool_until_closed() -> None:
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"state": "completed", "path": "/downloads/a.flac"})
+
+    client = SlskdHttpClient(
+        base_url="http://slskd.local/",
+        api_key="secret",
+        transport=httpx.MockTransport(_handler),
+    )
+
+    async def _run() -> list[SlskdDownloadStatus]:
+        statuses = []
+        for key in ("first", "second"):
+            async for event in client.stream_download_events(key):
+                statuses.append(event.status)
+        shared = client._client
+        await client.search_tracks("query", limit=5, timeout_ms=1000)
+        assert client._client is shared
+        await client.aclose()
+        assert shared is not None and shared.is_closed
+        assert client._client is None
+        return statuses
+
+    statuses = asyncio.run(_run())
+
+    assert statuses == [SlskdDownloadStatus.COMPLETED, SlskdDownloadStatus.COMPLETED]
+    assert [request.headers.get("Idempotency-Key") for request in seen] == [
+        "first",
+        "second",
+        None,
+    ]
+    assert all(request.headers["X-API-Key"] == "secret" for request in seen)
+    assert seen[0].url.path == "/api/v0/transfers/downloads/first"
+
+
+def test_transfer_hub_polls_the_bulk_endpoint_for_all_subscribers() -> None:
+    polls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        polls.append(request.url.path)
+        if request.url.path != "/api/v0/transfers/downloads":
+            return httpx.Response(200, json={"state": "queued"})
+        bulk = polls.count("/api/v0/transfers/downloads")
+        state = "in_progress" if bulk == 1 else "completed"
+        entries = [
+            {"id": key, "state": state, "path": f"/downloads/{key}.flac", "bytes": bulk}
+            for key in ("first", "second")
+        ]
+        if bulk > 1:
+            entries.append({"idempotency_key": "late", "id": "9", "state": "failed"})
+        return httpx.Response(200, json={"downloads": entries})
+
+    client = SlskdHttpClient(base_url="http://slskd.local", transport=httpx.MockTransport(_handler))
+    hub = SlskdTransferHub(client, poll_interval=0.25)
+
+    async def _collect(key: str) -> list[SlskdDownloadStatus]:
+        return [event.status async for event in hub.subscribe(key)]
+
+    async def _run() -> list[list[SlskdDownloadStatus]]:
+        results = await asyncio.gather(*(_collect(key) for key in ("first", "second", "late")))
+        await hub.aclose()
+        await client.aclose()
+        return list(results)
+
+    first, second, late = asyncio.run(_run())
+
+    done = [
+        SlskdDownloadStatus.ACCEPTED,
+        SlskdDownloadStatus.IN_PROGRESS,
+        SlskdDownloadStatus.COMPLETED,
+    ]
+    assert first == done and second == done
+    assert late == [SlskdDownloadStatus.ACCEPTED, SlskdDownloadStatus.FAILED]
+    assert polls == [
+        "/api/v0/transfers/downloads/first",
+        "/api/v0/transfers/downloads/second",
+        "/api/v0/transfers/downloads/late",
+        "/api/v0/transfers/downloads",
+        "/api/v0/transfers/downloads/late",
+        "/api/v0/transfers/downloads",
+    ]
+    assert hub.subscriber_count == 0
+
+
+def _event(key: str, status: SlskdDownloadStatus) -> SlskdDownloadEvent:
+    return SlskdDownloadEvent(download_id=key, status=status, payload={}, retryable=False)
+
+
+class _StubTransfers:
+    status_poll_interval = 60.0
+
+    def __init__(self) -> None:
+        self.listed: dict[str, SlskdDownloadEvent] = {}
+        self.list_failures = 0
+        self.lookup_delay = 0.0
+
+    async def list_download_events(self) -> dict[str, SlskdDownloadEvent]:
+        if self.list_failures:
+            self.list_failures -= 1
+            raise SlskdClientError("bulk endpoint unavailable", retryable=True)
+        return dict(self.listed)
+
+    async def get_download_event(self, key: str) -> SlskdDownloadEvent:
+        await asyncio.sleep(self.lookup_delay)
+        return self.listed.get(key) or _event(key, SlskdDownloadStatus.ACCEPTED)
+
+
+def test_transfer_hub_rides_out_transient_bulk_poll_failures() -> None:
+    transfers = _StubTransfers()
+    hub = SlskdTransferHub(
+        transfers, poll_interval=0.25, max_poll_failures=3  # type: ignore[arg-type]
+    )
+
+    async def _run() -> list[SlskdDownloadStatus]:
+        transfers.list_failures = 2
+        transfers.listed["a"] = _event("a", SlskdDownloadStatus.COMPLETED)
+        statuses = [event.status async for event in hub.subscribe("a")]
+        await hub.aclose()
+        return statuses
+
+    # Two failed polls are skipped; the third delivers the completion.
+    assert asyncio.run(_run()) == [SlskdDownloadStatus.COMPLETED]
+
+    transfers = _StubTransfers()
+    hub = SlskdTransferHub(
+        transfers, poll_interval=0.25, max_poll_failures=2  # type: ignore[arg-type]
+    )
+
+    async def _fail() -> None:
+        transfers.list_failures = 5
+        async for _event_item in hub.subscribe("b"):
+            pass
+
+    with pytest.raises(SlskdClientError):
+        asyncio.run(_fail())
+    assert transfers.list_failures == 3
+    assert hub.subscriber_count == 0
+
+
+def test_transfer_hub_keeps_snapshot_of_keys_subscribed_during_a_poll() -> None:
+    transfers = _StubTransfers()
+    hub = SlskdTransferHub(transfers)  # type: ignore[arg-type]
+    received: dict[str, list[SlskdDownloadStatus]] = {"a": [], "c": []}
+
+    async def _follow(key: str) -> None:
+        async for event in hub.subscribe(key):
+            received[key].append(event.status)
+
+    async def _run() -> None:
+        follower_a = asyncio.create_task(_follow("a"))
+        await asyncio.sleep(0)
+        # "a" is missing from the bulk view, so the poll looks it up slowly.
+        transfers.lookup_delay = 0.05
+        poll = asyncio.create_task(hub.poll_once())
+        await asyncio.sleep(0.01)
+        transfers.lookup_delay = 0.0
+        follower_c = asyncio.create_task(_follow("c"))
+        await poll
+        transfers.listed["c"] = _event("c", SlskdDownloadStatus.ACCEPTED)
+        await hub.poll_once()
+        transfers.listed["a"] = _event("a", SlskdDownloadStatus.COMPLETED)
+        transfers.listed["c"] = _event("c", SlskdDownloadStatus.COMPLETED)
+        await hub.poll_once()
+        await asyncio.gather(follower_a, follower_c)
+        await hub.aclose()
+
+    asyncio.run(_run())
+
+    assert received["c"] == [SlskdDownloadStatus.ACCEPTED, SlskdDownloadStatus.COMPLETED]
+    assert received["a"] == [SlskdDownloadStatus.ACCEPTED, SlskdDownloadStatus.COMPLETED]
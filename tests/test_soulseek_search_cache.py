@@ -0,0 +1,126 @@
+import asyncio
+from typing import Any
+
+from app.config import SoulseekConfig
+from app.core.soulseek_client import SoulseekClient
+from app.core.provider_cache import ProviderCache
+from app.core.soulseek_search_cache import SEARCH_OPERATION, build_search_cache
+from app.utils.metrics import get_registry
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _lookups(result: str) -> float:
+    for family in get_registry().collect():
+        for sample in family.samples:
+            if (
+                sample.name == "provider_cache_lookups_total"
+                and sample.labels.get("operation") == SEARCH_OPERATION
+                and sample.labels.get("result") == result
+            ):
+                return sample.value
+    return 0.0
+
+
+def _client(cache: ProviderCache) -> tuple[SoulseekClient, list[dict[str, Any]]]:
+    config = SoulseekConfig(
+        base_url="http://slskd.test",
+        api_key=None,
+        timeout_ms=1_000,
+        retry_max=0,
+        retry_backoff_base_ms=10,
+        retry_jitter_pct=0.0,
+        preferred_formats=("FLAC", "MP3"),
+        max_results=50,
+        search_cache_ttl_seconds=0.0,
+        search_cache_stale_seconds=0.0,
+        search_cache_max_items=1,
+    )
+    client = SoulseekClient(config, search_cache=cache)
+    sent: list[dict[str, Any]] = []
+
+    async def _request(method: str, path: str, **kwargs: Any) -> Any:
+        sent.append(kwargs["json"])
+        return {"results": [{"username": "peer", "call": len(sent)}]}
+
+    client._request = _request  # type: ignore[method-assign]
+    return client, sent
+
+
+def test_equivalent_queries_share_a_cached_search_until_ttl() -> None:
+    clock = _Clock()
+    cache = build_search_cache(ttl_seconds=60, stale_seconds=120, max_items=8, clock=clock)
+    client, sent = _client(cache)
+    before = {result: _lookups(result) for result in ("hit", "stale", "miss")}
+
+    async def _run() -> list[Any]:
+        first = await client.search("Daft  Punk - One More Time")
+        second = await client.search("daft punk - one more time")
+        lossy = await client.search("daft punk - one more time", min_bitrate=320)
+        clock.now += 90
+        strict = await client.search("Daft Punk - One More Time")
+        clock.now += 30
+        stale = await client.search("Daft Punk - One More Time", min_bitrate=320, allow_stale=True)
+        await asyncio.sleep(0)
+        return [first, second, lossy, strict, stale]
+
+    first, second, lossy, strict, stale = asyncio.run(_run())
+
+    assert first == second
+    assert lossy["results"][0]["call"] == 2
+    # Expired entries are only served to callers that opt into staleness.
+    assert strict["results"][0]["call"] == 3
+    assert stale == lossy
+    assert len(sent) == 4  # the stale hit refreshed in the background
+    counts = {result: _lookups(result) - before[result] for result in before}
+    assert counts == {"hit": 1, "stale": 1, "miss": 3}
+
+
+def test_cache_evicts_least_recently_used_searches() -> None:
+    cache = build_search_cache(ttl_seconds=60, max_items=2)
+    client, sent = _client(cache)
+
+    async def _run() -> None:
+        for query in ("a", "b", "a", "c", "a", "b"):
+            await client.search(query)
+
+    asyncio.run(_run())
+
+    # "b" was the least recently used entry when "c" arrived.
+    assert [payload["searchText"] for payload in sent] == ["a", "b", "c", "b"]
+
+
+def test_cache_stays_within_its_byte_budget() -> None:
+    cache = build_search_cache(ttl_seconds=60, max_items=8, max_bytes=200, max_entry_bytes=120)
+    client, sent = _client(cache)
+    bodies = {"small": 10, "large": 500, "medium": 60}
+
+    async def _request(method: str, path: str, **kwargs: Any) -> Any:
+        sent.append(kwargs["json"])
+        query = kwargs["json"]["searchText"]
+        return {"results": [{"username": "x" * bodies[query.split("-")[0]]}]}
+
+    client._request = _request  # type: ignore[method-assign]
+
+    async def _run() -> None:
+        for query in ("large", "large", "small", "medium-1", "medium-2", "small", "medium-2"):
+            await client.search(query)
+
+    asyncio.run(_run())
+
+    # Oversized responses are never cached; two medium entries push the
+    # least recently used small one out of the budget.
+    assert [payload["searchText"] for payload in sent] == [
+        "large",
+        "large",
+        "small",
+        "medium-1",
+        "medium-2",
+        "small",
+    ]
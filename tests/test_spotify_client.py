@@ -0,0 +1,138 @@
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+from app.core.provider_cache import ProviderCache
+from app.core.spotify_client import SpotifyClient
+
+
+class _DiscographySpotipy:
+    def __init__(self, album_count: int, long_album_tracks: int) -> None:
+        self._album_ids = [f"al{index}" for index in range(album_count)]
+        self._long_album_tracks = long_album_tracks
+        self.calls: list[tuple[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _record(self, name: str, arg: Any) -> None:
+        with self._lock:
+            self.calls.append((name, arg))
+
+    def _track_total(self, album_id: str) -> int:
+        return self._long_album_tracks if album_id == "al0" else 3
+
+    def _tracks_page(self, album_id: str, offset: int, limit: int) -> dict[str, Any]:
+        total = self._track_total(album_id)
+        end = min(total, offset + limit)
+        return {
+            "items": [{"id": f"{album_id}-t{index}"} for index in range(offset, end)],
+            "total": total,
+            "limit": limit,
+            "next": "more" if end < total else None,
+        }
+
+    def artist_albums(
+        self, artist_id: str, *, album_type: str, limit: int, offset: int
+    ) -> dict[str, Any]:
+        self._record("artist_albums", offset)
+        page = self._album_ids[offset : offset + limit]
+        return {"items": [{"id": album_id} for album_id in page], "total": len(self._album_ids)}
+
+    def albums(self, album_ids: list[str]) -> dict[str, Any]:
+        self._record("albums", len(album_ids))
+        return {
+            "albums": [
+                {"id": album_id, "tracks": self._tracks_page(album_id, 0, 50)}
+                for album_id in album_ids
+            ]
+        }
+
+    def album_tracks(self, album_id: str, *, limit: int, offset: int) -> dict[str, Any]:
+        self._record("album_tracks", (album_id, offset))
+        return self._tracks_page(album_id, offset, limit)
+
+
+def test_discography_batches_album_lookups_and_pages_only_long_albums() -> None:
+    spotipy = _DiscographySpotipy(album_count=65, long_album_tracks=120)
+    client = SpotifyClient(
+        SimpleNamespace(),  # type: ignore[arg-type]
+        client=spotipy,
+        rate_limit_seconds=0,
+    )
+
+    result = client.get_artist_discography("artist-1")
+
+    albums = result["albums"]
+    assert [entry["album"]["id"] for entry in albums] == [f"al{index}" for index in range(65)]
+    assert [track["id"] for track in albums[0]["tracks"]] == [
+        f"al0-t{index}" for index in range(120)
+    ]
+    assert all(len(entry["tracks"]) == 3 for entry in albums[1:])
+    assert sorted(spotipy.calls, key=repr) == sorted(
+        [
+            ("artist_albums", 0),
+            ("artist_albums", 50),
+            ("albums", 20),
+            ("albums", 20),
+            ("albums", 20),
+            ("albums", 5),
+            ("album_tracks", ("al0", 50)),
+            ("album_tracks", ("al0", 100)),
+        ],
+        key=repr,
+    )
+
+
+def test_playlist_pages_are_cached_per_snapshot() -> None:
+    calls: list[tuple[str, int]] = []
+
+    class _Spotipy:
+        snapshot = "s1"
+
+        def playlist(self, playlist_id: str, *, fields: str) -> dict[str, Any]:
+            return {"snapshot_id": self.snapshot}
+
+        def playlist_items(self, playlist_id: str, *, limit: int, offset: int) -> dict[str, Any]:
+            calls.append((self.snapshot, offset))
+            return {"items": [{"track": {"id": f"{self.snapshot}-{offset}"}}], "total": 1}
+
+    spotipy = _Spotipy()
+    cache = ProviderCache()
+    client = SpotifyClient(
+        SimpleNamespace(),  # type: ignore[arg-type]
+        client=spotipy,
+        rate_limit_seconds=0,
+        cache=cache,
+    )
+
+    def _read() -> str:
+        snapshot_id = client.get_playlist_snapshot_id("p1")
+        page = client.get_playlist_items("p1", limit=100, snapshot_id=snapshot_id)
+        return page["items"][0]["track"]["id"]
+
+    assert [_read(), _read()] == ["s1-0", "s1-0"]
+    spotipy.snapshot = "s2"
+    assert _read() == "s2-0"
+    assert calls == [("s1", 0), ("s2", 0)]
+    cache.close()
+
+
+def test_paging_a_playlist_looks_up_the_snapshot_once() -> None:
+    snapshot_calls: list[str] = []
+
+    class _Spotipy:
+        def playlist(self, playlist_id: str, *, fields: str) -> dict[str, Any]:
+            snapshot_calls.append(playlist_id)
+            return {"snapshot_id": "s1"}
+
+    client = SpotifyClient(
+        SimpleNamespace(),  # type: ignore[arg-type]
+        client=_Spotipy(),
+        rate_limit_seconds=0,
+    )
+
+    for _ in range(3):
+        assert client.get_playlist_snapshot_id("p1", max_age=30.0) == "s1"
+    assert snapshot_calls == ["p1"]
+
+    assert client.get_playlist_snapshot_id("p1") == "s1"
+    assert snapshot_calls == ["p1", "p1"]
@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+import httpx
+
+from app.core.provider_cache import ProviderCache
+from app.integrations.contracts import ProviderNotFoundError
+from app.integrations.spotify_adapter import SpotifyAdapter
+from app.integrations.spotify_http import SpotifyHttpClient
+from app.utils.concurrency import AsyncTokenBucket
+
+
+def test_rate_limited_request_waits_for_retry_after_and_refreshes_token() -> None:
+    seen: list[tuple[str, str]] = []
+    tokens = iter(["stale-token", "fresh-token"])
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["Authorization"]))
+        if len(seen) == 1:
+            return httpx.Response(401)
+        if len(seen) == 2:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, json={"id": "a1", "name": "Artist"})
+
+    client = SpotifyHttpClient(
+        token_provider=lambda: next(tokens),
+        transport=httpx.MockTransport(_handler),
+        rate_per_second=100,
+        burst=5,
+    )
+
+    async def _run() -> tuple[object, float]:
+        started = time.monotonic()
+        try:
+            return await client.artist("a1"), time.monotonic() - started
+        finally:
+            await client.aclose()
+
+    payload, elapsed = asyncio.run(_run())
+
+    assert payload == {"id": "a1", "name": "Artist"}
+    assert [auth for _, auth in seen] == [
+        "Bearer stale-token",
+        "Bearer fresh-token",
+        "Bearer fresh-token",
+    ]
+    assert elapsed >= 0.2
+
+
+def test_token_bucket_spaces_requests_after_the_burst() -> None:
+    async def _run() -> float:
+        bucket = AsyncTokenBucket(rate=50, capacity=2)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(7)))
+        return time.monotonic() - started
+
+    # Two tokens are available immediately, the other five refill at 50/s.
+    assert asyncio.run(_run()) >= 0.09
+
+
+def test_adapter_uses_cached_album_and_maps_missing_album() -> None:
+    paths: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/v1/albums/missing":
+            return httpx.Response(404, json={"error": {"status": 404}})
+        if request.url.path.endswith("/tracks"):
+            return httpx.Response(
+                200,
+                json={"items": [{"id": "t1", "name": "Track", "artists": []}], "next": None},
+            )
+        return httpx.Response(
+            200,
+            json={"id": "al1", "name": "Album", "artists": [{"name": "Artist"}]},
+        )
+
+    cache = ProviderCache()
+    client = SpotifyHttpClient(
+        token_provider=lambda: "token",
+        transport=httpx.MockTransport(_handler),
+        cache=cache,
+        rate_per_second=100,
+    )
+    adapter = SpotifyAdapter(client=client)
+
+    async def _run() -> list[object]:
+        results: list[object] = []
+        for album_id in ("al1", "al1", "missing", "missing"):
+            try:
+                results.append(await adapter.fetch_album(album_id))
+            except ProviderNotFoundError as exc:
+                results.append(exc)
+        await adapter.aclose()
+        return results
+
+    first, second, missing, missing_again = asyncio.run(_run())
+
+    assert first == second
+    assert isinstance(missing, ProviderNotFoundError)
+    assert isinstance(missing_again, ProviderNotFoundError)
+    assert paths == ["/v1/albums/al1", "/v1/albums/al1/tracks", "/v1/albums/missing"]
+    cache.close()
+
+
+def test_top_tracks_default_to_the_us_market() -> None:
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"tracks": []})
+
+    client = SpotifyHttpClient(
+        token_provider=lambda: "token",
+        transport=httpx.MockTransport(_handler),
+        rate_per_second=100,
+        burst=5,
+    )
+
+    async def _run() -> None:
+        try:
+            await client.artist_top_tracks("a1")
+            await client.artist_top_tracks("a1", market="DE")
+        finally:
+            await client.aclose()
+
+    asyncio.run(_run())
+
+    assert [dict(request.url.params) for request in seen] == [{"market": "US"}, {"market": "DE"}]